@@ -11,11 +11,30 @@ try:
 except ImportError:
     pass  # pillow-heif not installed, HEIF/HEIC support will be unavailable
 
-# Export main components for convenience
-from .ui import MainWindow
-from .services import ExifToolService, ExifToolError
-from .models import ImageModel
-from .core import Config
+# Export main components for convenience, imported lazily (PEP 562) so that
+# importing the package does not pull in Qt and the services up front
+_LAZY_EXPORTS = {
+    'MainWindow': '.ui',
+    'ExifToolService': '.services',
+    'ExifToolError': '.services',
+    'ImageModel': '.models',
+    'Config': '.core',
+}
+
+
+def __getattr__(name):
+    """Import exported components on first access"""
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     'MainWindow',
@@ -1,13 +1,21 @@
 """Core utilities for GeoSetter Lite"""
 
 from .config import Config
-from .utils import format_date, format_file_size, format_gps_coordinates, parse_gps_dms, truncate_string
+from .utils import (
+    format_date, format_exif_date, format_exif_datetime, format_exif_time,
+    format_file_size, format_gps_coordinates,
+    parse_gps_dms, parse_tz_offset, truncate_string
+)
 
 __all__ = [
     'Config',
     'format_date',
+    'format_exif_date',
+    'format_exif_datetime',
+    'format_exif_time',
     'format_file_size',
     'format_gps_coordinates',
     'parse_gps_dms',
+    'parse_tz_offset',
     'truncate_string',
 ]
@@ -2,7 +2,13 @@
 
 import yaml
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# Prefer the libyaml C extension when available
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 
 class Config:
@@ -17,6 +23,7 @@ class Config:
             'last_directory': str(Path.home()),
             'exiftool_create_backups': True,
             'auto_rotate_images': False,
+            'preview_resample': 'bilinear',  # Viewer downscaling filter: nearest, bilinear, bicubic or lanczos
             'preserve_map_zoom': True,
             'default_map_zoom': 10,
             'rename_pattern': '',
@@ -26,17 +33,29 @@ class Config:
     CONFIG_DIR = Path.home() / '.geosetter_lite'
     CONFIG_FILE = CONFIG_DIR / 'config.yaml'
     
+    # Last parsed configuration and the file modification time it was read at
+    _cached_config: Optional[Dict[str, Any]] = None
+    _cached_mtime_ns: Optional[int] = None
+    
     @classmethod
     def load(cls) -> Dict[str, Any]:
-        """Load configuration from YAML file or return defaults"""
+        """Load configuration from YAML file or return defaults
+        
+        The file is only parsed again when its modification time changes.
+        """
         try:
-            if cls.CONFIG_FILE.exists():
-                with open(cls.CONFIG_FILE, 'r') as f:
-                    config = yaml.safe_load(f)
-                    # Merge with defaults to ensure all keys exist
-                    return cls._merge_with_defaults(config)
-            else:
+            try:
+                mtime_ns = cls.CONFIG_FILE.stat().st_mtime_ns
+            except FileNotFoundError:
                 return cls.get_default()
+            
+            if cls._cached_config is None or cls._cached_mtime_ns != mtime_ns:
+                with open(cls.CONFIG_FILE, 'r') as f:
+                    cls._cached_config = yaml.load(f, Loader=SafeLoader)
+                cls._cached_mtime_ns = mtime_ns
+            
+            # Merge with defaults to ensure all keys exist (returns a fresh copy)
+            return cls._merge_with_defaults(cls._cached_config)
         except Exception as e:
             print(f"Error loading config: {e}")
             return cls.get_default()
@@ -49,15 +68,19 @@ class Config:
             cls.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
             
             with open(cls.CONFIG_FILE, 'w') as f:
-                yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+            
+            # Keep the cache in sync without parsing the file back
+            cls._cached_config = cls._merge_with_defaults(config)
+            cls._cached_mtime_ns = cls.CONFIG_FILE.stat().st_mtime_ns
         except Exception as e:
             print(f"Error saving config: {e}")
     
     @classmethod
     def get_default(cls) -> Dict[str, Any]:
         """Return default configuration"""
-        import copy
-        return copy.deepcopy(cls.DEFAULT_CONFIG)
+        # Section values are scalars, copying each section dict is enough
+        return {section: dict(values) for section, values in cls.DEFAULT_CONFIG.items()}
     
     @classmethod
     def _merge_with_defaults(cls, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -90,9 +113,8 @@ class Config:
     @classmethod
     def get_app_settings(cls) -> Dict[str, Any]:
         """Get application settings"""
-        import copy
         config = cls.load()
-        return copy.deepcopy(config.get('app_settings', cls.DEFAULT_CONFIG['app_settings']))
+        return dict(config.get('app_settings', cls.DEFAULT_CONFIG['app_settings']))
     
     @classmethod
     def set_app_settings(cls, app_settings: Dict[str, Any]) -> None:
@@ -1,10 +1,24 @@
 """
 Utility functions for formatting and data conversion
 """
-from datetime import datetime
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 
+# DMS coordinates as output by ExifTool, e.g. 40 deg 26' 46.32" N
+_DMS_RE = re.compile(
+    r'\s*([-+]?\d+(?:\.\d*)?)(?:\s*deg\s*|\s+)'
+    r'([-+]?\d+(?:\.\d*)?)(?:\s*\'\s*|\s+)'
+    r'([-+]?\d+(?:\.\d*)?)\s*"?\s*(\S*)'
+)
+
+# Timezone offsets as written in EXIF OffsetTime tags, e.g. +05:30 (colon optional)
+_TZ_OFFSET_RE = re.compile(r'\s*([+-])(\d{2}):?(\d{2})\s*$')
+
+
+@lru_cache(maxsize=4096)
 def format_date(dt: Optional[datetime]) -> str:
     """
     Format a datetime object to a human-readable string
@@ -17,9 +31,59 @@ def format_date(dt: Optional[datetime]) -> str:
     """
     if dt is None:
         return ""
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    # Formatted from the datetime fields rather than with strftime (see format_exif_date)
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
 
 
+def format_exif_date(dt: datetime) -> str:
+    """
+    Format the date part of a datetime as written in EXIF (YYYY:MM:DD)
+    
+    Formatted from the datetime fields rather than with strftime, which goes
+    through the C library locale code and is several times slower.
+    
+    Args:
+        dt: datetime object
+        
+    Returns:
+        EXIF date string
+    """
+    return f"{dt.year:04d}:{dt.month:02d}:{dt.day:02d}"
+
+
+def format_exif_time(dt: datetime) -> str:
+    """
+    Format the time part of a datetime as written in EXIF (HH:MM:SS)
+    
+    Args:
+        dt: datetime object
+        
+    Returns:
+        EXIF time string
+    """
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
+def format_exif_datetime(dt: datetime) -> str:
+    """
+    Format a datetime as written in EXIF (YYYY:MM:DD HH:MM:SS)
+    
+    Args:
+        dt: datetime object
+        
+    Returns:
+        EXIF date/time string
+    """
+    return (
+        f"{dt.year:04d}:{dt.month:02d}:{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
+
+
+@lru_cache(maxsize=1024)
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in bytes to human-readable format
@@ -60,6 +124,7 @@ def format_gps_coordinates(latitude: Optional[float], longitude: Optional[float]
     return f"{abs(latitude):.6f}° {lat_dir}, {abs(longitude):.6f}° {lon_dir}"
 
 
+@lru_cache(maxsize=4096)
 def parse_gps_dms(dms_str: str) -> Optional[float]:
     """
     Parse GPS coordinates from DMS (Degrees Minutes Seconds) format to decimal degrees
@@ -74,17 +139,16 @@ def parse_gps_dms(dms_str: str) -> Optional[float]:
         return None
     
     try:
-        # Remove extra spaces and split
-        parts = dms_str.replace("deg", "").replace("'", "").replace('"', "").split()
+        match = _DMS_RE.match(dms_str)
         
-        if len(parts) < 3:
+        if not match:
             # Try to parse as decimal
             return float(dms_str)
         
-        degrees = float(parts[0])
-        minutes = float(parts[1])
-        seconds = float(parts[2])
-        direction = parts[3] if len(parts) > 3 else ""
+        degrees = float(match.group(1))
+        minutes = float(match.group(2))
+        seconds = float(match.group(3))
+        direction = match.group(4)
         
         decimal = degrees + (minutes / 60.0) + (seconds / 3600.0)
         
@@ -97,6 +161,30 @@ def parse_gps_dms(dms_str: str) -> Optional[float]:
         return None
 
 
+@lru_cache(maxsize=64)
+def parse_tz_offset(offset_str: str) -> Optional[timedelta]:
+    """
+    Parse a timezone offset string to a timedelta
+    
+    Results are cached: a directory usually only uses a few distinct offsets.
+    
+    Args:
+        offset_str: Offset like "+05:30", "-04:00" or "+0100"
+        
+    Returns:
+        Offset from UTC, or None if the string is not a valid offset
+    """
+    if not offset_str:
+        return None
+    
+    match = _TZ_OFFSET_RE.match(offset_str)
+    if not match:
+        return None
+    
+    sign = 1 if match.group(1) == '+' else -1
+    return timedelta(seconds=sign * (int(match.group(2)) * 3600 + int(match.group(3)) * 60))
+
+
 def truncate_string(text: str, max_length: int = 50) -> str:
     """
     Truncate a string to a maximum length with ellipsis
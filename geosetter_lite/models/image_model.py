@@ -1,10 +1,31 @@
 """
 Image Model - Data structure for storing image file information and metadata
 """
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
+from ..core.utils import format_date, format_file_size, format_gps_coordinates
+
+
+# Display fields derived from several attributes (other fields map to the attribute of the same name)
+_DISPLAY_FIELDS = {
+    'gps_latitude': 'gps_coordinates',
+    'gps_longitude': 'gps_coordinates',
+}
+
+# Display formatters of the fields not shown as their raw attribute value
+_FORMATTERS = {
+    'taken_date': lambda image: format_date(image.taken_date),
+    'gps_date': lambda image: format_date(image.gps_date),
+    'created_date': lambda image: format_date(image.created_date),
+    'creation_date': lambda image: format_date(image.creation_date),
+    'modification_date': lambda image: format_date(image.modification_date),
+    'gps_coordinates': lambda image: format_gps_coordinates(image.gps_latitude, image.gps_longitude),
+    'size': lambda image: format_file_size(image.size),
+    'keywords': lambda image: "; ".join(image.keywords) if image.keywords else "",
+}
 
 
 @dataclass
@@ -36,17 +57,57 @@ class ImageModel:
     gps_date: Optional[datetime] = None
     tz_offset: Optional[str] = None  # Format: "+05:00" or "-04:00"
     
+    # Formatted strings for display, see display_text()
+    _display_cache: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping its cached display string"""
+        super().__setattr__(name, value)
+        display_cache = self.__dict__.get('_display_cache')
+        if display_cache:
+            display_cache.pop(_DISPLAY_FIELDS.get(name, name), None)
+    
+    def display_text(self, field_name: str) -> str:
+        """
+        Get a field formatted for display, formatting it only once
+        
+        The cached string is dropped whenever the underlying attribute is assigned.
+        
+        Args:
+            field_name: Attribute name, or 'gps_coordinates' for the latitude/longitude pair
+            
+        Returns:
+            Display string (empty when the field is not set)
+        """
+        text = self._display_cache.get(field_name)
+        if text is None:
+            text = self._format_field(field_name)
+            self._display_cache[field_name] = text
+        return text
+    
+    def _format_field(self, field_name: str) -> str:
+        """Format a field for display (uncached)"""
+        formatter = _FORMATTERS.get(field_name)
+        if formatter is not None:
+            return formatter(self)
+        return getattr(self, field_name) or ""
+    
     @classmethod
-    def from_file(cls, filepath: Path) -> "ImageModel":
+    def from_file(cls, filepath: Path, stat: Optional[os.stat_result] = None) -> "ImageModel":
         """
         Create an ImageModel from a file path with basic file info
         
+        Args:
+            filepath: Path to the image file
+            stat: Already fetched stat result of the file (e.g. from os.scandir), saves a syscall
+            
         Note: File creation date is only available on macOS/Windows (st_birthtime).
         On Linux/Unix, we use modification time as a fallback since st_ctime 
         represents inode change time, not creation time.
         The actual creation date will be extracted from EXIF metadata if available.
         """
-        stat = filepath.stat()
+        if stat is None:
+            stat = filepath.stat()
         
         # Get creation date if available (macOS/Windows only)
         # On Linux/Unix, fall back to modification time since st_ctime is inode change time
@@ -239,9 +300,5 @@ class ImageModel:
     
     def get_gps_string(self) -> str:
         """Get formatted GPS coordinates string"""
-        if self.gps_latitude is not None and self.gps_longitude is not None:
-            lat_dir = "N" if self.gps_latitude >= 0 else "S"
-            lon_dir = "E" if self.gps_longitude >= 0 else "W"
-            return f"{abs(self.gps_latitude):.6f}° {lat_dir}, {abs(self.gps_longitude):.6f}° {lon_dir}"
-        return ""
+        return self.display_text('gps_coordinates')
 
@@ -2,9 +2,18 @@
 
 from .exiftool_service import ExifToolService, ExifToolError
 from .reverse_geocoding_service import ReverseGeocodingService
-from .ai_service import AIService
 from .file_scanner import FileScanner
 from .location_database import LocationDatabase
+from .feature_cache import FeatureCache
+
+
+def __getattr__(name):
+    """Import AIService on first access (it pulls in Pillow, NumPy and PyTorch)"""
+    if name == 'AIService':
+        from .ai_service import AIService
+        globals()[name] = AIService
+        return AIService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'ExifToolService',
@@ -13,4 +22,5 @@ __all__ = [
     'AIService',
     'FileScanner',
     'LocationDatabase',
+    'FeatureCache',
 ]
@@ -1,30 +1,98 @@
 """AI service for photo similarity and geolocation"""
 
+from __future__ import annotations
+
 import os
 # Disable tokenizers parallelism warning
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
-import torch
-import torchvision.models as models
-import torchvision.transforms as transforms
+import importlib.util
 from PIL import Image
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, TYPE_CHECKING
 import numpy as np
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# torch, torchvision and transformers take seconds to import: they are only
+# imported by the methods that need them, when an AI feature is first used
+if TYPE_CHECKING:
+    import torch
 
-try:
-    from transformers import CLIPProcessor, CLIPModel
-    CLIP_AVAILABLE = True
-except ImportError:
-    CLIP_AVAILABLE = False
+CLIP_AVAILABLE = importlib.util.find_spec("transformers") is not None
 
 from .location_database import LocationDatabase
+from .feature_cache import FeatureCache
+
+
+class _DisjointSet:
+    """Union-find structure with path compression and union by rank"""
+    
+    def __init__(self, size: int):
+        """Initialize disjoint set with one singleton set per element
+        
+        Args:
+            size: Number of elements
+        """
+        self.parent = list(range(size))
+        self.rank = [0] * size
+    
+    def find(self, x: int) -> int:
+        """Find the representative of the set containing x
+        
+        Args:
+            x: Element index
+            
+        Returns:
+            Index of the set representative
+        """
+        parent = self.parent
+        while parent[x] != x:
+            # Path halving
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    
+    def union(self, x: int, y: int) -> None:
+        """Merge the sets containing x and y
+        
+        Args:
+            x: First element index
+            y: Second element index
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return
+        
+        if self.rank[root_x] < self.rank[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        if self.rank[root_x] == self.rank[root_y]:
+            self.rank[root_x] += 1
 
 
 class AIService:
     """Service for AI-based photo analysis"""
     
+    # Number of images sent through ResNet in a single forward pass
+    FEATURE_BATCH_SIZE = 32
+    
+    # Tag stored with cached feature vectors, bump when the extractor changes
+    RESNET_MODEL_VERSION = "resnet18-v3"
+    
+    # CLIP model used for geolocation
+    CLIP_MODEL_NAME = "openai/clip-vit-base-patch16"
+    
+    # Tag of the precomputed location embeddings, bump when the model or the prompt changes
+    CLIP_EMBEDDINGS_TAG = "clip-vit-base-patch16-v1"
+    
+    # Number of location descriptions encoded per CLIP text tower pass
+    TEXT_BATCH_SIZE = 256
+    
+    # Number of images sent through the CLIP image tower in a single forward pass
+    CLIP_BATCH_SIZE = 16
+    
     def __init__(self, cache_dir: str):
         """Initialize AI service
         
@@ -34,29 +102,50 @@ class AIService:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Set torch cache directory
-        torch.hub.set_dir(str(self.cache_dir))
-        
         # Models (lazy loaded)
         self.resnet_model = None
+        self._compiled_resnet = None
         self.resnet_transform = None
+        self.resnet_normalize = None
+        self._copy_stream = None
         self.clip_model = None
         self.clip_processor = None
-        self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        self._device = None  # Lazy resolved
         
         # Feature cache for similarity computation
         self._feature_cache: Dict[Path, torch.Tensor] = {}
         
+        # Persistent feature cache shared across runs
+        self._feature_store = FeatureCache(self.cache_dir / 'features.db', self.RESNET_MODEL_VERSION)
+        
         # Location database for geolocation
         db_path = self.cache_dir / 'locations.db'
         self._location_db = LocationDatabase(db_path)
         self._location_database = None  # Lazy loaded
+        
+        # Normalized CLIP embeddings of the location descriptions (lazy computed)
+        self._location_text_embeds: Optional[torch.Tensor] = None
+    
+    @property
+    def device(self) -> torch.device:
+        """Device used for inference (CUDA when available), resolved on first use"""
+        if self._device is None:
+            import torch
+            self._device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        return self._device
     
     def load_resnet_model(self) -> None:
         """Load ResNet18 model for feature extraction"""
         if self.resnet_model is not None:
             return
         
+        import torch
+        import torchvision.models as models
+        import torchvision.transforms.v2 as transforms
+        
+        # Set torch cache directory
+        torch.hub.set_dir(str(self.cache_dir))
+        
         # Load pretrained ResNet18
         self.resnet_model = models.resnet18(pretrained=True)
         
@@ -65,47 +154,273 @@ class AIService:
         
         # Set to evaluation mode
         self.resnet_model.eval()
+        
+        # The model is never trained, BatchNorm layers are fixed affine transforms
+        self._fold_batch_norms(self.resnet_model)
         self.resnet_model.to(self.device)
         
-        # Define image preprocessing
+        # Compile the fixed inference graph (CUDA only: compiling for CPU/MPS needs a
+        # C++ toolchain that end user machines usually don't have)
+        if self.device.type == 'cuda' and hasattr(torch, 'compile'):
+            self._compiled_resnet = torch.compile(self.resnet_model, mode='reduce-overhead', fullgraph=True)
+        
+        # Side stream so that host to device copies overlap with the forward pass
+        if self.device.type == 'cuda':
+            self._copy_stream = torch.cuda.Stream(self.device)
+        
+        # Define image preprocessing, on uint8 tensors so that it can run on the device:
+        # resize/crop per image (sizes differ), then dtype conversion/normalization per batch
         self.resnet_transform = transforms.Compose([
-            transforms.Resize(256),
-            transforms.CenterCrop(224),
-            transforms.ToTensor(),
+            transforms.Resize(256, antialias=True),
+            transforms.CenterCrop(224)
+        ])
+        self.resnet_normalize = transforms.Compose([
+            transforms.ToDtype(torch.float32, scale=True),
             transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
         ])
     
-    def extract_features(self, image_path: Path) -> Optional[torch.Tensor]:
-        """Extract feature vector from an image
+    def _load_resnet_input(self, image_path: Path) -> Optional[torch.Tensor]:
+        """Load an image as a uint8 tensor for the ResNet feature extractor
+        
+        On CUDA the image is resized and cropped later on the device, otherwise
+        it is done here (in the loader threads).
         
         Args:
             image_path: Path to the image file
             
         Returns:
-            512-dimensional feature vector or None if extraction fails
+            3xHxW uint8 tensor (3x224x224 on CPU) or None if the image cannot be loaded
         """
-        # Check cache first
-        if image_path in self._feature_cache:
-            return self._feature_cache[image_path]
+        from torchvision.transforms.v2.functional import pil_to_tensor
         
         try:
-            # Load and preprocess image
             image = Image.open(image_path).convert('RGB')
-            image_tensor = self.resnet_transform(image).unsqueeze(0).to(self.device)
+            tensor = pil_to_tensor(image)
+            if self.device.type != 'cuda':
+                return self.resnet_transform(tensor)
             
-            # Extract features
-            with torch.no_grad():
-                features = self.resnet_model(image_tensor)
-                features = features.squeeze().cpu()
-            
-            # Cache the features
-            self._feature_cache[image_path] = features
-            
-            return features
+            # Page-locked memory allows asynchronous copies to the GPU
+            return tensor.pin_memory()
         except Exception as e:
             print(f"Error extracting features from {image_path}: {e}")
             return None
     
+    def _iter_loaded_batches(self, executor: ThreadPoolExecutor, image_paths: List[Path], batch_size: int):
+        """Decode images batch by batch, prefetching the next batch in the background
+        
+        Args:
+            executor: Thread pool used to decode images
+            image_paths: List of image file paths
+            batch_size: Number of images per batch
+            
+        Yields:
+            Tuples (start_index, batch_paths, tensors), tensors being None for images that failed to load
+        """
+        starts = range(0, len(image_paths), batch_size)
+        
+        def submit(start):
+            return [
+                executor.submit(self._load_resnet_input, path)
+                for path in image_paths[start:start + batch_size]
+            ]
+        
+        next_loads = submit(starts[0]) if starts else []
+        for i, start in enumerate(starts):
+            loads = next_loads
+            
+            # Decode the next batch while the caller runs the current one through the model
+            if i + 1 < len(starts):
+                next_loads = submit(starts[i + 1])
+            
+            yield start, image_paths[start:start + batch_size], [load.result() for load in loads]
+    
+    @staticmethod
+    def _fold_batch_norms(model) -> None:
+        """Fold BatchNorm layers into the preceding convolutions of a ResNet (in place)
+        
+        The convolution weights and biases are rescaled by the BatchNorm running
+        statistics and the BatchNorm is replaced by an identity, removing its
+        compute and memory traffic at inference. The model must be in eval mode.
+        
+        Args:
+            model: ResNet model (or Sequential of its children)
+        """
+        from torch import nn
+        from torch.nn.utils.fusion import fuse_conv_bn_eval
+        
+        # (convolution, batch norm) attribute pairs of ResNet stems, blocks and
+        # downsample branches ('0', '1' being Sequential children)
+        pairs = (('conv1', 'bn1'), ('conv2', 'bn2'), ('conv3', 'bn3'), ('0', '1'))
+        
+        for module in list(model.modules()):
+            for conv_name, bn_name in pairs:
+                conv = getattr(module, conv_name, None)
+                bn = getattr(module, bn_name, None)
+                if isinstance(conv, nn.Conv2d) and isinstance(bn, nn.BatchNorm2d):
+                    setattr(module, conv_name, fuse_conv_bn_eval(conv, bn))
+                    setattr(module, bn_name, nn.Identity())
+    
+    def _run_resnet(self, batch: torch.Tensor, batch_size: int) -> torch.Tensor:
+        """Run a preprocessed batch through ResNet
+        
+        Uses the compiled model when available, padding a partial batch so that
+        the input shape stays static. Falls back to the eager model for good if
+        the compiled one fails (e.g. no Triton available).
+        
+        Args:
+            batch: Nx3x224x224 normalized image batch
+            batch_size: Full batch size the compiled model is used with
+            
+        Returns:
+            Nx512 feature tensor
+        """
+        import torch
+        
+        if self._compiled_resnet is not None:
+            count = batch.shape[0]
+            padded = batch
+            if count < batch_size:
+                padding = batch.new_zeros((batch_size - count, *batch.shape[1:]))
+                padded = torch.cat([batch, padding])
+            
+            try:
+                # CUDA graph outputs are overwritten by the next run, hence the clone
+                return self._compiled_resnet(padded)[:count].flatten(1).clone()
+            except Exception as e:
+                print(f"Warning: Compiled ResNet failed, falling back to eager mode: {e}")
+                self._compiled_resnet = None
+        
+        return self.resnet_model(batch).flatten(1)
+    
+    def extract_features_batch(
+        self,
+        image_paths: List[Path],
+        batch_size: Optional[int] = None,
+        progress_callback=None
+    ) -> Dict[Path, torch.Tensor]:
+        """Extract feature vectors for many images using mini-batched inference
+        
+        Images are decoded in a thread pool (one batch ahead of inference),
+        preprocessed and stacked on the device, then sent through ResNet in a
+        single forward pass per mini-batch. On CUDA, copies to the device run
+        on a side stream. Vectors found in the persistent feature cache skip the
+        forward pass entirely. Returned vectors stay on the device.
+        
+        Args:
+            image_paths: List of image file paths
+            batch_size: Number of images per forward pass (default: FEATURE_BATCH_SIZE)
+            progress_callback: Optional callback(current, total) for progress updates
+            
+        Returns:
+            Dictionary mapping each successfully processed path to its L2-normalized 512-dimensional feature vector
+        """
+        import torch
+        
+        batch_size = batch_size or self.FEATURE_BATCH_SIZE
+        total = len(image_paths)
+        results: Dict[Path, torch.Tensor] = {}
+        
+        # Only extract features for images not already cached
+        pending = []
+        for image_path in image_paths:
+            if image_path in self._feature_cache:
+                results[image_path] = self._feature_cache[image_path]
+            else:
+                pending.append(image_path)
+        
+        use_amp = self.device.type == 'cuda'
+        max_workers = min(batch_size, os.cpu_count() or 1)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Look up the persistent cache by file fingerprint
+            file_keys = dict(zip(pending, executor.map(FeatureCache.compute_key, pending)))
+            stored = self._feature_store.get_many(key for key in file_keys.values() if key)
+            
+            to_compute = []
+            found = []
+            for image_path in pending:
+                vector = stored.get(file_keys[image_path])
+                if vector is not None:
+                    found.append((image_path, vector))
+                else:
+                    to_compute.append(image_path)
+            pending = to_compute
+            
+            # Move cached vectors to the device in a single transfer
+            if found:
+                stored_features = torch.from_numpy(np.stack([vector for _, vector in found]))
+                stored_features = stored_features.to(self.device).half()
+                for (image_path, _), feature in zip(found, stored_features):
+                    self._feature_cache[image_path] = feature
+                    results[image_path] = feature
+            
+            # Host copies of new features, written to the persistent cache at the end
+            # so that the loop never waits on the device
+            new_features = []
+            
+            for start, batch_paths, tensors in self._iter_loaded_batches(executor, pending, batch_size):
+                if progress_callback:
+                    progress_callback(total - len(pending) + start, total)
+                
+                # Skip images that failed to load
+                valid = [(path, tensor) for path, tensor in zip(batch_paths, tensors) if tensor is not None]
+                if not valid:
+                    continue
+                
+                try:
+                    with torch.inference_mode():
+                        if self.device.type == 'cuda':
+                            compute_stream = torch.cuda.current_stream(self.device)
+                            with torch.cuda.stream(self._copy_stream):
+                                images = [tensor.to(self.device, non_blocking=True) for _, tensor in valid]
+                            compute_stream.wait_stream(self._copy_stream)
+                            for image in images:
+                                image.record_stream(compute_stream)
+                            images = [self.resnet_transform(image) for image in images]
+                        else:
+                            images = [tensor for _, tensor in valid]
+                        batch = self.resnet_normalize(torch.stack(images))
+                        
+                        with torch.autocast(device_type=self.device.type, enabled=use_amp):
+                            features = self._run_resnet(batch, batch_size)
+                    
+                    # Normalized once here for cosine similarity, then kept in half
+                    # precision (plenty for a cosine threshold and half the memory)
+                    features = torch.nn.functional.normalize(features.float(), p=2, dim=1).half()
+                except Exception as e:
+                    print(f"Error extracting features for batch starting at {batch_paths[0]}: {e}")
+                    continue
+                
+                # Cache the features in memory, copy them to host asynchronously for the disk cache
+                for (path, _), feature in zip(valid, features):
+                    self._feature_cache[path] = feature
+                    results[path] = feature
+                new_features.append(([path for path, _ in valid], features.to('cpu', non_blocking=True)))
+            
+            if new_features:
+                if self.device.type == 'cuda':
+                    torch.cuda.synchronize(self.device)
+                
+                new_vectors = {}
+                for paths, host_features in new_features:
+                    for path, host_feature in zip(paths, host_features.numpy()):
+                        if file_keys[path]:
+                            new_vectors[file_keys[path]] = host_feature
+                self._feature_store.put_many(new_vectors)
+        
+        return results
+    
+    def extract_features(self, image_path: Path) -> Optional[torch.Tensor]:
+        """Extract feature vector from an image
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            L2-normalized 512-dimensional feature vector or None if extraction fails
+        """
+        return self.extract_features_batch([image_path]).get(image_path)
+    
     def compute_similarity(
         self, 
         image_paths: List[Path], 
@@ -123,41 +438,39 @@ class AIService:
             List of tuples (group_of_similar_images, similarity_score)
             Groups are sorted by similarity score (highest first)
         """
+        import torch
+        
         # Load model if not already loaded
         self.load_resnet_model()
         
-        # Clear feature cache for new computation
+        # Clear in-memory feature cache for new computation (files may have
+        # changed since the last run, the persistent cache is keyed by content)
         self._feature_cache.clear()
         
-        # Extract features for all images
-        features_list = []
-        valid_paths = []
+        # Extract features for all images in mini-batches
+        features_by_path = self.extract_features_batch(
+            image_paths,
+            progress_callback=progress_callback
+        )
         
-        for i, image_path in enumerate(image_paths):
-            if progress_callback:
-                progress_callback(i, len(image_paths))
-            
-            features = self.extract_features(image_path)
-            if features is not None:
-                features_list.append(features)
-                valid_paths.append(image_path)
+        # Keep the original image order
+        valid_paths = [path for path in image_paths if path in features_by_path]
+        features_list = [features_by_path[path] for path in valid_paths]
         
         if len(features_list) < 2:
             return []
         
-        # Convert to tensor for batch processing
-        features_tensor = torch.stack(features_list)
-        
-        # Normalize features for cosine similarity
-        features_tensor = torch.nn.functional.normalize(features_tensor, p=2, dim=1)
+        # Features are already normalized and on the device, stacking needs no transfer
+        features_tensor = torch.stack(features_list).to(self._similarity_dtype())
         
-        # Compute pairwise cosine similarity
-        similarity_matrix = torch.mm(features_tensor, features_tensor.t())
+        # Compute pairwise cosine similarity, in half precision where the
+        # hardware supports it, back to FP32 for the threshold comparison
+        similarity_matrix = torch.mm(features_tensor, features_tensor.t()).float()
         
         # Find similar image groups
         groups = self._find_similar_groups(
             valid_paths, 
-            similarity_matrix.cpu().numpy(), 
+            similarity_matrix, 
             threshold
         )
         
@@ -166,57 +479,75 @@ class AIService:
         
         return groups
     
+    def _similarity_dtype(self) -> torch.dtype:
+        """Get the dtype used for the similarity matrix product
+        
+        Returns:
+            torch.float16 on CUDA (tensor cores), torch.float32 otherwise
+        """
+        import torch
+        
+        # Half precision matmul is emulated (slow) on most CPUs
+        return torch.float16 if self.device.type == 'cuda' else torch.float32
+    
     def _find_similar_groups(
         self, 
         image_paths: List[Path], 
-        similarity_matrix: np.ndarray, 
+        similarity_matrix: torch.Tensor, 
         threshold: float
     ) -> List[Tuple[List[Path], float]]:
         """Find groups of similar images from similarity matrix
         
+        Groups are the connected components of the graph whose edges are the
+        pairs above threshold (so A~B and B~C put A, B and C in the same group
+        regardless of image order). Thresholding happens on the matrix's device,
+        only the (sparse) list of similar pairs and their scores are copied to
+        the host.
+        
         Args:
             image_paths: List of image paths
             similarity_matrix: NxN similarity matrix
             threshold: Similarity threshold
             
         Returns:
-            List of (group, avg_similarity) tuples
+            List of (group, avg_similarity) tuples, avg_similarity being the
+            mean score of the similar pairs within the group
         """
+        import torch
+        
         n = len(image_paths)
-        visited = set()
-        groups = []
         
-        for i in range(n):
-            if i in visited:
+        # Pairs above threshold, each pair once and ignoring self-similarity
+        adjacency = torch.triu(similarity_matrix >= threshold, diagonal=1)
+        pairs = torch.nonzero(adjacency)
+        scores = similarity_matrix[pairs[:, 0], pairs[:, 1]].float().cpu().numpy()
+        pairs = pairs.cpu().numpy()
+        
+        # Merge similar images into connected components
+        components = _DisjointSet(n)
+        for i, j in pairs.tolist():
+            components.union(i, j)
+        
+        roots = np.array([components.find(i) for i in range(n)], dtype=np.int64)
+        
+        # Sum and count pair scores per component
+        edge_roots = roots[pairs[:, 0]]
+        score_sums = np.bincount(edge_roots, weights=scores, minlength=n)
+        score_counts = np.bincount(edge_roots, minlength=n)
+        
+        members = defaultdict(list)
+        for idx, root in enumerate(roots.tolist()):
+            members[root].append(idx)
+        
+        groups = []
+        for root, group_indices in members.items():
+            # Single images have no similar pair
+            if len(group_indices) < 2:
                 continue
             
-            # Find all images similar to image i
-            similar_indices = []
-            similarities = []
-            
-            for j in range(n):
-                if i != j and similarity_matrix[i, j] >= threshold:
-                    similar_indices.append(j)
-                    similarities.append(similarity_matrix[i, j])
-            
-            # If we found similar images, create a group
-            if similar_indices:
-                group_indices = [i] + similar_indices
-                group_paths = [image_paths[idx] for idx in group_indices]
-                
-                # Calculate average similarity within the group
-                group_similarities = []
-                for idx1 in group_indices:
-                    for idx2 in group_indices:
-                        if idx1 < idx2:
-                            group_similarities.append(similarity_matrix[idx1, idx2])
-                
-                avg_similarity = np.mean(group_similarities) if group_similarities else 0.0
-                
-                groups.append((group_paths, float(avg_similarity)))
-                
-                # Mark all images in this group as visited
-                visited.update(group_indices)
+            group_paths = [image_paths[idx] for idx in group_indices]
+            avg_similarity = score_sums[root] / score_counts[root]
+            groups.append((group_paths, float(avg_similarity)))
         
         return groups
     
@@ -225,14 +556,15 @@ class AIService:
         if self.clip_model is not None or not CLIP_AVAILABLE:
             return
         
+        from transformers import CLIPProcessor, CLIPModel
+        
         # Load CLIP model
-        model_name = "openai/clip-vit-base-patch16"
         self.clip_processor = CLIPProcessor.from_pretrained(
-            model_name,
+            self.CLIP_MODEL_NAME,
             cache_dir=str(self.cache_dir)
         )
         self.clip_model = CLIPModel.from_pretrained(
-            model_name,
+            self.CLIP_MODEL_NAME,
             cache_dir=str(self.cache_dir)
         )
         
@@ -240,103 +572,206 @@ class AIService:
         self.clip_model.eval()
         self.clip_model.to(self.device)
     
-    def _load_location_database(self) -> List[Tuple[float, float, str]]:
-        """Load location database from SQLite
+    def _encode_location_texts(self, descriptions: List[str]) -> np.ndarray:
+        """Encode location descriptions through the CLIP text tower
         
+        Args:
+            descriptions: Location descriptions
+            
         Returns:
-            List of (latitude, longitude, description) tuples
+            Normalized embeddings array, one row per description
+        """
+        import torch
+        
+        location_texts = [f"a photo taken in {desc}" for desc in descriptions]
+        inputs = self.clip_processor(text=location_texts, return_tensors="pt", padding=True)
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        
+        with torch.inference_mode():
+            text_embeds = self.clip_model.get_text_features(**inputs)
+            text_embeds = torch.nn.functional.normalize(text_embeds, p=2, dim=-1)
+        
+        return text_embeds.float().cpu().numpy()
+    
+    def _load_location_database(self) -> np.ndarray:
+        """Load location database with precomputed CLIP text embeddings
+        
+        Embeddings are computed from the SQLite database the first time (in
+        chunks of TEXT_BATCH_SIZE), then memory-mapped from disk on later runs.
+        
+        Returns:
+            Structured array with 'lat', 'lon' and 'emb' fields, one record per location
         """
         if self._location_database is None:
-            self._location_database = self._location_db.get_all_locations()
+            location_database = self._location_db.load_embeddings(self.CLIP_EMBEDDINGS_TAG)
+            if location_database is None:
+                self.load_clip_model()
+                location_database = self._location_db.build_embeddings(
+                    self.CLIP_EMBEDDINGS_TAG,
+                    self._encode_location_texts,
+                    self.TEXT_BATCH_SIZE
+                )
+            self._location_database = location_database
             print(f"Loaded {len(self._location_database)} locations from database")
         
         return self._location_database
     
-    def predict_location(
-        self, 
-        image_path: Path, 
-        top_k: int = 5
-    ) -> List[Tuple[float, float, float]]:
-        """Predict GPS location for an image using CLIP-based geolocation
+    def _get_location_text_embeds(self) -> torch.Tensor:
+        """Get CLIP text embeddings of all location descriptions
+        
+        The embeddings do not depend on the query image, they are loaded once
+        (single copy from the memory-mapped file) and kept on the device.
+        
+        Returns:
+            Normalized embeddings tensor, one row per location of the database
+        """
+        import torch
+        
+        if self._location_text_embeds is None:
+            embeddings = np.ascontiguousarray(self._load_location_database()['emb'])
+            self._location_text_embeds = torch.from_numpy(embeddings).to(self.device).float()
+        
+        return self._location_text_embeds
+    
+    def _load_clip_image(self, image_path: Path) -> Optional[Image.Image]:
+        """Load an image for the CLIP image tower
         
         Args:
             image_path: Path to the image file
-            top_k: Number of top predictions to return
             
         Returns:
-            List of (latitude, longitude, confidence) tuples
+            RGB PIL image or None if the image cannot be loaded
+        """
+        try:
+            return Image.open(image_path).convert('RGB')
+        except Exception as e:
+            print(f"Error predicting location for {image_path}: {e}")
+            return None
+    
+    def predict_location_batch(
+        self,
+        image_paths: List[Path],
+        top_k: int = 5,
+        batch_size: Optional[int] = None
+    ) -> List[List[Tuple[float, float, float]]]:
+        """Predict GPS locations for many images using CLIP-based geolocation
+        
+        Images are decoded in a thread pool and encoded in mini-batches, each
+        batch is scored against the cached location embeddings with a single
+        matrix product.
+        
+        Args:
+            image_paths: List of image file paths
+            top_k: Number of top predictions to return per image
+            batch_size: Number of images per CLIP forward pass (default: CLIP_BATCH_SIZE)
+            
+        Returns:
+            One list of (latitude, longitude, confidence) tuples per image, in
+            the same order as image_paths (empty for images that failed)
         """
+        import torch
+        
+        predictions: List[List[Tuple[float, float, float]]] = [[] for _ in image_paths]
+        
         if not CLIP_AVAILABLE:
             print("CLIP model not available. Install transformers library.")
-            return []
+            return predictions
         
         # Load model if not already loaded
         self.load_clip_model()
         
+        batch_size = batch_size or self.CLIP_BATCH_SIZE
+        max_workers = min(batch_size, os.cpu_count() or 1)
+        
         try:
-            # Load image
-            image = Image.open(image_path).convert('RGB')
-            
             # Load location database
             location_database = self._load_location_database()
             
-            # Prepare location descriptions
-            location_texts = [f"a photo taken in {desc}" for _, _, desc in location_database]
-            
-            # Process inputs
-            inputs = self.clip_processor(
-                text=location_texts,
-                images=image,
-                return_tensors="pt",
-                padding=True
-            )
-            
-            # Move to device
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-            
-            # Get predictions
-            with torch.no_grad():
-                outputs = self.clip_model(**inputs)
-                
-                # Calculate similarity scores
-                image_embeds = outputs.image_embeds
-                text_embeds = outputs.text_embeds
+            # Location descriptions are encoded once and reused across predictions
+            text_embeds = self._get_location_text_embeds()
+        except Exception as e:
+            print(f"Error loading location embeddings: {e}")
+            return predictions
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for start in range(0, len(image_paths), batch_size):
+                batch_paths = image_paths[start:start + batch_size]
+                images = list(executor.map(self._load_clip_image, batch_paths))
                 
-                # Normalize embeddings
-                image_embeds = image_embeds / image_embeds.norm(dim=-1, keepdim=True)
-                text_embeds = text_embeds / text_embeds.norm(dim=-1, keepdim=True)
+                # Skip images that failed to load
+                valid = [(start + i, image) for i, image in enumerate(images) if image is not None]
+                if not valid:
+                    continue
                 
-                # Get the learned scale factor from the model
-                logit_scale = self.clip_model.logit_scale.exp()
-
-                # Compute similarity (cosine similarity) and SCALE IT
-                # This 'logit_scale' is usually around 100.0, which makes the 
-                # difference between 0.25 and 0.20 massive for the Softmax.
-                similarity = (image_embeds @ text_embeds.T).squeeze(0) * logit_scale
+                try:
+                    # Process inputs (images only)
+                    inputs = self.clip_processor(images=[image for _, image in valid], return_tensors="pt")
+                    
+                    # Move to device
+                    inputs = {k: v.to(self.device) for k, v in inputs.items()}
+                    
+                    # Get predictions
+                    with torch.inference_mode():
+                        image_embeds = self.clip_model.get_image_features(**inputs)
+                        
+                        # Normalize embeddings
+                        image_embeds = torch.nn.functional.normalize(image_embeds, p=2, dim=-1)
+                        
+                        # Get the learned scale factor from the model
+                        logit_scale = self.clip_model.logit_scale.exp()
+                        
+                        # Compute similarity (cosine similarity) and SCALE IT
+                        # This 'logit_scale' is usually around 100.0, which makes the 
+                        # difference between 0.25 and 0.20 massive for the Softmax.
+                        similarity = (image_embeds @ text_embeds.T) * logit_scale
+                        
+                        # Get top-k predictions (softmax is monotonic, rank on raw scores)
+                        top_similarities, top_indices = torch.topk(
+                            similarity, min(top_k, len(location_database)), dim=-1
+                        )
+                        
+                        # Apply softmax over the top-k candidates only to get confidences
+                        top_probs = torch.nn.functional.softmax(top_similarities, dim=-1)
+                    
+                    top_probs = top_probs.cpu().numpy()
+                    top_indices = top_indices.cpu().numpy()
+                except Exception as e:
+                    print(f"Error predicting locations for batch starting at {batch_paths[0]}: {e}")
+                    continue
                 
-                # Apply softmax to get probabilities
-                probabilities = torch.nn.functional.softmax(similarity, dim=0)
-            
-            # Get top-k predictions
-            top_probs, top_indices = torch.topk(probabilities, min(top_k, len(location_database)))
-            
-            # Convert to list of (lat, lon, confidence) tuples
-            predictions = []
-            for prob, idx in zip(top_probs.cpu().numpy(), top_indices.cpu().numpy()):
-                lat, lon, _ = location_database[idx]
-                predictions.append((float(lat), float(lon), float(prob)))
-
-            return predictions
+                # Convert to lists of (lat, lon, confidence) tuples
+                for (index, _), probs, indices in zip(valid, top_probs, top_indices):
+                    for prob, idx in zip(probs, indices):
+                        location = location_database[idx]
+                        predictions[index].append((float(location['lat']), float(location['lon']), float(prob)))
+        
+        return predictions
+    
+    def predict_location(
+        self, 
+        image_path: Path, 
+        top_k: int = 5
+    ) -> List[Tuple[float, float, float]]:
+        """Predict GPS location for an image using CLIP-based geolocation
+        
+        Args:
+            image_path: Path to the image file
+            top_k: Number of top predictions to return
             
-        except Exception as e:
-            print(f"Error predicting location for {image_path}: {e}")
-            return []
+        Returns:
+            List of (latitude, longitude, confidence) tuples
+        """
+        return self.predict_location_batch([image_path], top_k)[0]
     
     def clear_cache(self) -> None:
         """Clear feature cache to free memory"""
         self._feature_cache.clear()
         
-        # Clear GPU cache if using CUDA
-        if torch.cuda.is_available():
+        # Clear GPU cache if using CUDA (torch is necessarily imported then)
+        if self._device is not None and self._device.type == 'cuda':
+            import torch
             torch.cuda.empty_cache()
-
+    
+    def close(self) -> None:
+        """Write queued feature vectors and close the feature cache"""
+        self._feature_store.close()
@@ -3,28 +3,311 @@ ExifTool Service - Wrapper for reading and writing EXIF/XMP metadata
 """
 import subprocess
 import os
+import atexit
+import ctypes
+import ctypes.util
+import functools
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import json
 import platform
+import tempfile
 from ..core.config import Config
 
+# Prefer orjson (much faster on ExifTool's JSON output) when installed,
+# its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Platform check, resolved once at import
+_IS_DARWIN = platform.system() == 'Darwin'
+
+
+def _load_setattrlist():
+    """
+    Bind libc setattrlist() on macOS, used to set file creation (birth) times
+    without spawning a process
+    
+    Returns:
+        The setattrlist function or None if not on macOS or unavailable
+    """
+    if not _IS_DARWIN:
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        func = libc.setattrlist
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_char_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_ulong]
+    func.restype = ctypes.c_int
+    return func
+
+
+class _AttrList(ctypes.Structure):
+    """struct attrlist from <sys/attr.h>"""
+    _fields_ = [
+        ('bitmapcount', ctypes.c_ushort),
+        ('reserved', ctypes.c_uint16),
+        ('commonattr', ctypes.c_uint32),
+        ('volattr', ctypes.c_uint32),
+        ('dirattr', ctypes.c_uint32),
+        ('fileattr', ctypes.c_uint32),
+        ('forkattr', ctypes.c_uint32),
+    ]
+
+
+class _Timespec(ctypes.Structure):
+    """struct timespec"""
+    _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+
+_ATTR_BIT_MAP_COUNT = 5
+_ATTR_CMN_CRTIME = 0x00000200
+
+# Resolved once at import, None on other platforms
+_SETATTRLIST = _load_setattrlist()
+
 
 class ExifToolError(Exception):
     """Exception raised when ExifTool operations fail"""
     pass
 
 
+class _PipeReader(threading.Thread):
+    """
+    Drain one output pipe of the ExifTool process into a buffer
+    
+    Both pipes are read continuously, so ExifTool never blocks on a full pipe
+    (e.g. many warnings on stderr) while the output of the other one is awaited.
+    """
+    
+    def __init__(self, stream, condition: threading.Condition):
+        """
+        Initialize the reader (call start() to run it)
+        
+        Args:
+            stream: Binary pipe to read, closed by the reader at end of file
+            condition: Condition notified whenever output arrives or the pipe closes
+        """
+        super().__init__(daemon=True)
+        self._stream = stream
+        self._condition = condition
+        self._scanned = 0
+        self.buffer = bytearray()
+        self.closed = False
+    
+    def run(self):
+        """Read the pipe until the process closes it"""
+        fd = self._stream.fileno()
+        while True:
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError:
+                chunk = b''
+            with self._condition:
+                if chunk:
+                    self.buffer += chunk
+                else:
+                    self.closed = True
+                self._condition.notify_all()
+            if not chunk:
+                self._stream.close()
+                return
+    
+    def take_until(self, sentinel: bytes) -> Optional[bytes]:
+        """
+        Remove the output up to a sentinel line from the buffer (call with the condition held)
+        
+        Args:
+            sentinel: Sentinel marking the end of the command output
+            
+        Returns:
+            Output read before the sentinel, or None if the whole sentinel line has not arrived yet
+        """
+        # Only scan what arrived since the last call
+        start = self.buffer.find(sentinel, max(0, self._scanned - len(sentinel)))
+        line_end = self.buffer.find(b'\n', start + len(sentinel)) if start >= 0 else -1
+        if line_end < 0:
+            self._scanned = start if start >= 0 else len(self.buffer)
+            return None
+        
+        output = bytes(self.buffer[:start])
+        del self.buffer[:line_end + 1]
+        self._scanned = 0
+        return output
+
+
+class ExifToolDaemon:
+    """
+    Persistent ExifTool process running in -stay_open mode
+    
+    Commands are sent as argument lines through the process stdin, which avoids
+    paying the Perl interpreter startup for every call. Arguments must not
+    contain newlines.
+    """
+    
+    def __init__(self, exiftool_path: str):
+        """
+        Initialize the daemon (the process is started on first use)
+        
+        Args:
+            exiftool_path: Path to ExifTool executable
+        """
+        self.exiftool_path = exiftool_path
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._command_id = 0
+        
+        # Readers of the process stdout and stderr, notifying the condition on output
+        self._condition = threading.Condition()
+        self._readers: Tuple[_PipeReader, ...] = ()
+    
+    @property
+    def running(self) -> bool:
+        """Whether the ExifTool process is alive"""
+        return self._process is not None and self._process.poll() is None
+    
+    def start(self) -> None:
+        """
+        Start the ExifTool process
+        
+        Raises:
+            ExifToolError: If the process cannot be started
+        """
+        try:
+            self._process = subprocess.Popen(
+                [self.exiftool_path, '-stay_open', 'True', '-@', '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except OSError as e:
+            raise ExifToolError(f"Could not start ExifTool: {e}")
+        
+        self._readers = (
+            _PipeReader(self._process.stdout, self._condition),
+            _PipeReader(self._process.stderr, self._condition),
+        )
+        for reader in self._readers:
+            reader.start()
+    
+    def execute(self, args: List[str], timeout: Optional[float] = None) -> Tuple[bytes, bytes]:
+        """
+        Execute one ExifTool command
+        
+        Args:
+            args: Command line arguments (without the exiftool executable)
+            timeout: Timeout in seconds, None to wait as long as needed
+            
+        Returns:
+            Tuple (stdout, stderr) of the command output
+            
+        Raises:
+            ExifToolError: If the ExifTool process fails
+            subprocess.TimeoutExpired: If the command did not complete in time
+                                       (the process is killed and restarted on next call)
+        """
+        with self._lock:
+            if not self.running:
+                self.start()
+            
+            # Numbered sentinel printed on stdout by -execute and on stderr by -echo4
+            self._command_id += 1
+            sentinel = f'{{ready{self._command_id}}}'
+            lines = [*args, '-echo4', sentinel, f'-execute{self._command_id}']
+            
+            try:
+                self._process.stdin.write(''.join(f'{line}\n' for line in lines).encode('utf-8'))
+                self._process.stdin.flush()
+                return self._wait_for_output(sentinel.encode(), timeout)
+            except subprocess.TimeoutExpired as e:
+                # The command may still be running, start afresh on next call
+                self._kill()
+                raise subprocess.TimeoutExpired(args, e.timeout)
+            except (OSError, ExifToolError) as e:
+                # The process is in an unknown state, restart it on next call
+                self._kill()
+                raise ExifToolError(f"ExifTool process failed: {e}")
+    
+    def _wait_for_output(self, sentinel: bytes, timeout: Optional[float]) -> Tuple[bytes, bytes]:
+        """
+        Wait until both stdout and stderr reach the given sentinel line
+        
+        Args:
+            sentinel: Sentinel marking the end of the command output
+            timeout: Timeout in seconds, None to wait as long as needed
+            
+        Returns:
+            Tuple (stdout, stderr) of the output read before the sentinel
+            
+        Raises:
+            ExifToolError: If a pipe is closed before the sentinel
+            subprocess.TimeoutExpired: If the sentinel did not arrive in time
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        outputs: List[Optional[bytes]] = [None] * len(self._readers)
+        with self._condition:
+            while True:
+                for i, reader in enumerate(self._readers):
+                    if outputs[i] is None:
+                        outputs[i] = reader.take_until(sentinel)
+                
+                if all(output is not None for output in outputs):
+                    return outputs[0], outputs[1]
+                if any(output is None and reader.closed for output, reader in zip(outputs, self._readers)):
+                    raise ExifToolError("ExifTool process terminated unexpectedly")
+                
+                if deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired('exiftool', timeout)
+                self._condition.wait(remaining)
+    
+    def _kill(self) -> None:
+        """Kill the ExifTool process"""
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+    
+    def close(self) -> None:
+        """Ask the ExifTool process to exit"""
+        with self._lock:
+            if not self.running:
+                self._process = None
+                return
+            
+            try:
+                self._process.stdin.write(b'-stay_open\nFalse\n')
+                self._process.stdin.flush()
+                self._process.wait(timeout=5)
+                self._process = None
+            except (OSError, subprocess.TimeoutExpired):
+                self._kill()
+
+
 class ExifToolService:
     """Service for interacting with ExifTool"""
     
     _exiftool_path: Optional[str] = None
+    _daemons: Dict[int, ExifToolDaemon] = {}
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _find_exiftool() -> Optional[str]:
         """
         Find ExifTool executable, checking common installation paths
         
+        The lookup spawns processes, so its result (found or not) is cached.
+        
         Returns:
             Path to ExifTool executable or None if not found
         """
@@ -41,7 +324,6 @@ class ExifToolService:
                 result = subprocess.run(
                     [path, '-ver'],
                     capture_output=True,
-                    text=True,
                     timeout=5
                 )
                 if result.returncode == 0:
@@ -78,12 +360,49 @@ class ExifToolService:
         return cls._exiftool_path
     
     @classmethod
-    def read_metadata(cls, filepath: Path) -> Dict[str, Any]:
+    def get_daemon(cls, slot: int = 0) -> ExifToolDaemon:
+        """
+        Get a shared persistent ExifTool process
+        
+        Args:
+            slot: Index of the process, distinct slots allow running commands
+                  in parallel from several threads (default: 0)
+        
+        Returns:
+            ExifTool daemon, stopped at interpreter exit
+            
+        Raises:
+            ExifToolError: If ExifTool is not found
+        """
+        daemon = cls._daemons.get(slot)
+        if daemon is None:
+            daemon = cls._daemons.setdefault(slot, ExifToolDaemon(cls.get_exiftool_path()))
+            atexit.register(daemon.close)
+        return daemon
+    
+    @classmethod
+    def close_daemons(cls) -> None:
+        """Stop the shared persistent ExifTool processes (restarted on next use)"""
+        for daemon in list(cls._daemons.values()):
+            daemon.close()
+    
+    # Timeout of metadata reads, per file
+    READ_TIMEOUT = 10
+    
+    @staticmethod
+    def _fast_args(fast: bool) -> List[str]:
+        """ExifTool read options for fast mode"""
+        return ['-fast2'] if fast else []
+    
+    @classmethod
+    def read_metadata(cls, filepath: Path, fast: bool = True) -> Dict[str, Any]:
         """
         Read all EXIF/XMP metadata from an image file
         
         Args:
             filepath: Path to the image file
+            fast: If True, skip maker notes and trailers (ExifTool -fast2), which is
+                  much quicker and enough for the fields shown in the file list
             
         Returns:
             Dictionary of metadata tags and values
@@ -92,21 +411,21 @@ class ExifToolService:
             ExifToolError: If reading metadata fails
         """
         try:
-            exiftool = cls.get_exiftool_path()
-            result = subprocess.run(
-                [exiftool, '-charset', 'iptc=utf8', '-j', '-G', '-n', str(filepath)],
-                capture_output=True,
-                text=True,
-                timeout=10
+            stdout, stderr = cls.get_daemon().execute(
+                ['-charset', 'iptc=utf8', '-j', '-G', '-n', *cls._fast_args(fast), str(filepath)],
+                timeout=cls.READ_TIMEOUT
             )
             
-            if result.returncode != 0:
-                raise ExifToolError(f"ExifTool failed: {result.stderr}")
-            
             # Parse JSON output
-            data = json.loads(result.stdout)
+            data = _json_loads(stdout) if stdout.strip() else []
             if data and len(data) > 0:
+                if 'ExifTool:Error' in data[0]:
+                    raise ExifToolError(f"ExifTool failed: {data[0]['ExifTool:Error']}")
                 return data[0]
+            
+            # No output at all means the file could not be read
+            if stderr.strip():
+                raise ExifToolError(f"ExifTool failed: {stderr.decode('utf-8', 'replace')}")
             return {}
             
         except ExifToolError:
@@ -120,61 +439,233 @@ class ExifToolService:
             raise ExifToolError(f"Error reading metadata: {e}")
     
     @classmethod
-    def _preserve_file_times(cls, filepaths: List[Path]) -> Dict[Path, tuple]:
+    def read_metadata_batch(
+        cls,
+        filepaths: List[Path],
+        slot: int = 0,
+        fast: bool = True,
+        tags: Optional[List[str]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read all EXIF/XMP metadata from many image files with a single ExifTool command
+        
+        Args:
+            filepaths: List of paths to image files
+            slot: ExifTool process slot to run the command on (see get_daemon)
+            fast: If True, skip maker notes and trailers (see read_metadata)
+            tags: Only extract these tags (e.g. 'DateTimeOriginal' in all groups, or 'EXIF:Model'),
+                  all tags if None
+            
+        Returns:
+            List of metadata dictionaries in the same order as filepaths,
+            None for files ExifTool could not read
+            
+        Raises:
+            ExifToolError: If the ExifTool command fails as a whole
+        """
+        if not filepaths:
+            return []
+        
+        try:
+            stdout, _ = cls.get_daemon(slot).execute(
+                [
+                    '-charset', 'iptc=utf8', '-j', '-G', '-n', *cls._fast_args(fast),
+                    *[f'-{tag}' for tag in tags or ()],
+                    *map(os.fspath, filepaths)
+                ],
+                timeout=cls.READ_TIMEOUT * len(filepaths)
+            )
+            data = _json_loads(stdout) if stdout.strip() else []
+        except ExifToolError:
+            raise
+        except subprocess.TimeoutExpired:
+            raise ExifToolError("ExifTool timed out")
+        except json.JSONDecodeError as e:
+            raise ExifToolError(f"Failed to parse ExifTool output: {e}")
+        except Exception as e:
+            raise ExifToolError(f"Error reading metadata: {e}")
+        
+        # Match entries back to files (ExifTool reports paths with forward slashes)
+        by_source = {
+            entry.get('SourceFile'): entry
+            for entry in data
+            if 'ExifTool:Error' not in entry
+        }
+        return [by_source.get(str(fp).replace(os.sep, '/')) for fp in filepaths]
+    
+    @classmethod
+    def _preserve_file_times(cls, filepaths: List[Path]) -> Dict[Path, Tuple[int, int]]:
         """
-        Get file creation and modification times before metadata write
+        Get file times that ExifTool -P does not preserve, before metadata write
+        
+        -P keeps modification times, but not creation (birth) times on macOS.
         
         Args:
             filepaths: List of file paths
             
         Returns:
             Dictionary mapping filepath to (creation_time, modification_time) tuple
+            in nanoseconds on macOS, empty elsewhere
         """
+        if not _IS_DARWIN:
+            return {}
+        
         times = {}
         for filepath in filepaths:
             stat = filepath.stat()
-            # Get creation time (birth time on macOS/Windows, mtime on Linux)
-            if hasattr(stat, 'st_birthtime'):
-                creation_time = stat.st_birthtime
-            else:
-                creation_time = stat.st_mtime  # Fallback for Linux
-            modification_time = stat.st_mtime
-            times[filepath] = (creation_time, modification_time)
+            birthtime_ns = getattr(stat, 'st_birthtime_ns', None)
+            if birthtime_ns is None:
+                birthtime_ns = int(stat.st_birthtime * 1e9)
+            times[filepath] = (birthtime_ns, stat.st_mtime_ns)
         return times
     
     @classmethod
-    def _restore_file_times(cls, times: Dict[Path, tuple]):
+    def _restore_file_times(cls, times: Dict[Path, Tuple[int, int]]):
         """
-        Restore file creation and modification times after metadata write
+        Restore file creation times after metadata write (macOS)
         
         Args:
-            times: Dictionary mapping filepath to (creation_time, modification_time) tuple
+            times: File times as returned by _preserve_file_times
         """
-        for filepath, (creation_time, modification_time) in times.items():
+        if not times:
+            return
+        
+        # Restore creation times first: touch (the fallback) also changes modification times
+        cls._restore_creation_times(times)
+        
+        failures = []
+        for filepath, (_, modification_time) in times.items():
             try:
-                # Set modification time (this is standard across platforms)
-                os.utime(filepath, (modification_time, modification_time))
+                os.utime(filepath, ns=(modification_time, modification_time))
             except (OSError, PermissionError) as e:
                 # If time restoration fails (e.g., permission errors), log but don't fail
                 # The metadata write was successful, which is the primary goal
-                print(f"Warning: Could not restore file times for {filepath}: {e}")
-            
-            # On macOS, try to restore creation time using SetFile (if available)
+                failures.append(f"Warning: Could not restore file times for {filepath}: {e}")
+        
+        if failures:
+            print('\n'.join(failures))
+    
+    @classmethod
+    def _restore_creation_times(cls, times: Dict[Path, Tuple[int, int]]):
+        """
+        Restore file creation times on macOS
+        
+        Uses setattrlist() directly when available, otherwise one touch command
+        per distinct timestamp (touch lowers the birth time to the given time).
+        
+        Args:
+            times: Dictionary mapping filepath to (creation_time, modification_time) tuple, in nanoseconds
+        """
+        by_timestamp: Dict[str, List[str]] = {}
+        for filepath, (creation_time, _) in times.items():
+            seconds, nanoseconds = divmod(creation_time, 1_000_000_000)
+            if _SETATTRLIST is not None:
+                attrs = _AttrList(bitmapcount=_ATTR_BIT_MAP_COUNT, commonattr=_ATTR_CMN_CRTIME)
+                crtime = _Timespec(seconds, nanoseconds)
+                if _SETATTRLIST(os.fsencode(filepath), ctypes.byref(attrs), ctypes.byref(crtime), ctypes.sizeof(crtime), 0) == 0:
+                    continue
+            timestamp_str = datetime.fromtimestamp(seconds).strftime('%Y%m%d%H%M.%S')
+            by_timestamp.setdefault(timestamp_str, []).append(str(filepath))
+        
+        for timestamp_str, paths in by_timestamp.items():
             try:
-                if platform.system() == 'Darwin' and hasattr(os.stat(filepath), 'st_birthtime'):
-                    # Use touch command with -t flag to set both times
-                    # This preserves the birth time on macOS
-                    import datetime
-                    dt = datetime.datetime.fromtimestamp(creation_time)
-                    timestamp_str = dt.strftime('%Y%m%d%H%M.%S')
-                    subprocess.run(
-                        ['touch', '-t', timestamp_str, str(filepath)],
-                        capture_output=True,
-                        timeout=5
-                    )
+                subprocess.run(
+                    ['touch', '-t', timestamp_str, *paths],
+                    capture_output=True,
+                    timeout=30
+                )
             except Exception:
                 pass  # If it fails, at least we tried to preserve times
     
+    # Above this number of files, one-shot processes get paths in an argument file (avoids command line length limits)
+    ARGFILE_THRESHOLD = 100
+    
+    @staticmethod
+    def _write_argfile(args: List[str]) -> str:
+        """
+        Write ExifTool arguments to a temporary -@ argument file, one per line
+        
+        Args:
+            args: Arguments (must not contain newlines)
+            
+        Returns:
+            Path of the argument file, to be deleted by the caller
+        """
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.args', delete=False) as argfile:
+            argfile.write('\n'.join(args) + '\n')
+        return argfile.name
+    
+    @classmethod
+    def _run_on_files(cls, cmd: List[str], filepaths: List[Path], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Run an ExifTool command on files
+        
+        Commands go through the shared persistent ExifTool process. Arguments
+        containing newlines cannot be sent to it and fall back to a one-shot process.
+        
+        Args:
+            cmd: ExifTool options (without the exiftool executable)
+            filepaths: Files to process
+            timeout: Timeout in seconds
+            
+        Returns:
+            Completed process, with bytes output. Return code is 1 when ExifTool reported an error.
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command did not complete in time
+        """
+        path_strs = list(map(os.fspath, filepaths))
+        if any('\n' in arg for arg in cmd):
+            return cls._run_process(cmd, path_strs, timeout)
+        
+        stdout, stderr = cls.get_daemon().execute([*cmd, *path_strs], timeout)
+        # The persistent process has no exit status, errors are reported on stderr
+        failed = any(line.startswith(b'Error') for line in stderr.splitlines())
+        return subprocess.CompletedProcess(cmd, 1 if failed else 0, stdout, stderr)
+    
+    @classmethod
+    def _run_process(cls, cmd: List[str], path_strs: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Run an ExifTool command in a new process
+        
+        Args:
+            cmd: ExifTool options (without the exiftool executable)
+            path_strs: Files to process, passed through an argument file when there are many
+            timeout: Timeout in seconds
+            
+        Returns:
+            Completed process, with bytes output
+        """
+        cmd = [cls.get_exiftool_path(), *cmd]
+        if len(path_strs) <= cls.ARGFILE_THRESHOLD:
+            return subprocess.run([*cmd, *path_strs], capture_output=True, timeout=timeout)
+        
+        argfile_path = cls._write_argfile(path_strs)
+        try:
+            return subprocess.run([*cmd, '-@', argfile_path], capture_output=True, timeout=timeout)
+        finally:
+            try:
+                os.unlink(argfile_path)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _build_tag_args(metadata: Dict[str, Any], overwrite: bool) -> List[str]:
+        """
+        Build ExifTool tag assignment arguments
+        
+        Args:
+            metadata: Dictionary of metadata tags and values to write (None/empty values are skipped)
+            overwrite: If True, use -TAG=VALUE (overwrites), else -TAG<=VALUE (only if empty)
+            
+        Returns:
+            List of ExifTool arguments
+        """
+        # Format: -TagName=value (overwrites) or -TagName<=value (only if empty)
+        # The <= operator requires the tag and value to be in one argument
+        operator = '=' if overwrite else '<='
+        return [f'-{tag}{operator}{value}' for tag, value in metadata.items() if value not in (None, "")]
+    
     @classmethod
     def write_metadata(
         cls,
@@ -209,8 +700,7 @@ class ExifToolService:
         
         try:
             # Build ExifTool command
-            exiftool = cls.get_exiftool_path()
-            cmd = [exiftool]
+            cmd = []
             
             # Set IPTC charset to UTF-8 for proper Unicode handling
             cmd.extend(['-charset', 'iptc=utf8'])
@@ -220,33 +710,18 @@ class ExifToolService:
             if not app_settings.get('exiftool_create_backups', True):
                 cmd.append('-overwrite_original')
             
+            # ExifTool keeps the file modification date itself
+            if preserve_file_dates:
+                cmd.append('-P')
+            
             # Add each metadata tag
-            for tag, value in metadata.items():
-                if value is not None and value != "":
-                    # Convert value to string to ensure proper handling
-                    value_str = str(value)
-                    # Format: -TagName=value (overwrites) or -TagName<=value (only if empty)
-                    if overwrite:
-                        # For overwrite, use -TAG=VALUE format
-                        cmd.append(f'-{tag}={value_str}')
-                    else:
-                        # For conditional write, use separate -TAG and -TAG<=VALUE format
-                        # The <= operator requires the tag and value to be in one argument
-                        # but we need to ensure the value is treated as part of the same argument
-                        cmd.append(f'-{tag}<={value_str}')
-            
-            # Add file paths
-            cmd.extend([str(fp) for fp in filepaths])
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            cmd.extend(cls._build_tag_args(metadata, overwrite))
+            
+            # Add file paths and run
+            result = cls._run_on_files(cmd, filepaths, timeout=30)
             
             if result.returncode != 0:
-                raise ExifToolError(f"ExifTool write failed: {result.stderr}")
+                raise ExifToolError(f"ExifTool write failed: {result.stderr.decode('utf-8', 'replace')}")
             
             # Restore original file times if requested
             if preserve_file_dates and original_times:
@@ -262,6 +737,94 @@ class ExifToolService:
         except Exception as e:
             raise ExifToolError(f"Error writing metadata: {e}")
     
+    @classmethod
+    def write_metadata_batch(
+        cls,
+        writes: List[Tuple[List[Path], Dict[str, Any]]],
+        overwrite: bool = True,
+        preserve_file_dates: bool = True
+    ) -> bool:
+        """
+        Write different metadata to several groups of files with the persistent ExifTool process
+        
+        Each group becomes one command of the shared process, so no process is started per group.
+        Groups with identical metadata are merged into a single command.
+        
+        Args:
+            writes: List of (file paths, metadata) pairs, each file in one pair at most
+            overwrite: If True, overwrite existing metadata values (default: True).
+                      If False, only write to tags that don't already exist.
+            preserve_file_dates: If True, preserve file creation/modification dates (default: True)
+            
+        Returns:
+            True if successful, False otherwise
+            
+        Raises:
+            ExifToolError: If writing metadata fails
+        """
+        # Merge groups writing the same metadata (e.g. same values for all images)
+        merged: List[Tuple[List[Path], Dict[str, Any]]] = []
+        for filepaths, metadata in writes:
+            if not filepaths:
+                continue
+            for group_paths, group_metadata in merged:
+                if group_metadata == metadata:
+                    group_paths.extend(filepaths)
+                    break
+            else:
+                merged.append((list(filepaths), metadata))
+        writes = merged
+        if not writes:
+            return True
+        if len(writes) == 1:
+            return cls.write_metadata(writes[0][0], writes[0][1], overwrite, preserve_file_dates)
+        
+        # Save original file times of all files at once if requested
+        original_times = None
+        if preserve_file_dates:
+            original_times = cls._preserve_file_times([fp for filepaths, _ in writes for fp in filepaths])
+        
+        try:
+            # Options shared by every command
+            common_args = ['-charset', 'iptc=utf8']
+            
+            # Check if backups are disabled
+            app_settings = Config.get_app_settings()
+            if not app_settings.get('exiftool_create_backups', True):
+                common_args.append('-overwrite_original')
+            
+            # ExifTool keeps the file modification date itself
+            if preserve_file_dates:
+                common_args.append('-P')
+            
+            # Run every group, then report all failures at once
+            errors = []
+            for filepaths, metadata in writes:
+                result = cls._run_on_files(
+                    [*common_args, *cls._build_tag_args(metadata, overwrite)],
+                    filepaths,
+                    timeout=30
+                )
+                if result.returncode != 0:
+                    errors.append(result.stderr.decode('utf-8', 'replace').strip())
+            
+            if errors:
+                raise ExifToolError("ExifTool write failed: " + '\n'.join(errors))
+            
+            # Restore original file times if requested
+            if preserve_file_dates and original_times:
+                cls._restore_file_times(original_times)
+            
+            return True
+        
+        except ExifToolError:
+            # Re-raise ExifToolError unchanged to avoid double-wrapping
+            raise
+        except subprocess.TimeoutExpired:
+            raise ExifToolError("ExifTool write timed out")
+        except Exception as e:
+            raise ExifToolError(f"Error writing metadata: {e}")
+    
     @classmethod
     def get_all_tags(cls, filepath: Path) -> Dict[str, Any]:
         """
@@ -273,7 +836,7 @@ class ExifToolService:
         Returns:
             Dictionary of all metadata tags
         """
-        return cls.read_metadata(filepath)
+        return cls.read_metadata(filepath, fast=False)
     
     @classmethod
     def delete_tag(cls, filepaths: List[Path], tag: str, preserve_file_dates: bool = True) -> bool:
@@ -291,7 +854,25 @@ class ExifToolService:
         Raises:
             ExifToolError: If deletion fails
         """
-        if not filepaths:
+        return cls.delete_tags(filepaths, [tag], preserve_file_dates)
+    
+    @classmethod
+    def delete_tags(cls, filepaths: List[Path], tags: List[str], preserve_file_dates: bool = True) -> bool:
+        """
+        Delete several metadata tags from one or more files with a single ExifTool command
+        
+        Args:
+            filepaths: List of paths to image files
+            tags: Tag names to delete
+            preserve_file_dates: If True, preserve file creation/modification dates (default: True)
+            
+        Returns:
+            True if successful
+            
+        Raises:
+            ExifToolError: If deletion fails
+        """
+        if not filepaths or not tags:
             return True
         
         # Save original file times if requested
@@ -300,8 +881,7 @@ class ExifToolService:
             original_times = cls._preserve_file_times(filepaths)
         
         try:
-            exiftool = cls.get_exiftool_path()
-            cmd = [exiftool]
+            cmd = []
             
             # Set IPTC charset to UTF-8 for proper Unicode handling
             cmd.extend(['-charset', 'iptc=utf8'])
@@ -311,18 +891,16 @@ class ExifToolService:
             if not app_settings.get('exiftool_create_backups', True):
                 cmd.append('-overwrite_original')
             
-            cmd.append(f'-{tag}=')
-            cmd.extend([str(fp) for fp in filepaths])
+            # ExifTool keeps the file modification date itself
+            if preserve_file_dates:
+                cmd.append('-P')
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            cmd.extend(f'-{tag}=' for tag in tags)
+            # Add file paths and run
+            result = cls._run_on_files(cmd, filepaths, timeout=30)
             
             if result.returncode != 0:
-                raise ExifToolError(f"ExifTool delete failed: {result.stderr}")
+                raise ExifToolError(f"ExifTool delete failed: {result.stderr.decode('utf-8', 'replace')}")
             
             # Restore original file times if requested
             if preserve_file_dates and original_times:
@@ -336,7 +914,7 @@ class ExifToolService:
         except subprocess.TimeoutExpired:
             raise ExifToolError("ExifTool delete timed out")
         except Exception as e:
-            raise ExifToolError(f"Error deleting tag: {e}")
+            raise ExifToolError(f"Error deleting tags: {e}")
     
     @classmethod
     def repair_metadata(cls, filepaths: List[Path], preserve_file_dates: bool = True) -> bool:
@@ -365,8 +943,7 @@ class ExifToolService:
             original_times = cls._preserve_file_times(filepaths)
         
         try:
-            exiftool = cls.get_exiftool_path()
-            cmd = [exiftool]
+            cmd = []
             
             # Set IPTC charset to UTF-8 for proper Unicode handling
             cmd.extend(['-charset', 'iptc=utf8'])
@@ -376,6 +953,10 @@ class ExifToolService:
             if not app_settings.get('exiftool_create_backups', True):
                 cmd.append('-overwrite_original')
             
+            # ExifTool keeps the file modification date itself
+            if preserve_file_dates:
+                cmd.append('-P')
+            
             cmd.extend([
                 '-all=',  # Remove all metadata
                 '-tagsfromfile', '@',  # Copy from original
@@ -383,17 +964,11 @@ class ExifToolService:
                 '-unsafe',  # Allow unsafe tags
                 '-icc_profile'  # Preserve ICC profile
             ])
-            cmd.extend([str(fp) for fp in filepaths])
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60  # Longer timeout for repair operation
-            )
+            # Add file paths and run
+            result = cls._run_on_files(cmd, filepaths, timeout=60)  # Longer timeout for repair operation
             
             if result.returncode != 0:
-                raise ExifToolError(f"ExifTool repair failed: {result.stderr}")
+                raise ExifToolError(f"ExifTool repair failed: {result.stderr.decode('utf-8', 'replace')}")
             
             # Restore original file times if requested
             if preserve_file_dates and original_times:
@@ -453,8 +1028,7 @@ class ExifToolService:
             original_times = cls._preserve_file_times(filepaths)
 
         try:
-            exiftool = cls.get_exiftool_path()
-            cmd = [exiftool]
+            cmd = []
 
             # Set IPTC charset to UTF-8
             cmd.extend(['-charset', 'iptc=utf8'])
@@ -464,22 +1038,19 @@ class ExifToolService:
             if not app_settings.get('exiftool_create_backups', True):
                 cmd.append('-overwrite_original')
 
+            # ExifTool keeps the file modification date itself
+            if preserve_file_dates:
+                cmd.append('-P')
+
             # Add the date shift command
             # The shift value must be quoted to be treated as a single argument
             cmd.append(f'-AllDates{op_char}{shift_str}')
 
-            # Add file paths
-            cmd.extend([str(fp) for fp in filepaths])
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            # Add file paths and run
+            result = cls._run_on_files(cmd, filepaths, timeout=60)
 
             if result.returncode != 0:
-                raise ExifToolError(f"ExifTool date/time shift failed: {result.stderr}")
+                raise ExifToolError(f"ExifTool date/time shift failed: {result.stderr.decode('utf-8', 'replace')}")
 
             # Restore original file times if requested
             if preserve_file_dates and original_times:
@@ -0,0 +1,144 @@
+"""Persistent feature vector cache for photo similarity"""
+
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+
+class FeatureCache:
+    """Stores image feature vectors in SQLite, keyed by file fingerprint and model version"""
+
+    # Number of leading bytes hashed to fingerprint a file
+    HASH_CHUNK_SIZE = 65536
+
+    def __init__(self, db_path: Path, model_version: str):
+        """Initialize feature cache
+
+        Args:
+            db_path: Path to SQLite database file
+            model_version: Tag identifying the model that produced the vectors
+        """
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.model_version = model_version
+
+        # Writes are queued on a single background thread so inference is never blocked.
+        # They run in order, so waiting for the last one waits for all of them.
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        self._last_write: Optional[Future] = None
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS features (
+                file_key TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (file_key, model_version)
+            )
+        ''')
+        self._conn.commit()
+
+    @classmethod
+    def compute_key(cls, image_path: Path) -> Optional[str]:
+        """Compute the cache key of an image file
+
+        The key combines a hash of the first bytes of the file with its size and
+        modification time, so that edited files are invalidated cheaply.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Hex digest key or None if the file cannot be read
+        """
+        try:
+            stat = image_path.stat()
+            with open(image_path, 'rb') as f:
+                head = f.read(cls.HASH_CHUNK_SIZE)
+        except OSError:
+            return None
+
+        digest = hashlib.blake2b(head, digest_size=16)
+        digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Look up cached vectors
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Dictionary mapping found keys to float32 feature vectors
+        """
+        keys = list(keys)
+        results = {}
+
+        # Stay well below SQLite's bound parameter limit
+        chunk_size = 500
+        with self._lock:
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start:start + chunk_size]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT file_key, vector FROM features '
+                    f'WHERE model_version = ? AND file_key IN ({placeholders})',
+                    [self.model_version, *chunk]
+                ).fetchall()
+                for file_key, vector in rows:
+                    results[file_key] = np.frombuffer(vector, dtype=np.float16).astype(np.float32)
+
+        return results
+
+    def put_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        """Store vectors in the background (as float16 to halve storage)
+
+        Args:
+            vectors: Dictionary mapping cache keys to feature vectors
+        """
+        if not vectors:
+            return
+
+        rows = [
+            (key, self.model_version, np.asarray(vector, dtype=np.float16).tobytes())
+            for key, vector in vectors.items()
+        ]
+        self._last_write = self._writer.submit(self._write_rows, rows)
+
+    def _write_rows(self, rows) -> None:
+        """Write rows to the database (runs on the writer thread)"""
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO features (file_key, model_version, vector) VALUES (?, ?, ?)',
+                    rows
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not write feature cache: {e}")
+
+    def flush(self) -> None:
+        """Wait for all queued writes to complete"""
+        last_write, self._last_write = self._last_write, None
+        if last_write is not None:
+            last_write.result()
+
+    def close(self) -> None:
+        """Write queued vectors and close the database (the cache cannot be used afterwards)"""
+        self._writer.shutdown(wait=True)
+        self._last_write = None
+        with self._lock:
+            self._conn.close()
+
+    def clear(self) -> None:
+        """Remove all cached vectors"""
+        self.flush()
+        with self._lock:
+            self._conn.execute('DELETE FROM features')
+            self._conn.commit()
@@ -1,17 +1,43 @@
 """
 File Scanner - Discover and load images from a directory
 """
+import os
+import queue
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Dict, Any, Tuple, Callable, Iterator
 from ..models.image_model import ImageModel
 from .exiftool_service import ExifToolService, ExifToolError
+from ..core.utils import format_exif_datetime
 
 
 class FileScanner:
     """Scanner for discovering image files in a directory"""
     
     # Supported image extensions
-    SUPPORTED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.heif', '.heic', '.JPG', '.JPEG', '.PNG', '.HEIF', '.HEIC'}
+    SUPPORTED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.heif', '.heic'})  # lowercase, match with suffix.lower()
+    
+    # Metadata reads are split across up to this many ExifTool processes
+    MAX_READ_WORKERS = min(4, os.cpu_count() or 1)
+    
+    # Files read per ExifTool command, images are reported to the caller chunk by chunk
+    READ_CHUNK_SIZE = 64
+    
+    # Tags read at scan time (in all groups): what ImageModel.update_metadata and the
+    # file list actions use, instead of a full dump of every tag
+    SCAN_TAGS = [
+        'DateTimeOriginal', 'CreateDate', 'DateTimeDigitized', 'DateCreated',
+        'OffsetTime', 'OffsetTimeOriginal', 'OffsetTimeDigitized', 'TimeZoneOffset',
+        'Model', 'CameraModel', 'Orientation', 'UserComment',
+        'Country', 'CountryName', 'Country-PrimaryLocationName', 'CountryCode', 'Country-PrimaryLocationCode',
+        'City', 'Location', 'LocationName', 'Sub-location', 'Sublocation',
+        'GPSLatitude', 'GPSLongitude', 'GPSDateStamp', 'GPSTimeStamp', 'GPSDateTime',
+        'Headline', 'Keywords', 'Subject',
+    ]
+    
+    # Re-scan cache bound, the cache is reset to the last scanned directory beyond it
+    MAX_CACHED_IMAGES = 20000
     
     def __init__(self, exiftool_service: ExifToolService):
         """
@@ -21,6 +47,12 @@ class FileScanner:
             exiftool_service: ExifTool service instance for reading metadata
         """
         self.exiftool_service = exiftool_service
+        
+        # Images of previous scans: file path -> (file fingerprint, image model)
+        self._cache: Dict[str, Tuple[tuple, ImageModel]] = {}
+        
+        # Warnings raised by the last scan
+        self.warnings: List[str] = []
     
     @staticmethod
     def get_parent_directory(filepath: Path) -> Path:
@@ -35,62 +67,226 @@ class FileScanner:
         """
         return filepath.parent
     
-    def scan_directory(self, directory: Path) -> List[ImageModel]:
+    def _iter_metadata(
+        self,
+        file_paths: List[Path],
+        is_cancelled: Callable[[], bool]
+    ) -> Iterator[Tuple[int, List[Optional[Dict[str, Any]]], Optional[str]]]:
+        """
+        Read metadata of many files in chunks, on several ExifTool processes in parallel
+        
+        Args:
+            file_paths: List of image file paths
+            is_cancelled: Callback telling whether to stop, chunks not started yet are then
+                          skipped (the caller stops iterating)
+            
+        Yields:
+            Tuples (index of the first file of the chunk, metadata dictionaries of
+            the chunk files with None for files that could not be read, error
+            message if the whole chunk failed), in completion order
+        """
+        chunk_size = self.READ_CHUNK_SIZE
+        starts = range(0, len(file_paths), chunk_size)
+        workers = max(1, min(self.MAX_READ_WORKERS, len(starts)))
+        
+        # Each chunk is read on a free ExifTool process slot
+        slots = queue.SimpleQueue()
+        for slot in range(workers):
+            slots.put(slot)
+        
+        def read_chunk(start: int):
+            chunk = file_paths[start:start + chunk_size]
+            if is_cancelled():
+                return start, [None] * len(chunk), None
+            slot = slots.get()
+            try:
+                return start, self.exiftool_service.read_metadata_batch(chunk, slot, tags=self.SCAN_TAGS), None
+            except ExifToolError as e:
+                return start, [None] * len(chunk), str(e)
+            finally:
+                slots.put(slot)
+        
+        if workers == 1:
+            for start in starts:
+                yield read_chunk(start)
+            return
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(read_chunk, start) for start in starts]
+            for future in as_completed(futures):
+                yield future.result()
+    
+    def scan_directory(
+        self,
+        directory: Path,
+        on_images: Optional[Callable[[List[ImageModel]], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> List[ImageModel]:
         """
         Scan a directory for image files and load their metadata
         
         Args:
             directory: Path to the directory to scan
+            on_images: Optional callback receiving images as soon as they are loaded,
+                       one group at a time and not in file order
+            is_cancelled: Optional callback telling whether to stop, checked between
+                          metadata chunks (the images loaded so far are returned)
             
         Returns:
-            List of ImageModel objects with metadata
+            List of ImageModel objects with metadata, in file name order
+            (problems met are kept in self.warnings)
         """
-        images = []
+        # Warnings are collected and printed at once rather than per file
+        self.warnings = warnings = []
         
         if not directory.exists() or not directory.is_dir():
-            return images
-        
-        # Find all image files
-        for file_path in sorted(directory.iterdir()):
-            if file_path.is_file() and file_path.suffix in self.SUPPORTED_EXTENSIONS:
-                try:
-                    # Create image model with basic file info
-                    image = ImageModel.from_file(file_path)
-                    
-                    # Load metadata using ExifTool
-                    try:
-                        metadata = self.exiftool_service.read_metadata(file_path)
-                        image.update_metadata(metadata)
-                        
-                        # Auto-write Created Date if it was set from Taken Date
-                        if image.taken_date and not metadata.get('EXIF:CreateDate'):
-                            try:
-                                created_date_str = image.taken_date.strftime('%Y:%m:%d %H:%M:%S')
-                                # Concatenate timezone offset to XMP tag if available
-                                tz_offset = image.tz_offset or ""
-                                xmp_date_str = created_date_str + tz_offset if tz_offset else created_date_str
-                                self.exiftool_service.write_metadata(
-                                    [file_path],
-                                    {
-                                        'EXIF:CreateDate': created_date_str,
-                                        'XMP-exif:DateTimeDigitized': xmp_date_str
-                                    }
-                                )
-                            except ExifToolError:
-                                # Silently ignore if write fails
-                                pass
-                        
-                    except ExifToolError as e:
-                        # Continue even if metadata reading fails
-                        print(f"Warning: Could not read metadata for {file_path.name}: {e}")
-                    
-                    images.append(image)
-                    
-                except Exception as e:
-                    print(f"Warning: Could not process {file_path.name}: {e}")
-                    continue
-        
-        return images
+            return []
+        
+        # Find all image files, in a single directory pass (DirEntry caches is_file/stat results)
+        with os.scandir(directory) as it:
+            entries = [
+                entry for entry in it
+                if os.path.splitext(entry.name)[1].lower() in self.SUPPORTED_EXTENSIONS and entry.is_file()
+            ]
+        entries.sort(key=lambda entry: entry.name)
+        
+        # Files unchanged since a previous scan reuse their image model, the others are read
+        fingerprints = [self._fingerprint(entry) for entry in entries]
+        images_by_index = [self._get_cached(entry.path, fingerprint) for entry, fingerprint in zip(entries, fingerprints)]
+        read_indexes = [index for index, image in enumerate(images_by_index) if image is None]
+        
+        cached_images = [image for image in images_by_index if image is not None]
+        if on_images and cached_images:
+            on_images(cached_images)
+        
+        # Created Date auto-writes, grouped by identical values: (CreateDate, DateTimeDigitized) -> files
+        pending_writes = defaultdict(list)
+        
+        # Load metadata of all files to read, batched ExifTool commands running in parallel
+        file_paths = [Path(entries[index].path) for index in read_indexes]
+        is_cancelled = is_cancelled or (lambda: False)
+        for start, metadata_list, error in self._iter_metadata(file_paths, is_cancelled):
+            if is_cancelled():
+                break
+            if error:
+                warnings.append(f"Could not read metadata in {directory}: {error}")
+            
+            chunk_images = []
+            for index, metadata in zip(read_indexes[start:start + len(metadata_list)], metadata_list):
+                image = self._create_image(entries[index], fingerprints[index], metadata, pending_writes)
+                if image is not None:
+                    images_by_index[index] = image
+                    chunk_images.append(image)
+            
+            if on_images and chunk_images:
+                on_images(chunk_images)
+        
+        # One write per distinct value rather than one per file, all in a single ExifTool process
+        try:
+            self.exiftool_service.write_metadata_batch([
+                (
+                    paths,
+                    {
+                        'EXIF:CreateDate': created_date_str,
+                        'XMP-exif:DateTimeDigitized': xmp_date_str
+                    }
+                )
+                for (created_date_str, xmp_date_str), paths in pending_writes.items()
+            ])
+        except ExifToolError:
+            # Silently ignore if write fails
+            pass
+        
+        if warnings:
+            print('\n'.join(f"Warning: {warning}" for warning in warnings))
+        
+        if len(self._cache) > self.MAX_CACHED_IMAGES:
+            current = {entry.path for entry in entries}
+            self._cache = {path: cached for path, cached in self._cache.items() if path in current}
+        
+        return [image for image in images_by_index if image is not None]
+    
+    def _create_image(
+        self,
+        entry: os.DirEntry,
+        fingerprint: tuple,
+        metadata: Optional[Dict[str, Any]],
+        pending_writes: Dict[Tuple[str, str], List[Path]]
+    ) -> Optional[ImageModel]:
+        """
+        Create the image model of a scanned file
+        
+        Args:
+            entry: Directory entry of the file
+            fingerprint: File fingerprint (see _fingerprint)
+            metadata: Metadata read from the file, None if it could not be read
+            pending_writes: Created Date writes to add the file to, by value
+            
+        Returns:
+            Image model or None if the file could not be processed
+        """
+        file_path = Path(entry.path)
+        try:
+            # Create image model with basic file info
+            image = ImageModel.from_file(file_path, entry.stat())
+            
+            if metadata is not None:
+                image.update_metadata(metadata)
+                self._cache[entry.path] = (fingerprint, image)
+                
+                # Auto-write Created Date if it was set from Taken Date
+                if image.taken_date and not metadata.get('EXIF:CreateDate'):
+                    created_date_str = format_exif_datetime(image.taken_date)
+                    # Concatenate timezone offset to XMP tag if available
+                    tz_offset = image.tz_offset or ""
+                    xmp_date_str = created_date_str + tz_offset if tz_offset else created_date_str
+                    pending_writes[(created_date_str, xmp_date_str)].append(file_path)
+            else:
+                # Continue even if metadata reading fails
+                self.warnings.append(f"Could not read metadata for {file_path.name}")
+            
+            return image
+        
+        except Exception as e:
+            self.warnings.append(f"Could not process {file_path.name}: {e}")
+            return None
+    
+    @staticmethod
+    def _fingerprint(entry: os.DirEntry) -> tuple:
+        """
+        Identify a file version from its directory entry
+        
+        The change time is included as metadata writes keep the modification
+        time (ExifTool -P).
+        
+        Args:
+            entry: Directory entry of the file
+            
+        Returns:
+            Tuple (inode, size, mtime_ns, ctime_ns)
+        """
+        stat = entry.stat()
+        return (entry.inode(), stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+    
+    def _get_cached(self, path: str, fingerprint: tuple) -> Optional[ImageModel]:
+        """
+        Get the image model of a previous scan if the file did not change since
+        
+        Args:
+            path: File path
+            fingerprint: Current file fingerprint (see _fingerprint)
+            
+        Returns:
+            Cached image model or None
+        """
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        return None
+    
+    def clear_cache(self):
+        """Forget the images of previous scans"""
+        self._cache.clear()
     
     @staticmethod
     def is_supported_image(filepath: Path) -> bool:
@@ -103,7 +299,7 @@ class FileScanner:
         Returns:
             True if the file is a supported image format
         """
-        return filepath.suffix in FileScanner.SUPPORTED_EXTENSIONS
+        return filepath.suffix.lower() in FileScanner.SUPPORTED_EXTENSIONS
     
     def scan_from_file(self, filepath: Path) -> List[ImageModel]:
         """
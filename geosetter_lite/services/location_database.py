@@ -1,9 +1,12 @@
 """Location database management for geolocation predictions"""
 
+import os
 import sqlite3
 import csv
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
 
 
 class LocationDatabase:
@@ -138,6 +141,75 @@ class LocationDatabase:
         
         return locations
     
+    def get_embeddings_path(self, model_tag: str) -> Path:
+        """Get path of the precomputed embeddings file for a model
+        
+        Args:
+            model_tag: Tag identifying the model (and prompt) producing the embeddings
+            
+        Returns:
+            Path to the .npy embeddings file, next to the database
+        """
+        return self.db_path.with_name(f"locations_{model_tag}.npy")
+    
+    def load_embeddings(self, model_tag: str) -> Optional[np.ndarray]:
+        """Load precomputed location embeddings (memory-mapped)
+        
+        Args:
+            model_tag: Tag identifying the model (and prompt) producing the embeddings
+            
+        Returns:
+            Structured array with 'lat', 'lon' and 'emb' fields, or None if the
+            embeddings were not built yet or are older than the database
+        """
+        path = self.get_embeddings_path(model_tag)
+        try:
+            if path.stat().st_mtime < self.db_path.stat().st_mtime:
+                return None
+            return np.load(path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+    
+    def build_embeddings(
+        self,
+        model_tag: str,
+        encode_texts: Callable[[List[str]], np.ndarray],
+        batch_size: int = 256
+    ) -> np.ndarray:
+        """Compute embeddings of all location descriptions and store them on disk
+        
+        Args:
+            model_tag: Tag identifying the model (and prompt) producing the embeddings
+            encode_texts: Callable encoding a list of descriptions to an NxD array
+            batch_size: Number of descriptions encoded per call
+            
+        Returns:
+            Memory-mapped structured array with 'lat', 'lon' and 'emb' (float16) fields
+        """
+        locations = self.get_all_locations()
+        
+        embeddings = []
+        for start in range(0, len(locations), batch_size):
+            descriptions = [desc for _, _, desc in locations[start:start + batch_size]]
+            embeddings.append(np.asarray(encode_texts(descriptions), dtype=np.float16))
+        embeddings = np.concatenate(embeddings)
+        
+        dtype = np.dtype([('lat', '<f4'), ('lon', '<f4'), ('emb', '<f2', (embeddings.shape[1],))])
+        records = np.empty(len(locations), dtype=dtype)
+        records['lat'] = [lat for lat, _, _ in locations]
+        records['lon'] = [lon for _, lon, _ in locations]
+        records['emb'] = embeddings
+        
+        # Write to a temporary file first so that a partial file is never loaded
+        path = self.get_embeddings_path(model_tag)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.save(f, records)
+        os.replace(tmp_path, path)
+        
+        print(f"Location embeddings saved to {path.name}")
+        return np.load(path, mmap_mode='r')
+    
     def get_location_count(self) -> int:
         """Get total number of locations in database
         
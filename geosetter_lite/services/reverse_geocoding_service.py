@@ -1,9 +1,13 @@
 """
 Reverse Geocoding Service - Convert GPS coordinates to location information
 """
+import json
 import requests
+import sqlite3
+import threading
 import time
 import random
+from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
@@ -54,6 +58,13 @@ ISO_ALPHA2_TO_ALPHA3 = {
 class ReverseGeocodingService:
     """Service for reverse geocoding using Nominatim OpenStreetMap API"""
     
+    # Responses are cached on disk, shared by all instances
+    DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'geosetter_lite' / 'reverse_geocoding.db'
+    
+    # Coordinates are rounded to this many decimals for cache lookups (about 1 m),
+    # far below the city level resolution of the requests
+    CACHE_PRECISION = 5
+    
     @staticmethod
     def get_country_code_alpha3(country_code_alpha2: str) -> Optional[str]:
         """
@@ -87,11 +98,70 @@ class ReverseGeocodingService:
             return country_name
         return country_name
     
-    def __init__(self):
-        """Initialize the reverse geocoding service"""
+    def __init__(self, cache_path: Optional[Path] = None):
+        """
+        Initialize the reverse geocoding service
+        
+        Args:
+            cache_path: SQLite file caching the API responses (default: DEFAULT_CACHE_PATH)
+        """
         self.base_url = "https://nominatim.openstreetmap.org/reverse"
         self.user_agent = "ImageGeoSetterLite/1.0"
         self.timeout = 10  # seconds
+        
+        # Response cache, geocoding works without it if it cannot be opened
+        self._cache_lock = threading.Lock()
+        self._cache: Optional[sqlite3.Connection] = None
+        cache_path = cache_path or self.DEFAULT_CACHE_PATH
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache = sqlite3.connect(cache_path, check_same_thread=False)
+            self._cache.execute('CREATE TABLE IF NOT EXISTS geo (key TEXT PRIMARY KEY, json TEXT NOT NULL)')
+            self._cache.commit()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Could not open reverse geocoding cache: {e}")
+            self._cache = None
+    
+    def _cache_key(self, latitude: float, longitude: float) -> str:
+        """Cache key of coordinates, rounded to CACHE_PRECISION decimals"""
+        return f"{round(latitude, self.CACHE_PRECISION)},{round(longitude, self.CACHE_PRECISION)}"
+    
+    def _get_cached(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached API response
+        
+        Args:
+            key: Cache key (see _cache_key)
+            
+        Returns:
+            JSON response data or None if not cached
+        """
+        if self._cache is None:
+            return None
+        try:
+            with self._cache_lock:
+                row = self._cache.execute('SELECT json FROM geo WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not read reverse geocoding cache: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+    
+    def _put_cached(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        Store an API response in the cache
+        
+        Args:
+            key: Cache key (see _cache_key)
+            data: JSON response data
+        """
+        if self._cache is None:
+            return
+        try:
+            with self._cache_lock:
+                self._cache.execute('INSERT OR REPLACE INTO geo (key, json) VALUES (?, ?)', (key, json.dumps(data)))
+                self._cache.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not write reverse geocoding cache: {e}")
     
     def reverse_geocode(self, latitude: float, longitude: float) -> Optional[GeocodingResult]:
         """
@@ -104,6 +174,12 @@ class ReverseGeocodingService:
         Returns:
             GeocodingResult with location information or None if request fails
         """
+        # Photos taken at the same place are only looked up once
+        cache_key = self._cache_key(latitude, longitude)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return self._parse_response(cached)
+        
         max_attempts = 2
         base_delay = 2.0
         max_delay = 10.0
@@ -132,6 +208,7 @@ class ReverseGeocodingService:
 
                 if response.status_code == 200:
                     data = response.json()
+                    self._put_cached(cache_key, data)
                     return self._parse_response(data)
 
                 if response.status_code == 429:
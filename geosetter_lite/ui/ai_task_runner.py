@@ -0,0 +1,122 @@
+"""
+AI Task Runner - Runs AI computations off the GUI thread
+"""
+import threading
+from typing import Any, Callable
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+# Work function: work(report_progress(current, total), is_cancelled()) -> result
+AIWork = Callable[[Callable[[int, int], None], Callable[[], bool]], Any]
+
+
+class _AITask(QRunnable):
+    """Run one AI computation in a pool thread"""
+    
+    def __init__(self, runner: 'AITaskRunner', request_id: int, work: AIWork, cancelled: threading.Event):
+        """
+        Initialize the task
+        
+        Args:
+            runner: Runner notified of progress and results
+            request_id: Identifier of the request
+            work: Computation to run
+            cancelled: Event set when the request is cancelled
+        """
+        super().__init__()
+        self.runner = runner
+        self.request_id = request_id
+        self.work = work
+        self.cancelled = cancelled
+    
+    def run(self):
+        """Run the computation, reporting progress and result to the runner"""
+        def report_progress(current: int, total: int):
+            self.runner._progress.emit(self.request_id, current, total)
+        
+        try:
+            result = self.work(report_progress, self.cancelled.is_set)
+        except Exception as e:
+            print(f"Warning: AI task failed: {e}")
+            self.runner._failed.emit(self.request_id, str(e))
+            return
+        
+        self.runner._finished.emit(self.request_id, result)
+
+
+class AITaskRunner(QObject):
+    """Runs AI computations (model loading, inference) in a background thread
+    
+    The GUI thread keeps processing events while models load and images are
+    analyzed, progress and results are delivered through signals. Cancelled
+    requests are asked to stop through their is_cancelled callback, and their
+    results are discarded.
+    """
+    
+    progress = Signal(int, int)  # Progress of the latest request: current, total
+    finished = Signal(object)  # Result of the latest request
+    failed = Signal(str)  # Error message of the latest request
+    
+    # Internal signals emitted from the pool thread, prefixed with the request id
+    _progress = Signal(int, int, int)
+    _finished = Signal(int, object)
+    _failed = Signal(int, str)
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the runner
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._request_id = 0
+        self._cancelled = threading.Event()
+        
+        # Models are shared by all requests, run them one at a time
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        
+        # Results are delivered to the GUI thread (queued connections)
+        self._progress.connect(self._on_progress)
+        self._finished.connect(self._on_finished)
+        self._failed.connect(self._on_failed)
+    
+    def start(self, work: AIWork):
+        """
+        Run a computation, cancelling previous requests
+        
+        Args:
+            work: Function called in the background thread with a progress
+                  callback(current, total) and an is_cancelled() callback,
+                  returning the result
+        """
+        self.cancel()
+        self._cancelled = threading.Event()
+        self._pool.start(_AITask(self, self._request_id, work, self._cancelled))
+    
+    def cancel(self):
+        """Ask the running computation to stop and ignore its result"""
+        self._request_id += 1
+        self._cancelled.set()
+        self._pool.clear()
+    
+    def shutdown(self):
+        """Cancel requests and wait for the running computation to stop"""
+        self.cancel()
+        self._pool.waitForDone()
+    
+    def _on_progress(self, request_id: int, current: int, total: int):
+        """Forward progress unless the request was superseded"""
+        if request_id == self._request_id:
+            self.progress.emit(current, total)
+    
+    def _on_finished(self, request_id: int, result: Any):
+        """Forward a result unless the request was superseded"""
+        if request_id == self._request_id:
+            self.finished.emit(result)
+    
+    def _on_failed(self, request_id: int, message: str):
+        """Forward an error unless the request was superseded"""
+        if request_id == self._request_id:
+            self.failed.emit(message)
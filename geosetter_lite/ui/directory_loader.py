@@ -0,0 +1,113 @@
+"""
+Directory Loader - Scans image directories off the GUI thread
+"""
+import threading
+from pathlib import Path
+from typing import List
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from ..services.file_scanner import FileScanner
+
+
+class _ScanTask(QRunnable):
+    """Scan one directory in a pool thread"""
+    
+    def __init__(self, loader: 'DirectoryLoader', request_id: int, directory: Path, cancelled: threading.Event):
+        """
+        Initialize the task
+        
+        Args:
+            loader: Loader notified of the results
+            request_id: Identifier of the request
+            directory: Directory to scan
+            cancelled: Event set when the request is superseded
+        """
+        super().__init__()
+        self.loader = loader
+        self.request_id = request_id
+        self.directory = directory
+        self.cancelled = cancelled
+    
+    def run(self):
+        """Scan the directory, reporting images as they are loaded"""
+        scanner = self.loader.file_scanner
+        try:
+            images = scanner.scan_directory(
+                self.directory,
+                lambda chunk: self.loader._images_found.emit(self.request_id, chunk),
+                self.cancelled.is_set
+            )
+            warnings = list(scanner.warnings)
+        except Exception as e:
+            images, warnings = [], [f"Could not scan {self.directory}: {e}"]
+            print(f"Warning: {warnings[0]}")
+        
+        self.loader._finished.emit(self.request_id, images, warnings)
+
+
+class DirectoryLoader(QObject):
+    """Loads the images of a directory in a background thread
+    
+    Images are reported in groups while metadata is read, so the file list can
+    be filled progressively. A load superseded by a newer one stops after the
+    metadata chunk being read, and its results are discarded.
+    """
+    
+    images_found = Signal(list)  # Group of ImageModel loaded by the latest request
+    finished = Signal(list, list)  # All images in file name order, warnings
+    
+    # Internal signals emitted from the pool thread, prefixed with the request id
+    _images_found = Signal(int, list)
+    _finished = Signal(int, list, list)
+    
+    def __init__(self, file_scanner: FileScanner, parent=None):
+        """
+        Initialize the loader
+        
+        Args:
+            file_scanner: Scanner used for all loads (only used from the loader thread)
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.file_scanner = file_scanner
+        self._request_id = 0
+        self._cancelled = threading.Event()
+        
+        # Scans run one at a time, the scanner caches images across scans
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        
+        # Results are delivered to the GUI thread (queued connections)
+        self._images_found.connect(self._on_images_found)
+        self._finished.connect(self._on_finished)
+    
+    def load(self, directory: Path):
+        """
+        Load the images of a directory, superseding previous requests
+        
+        Args:
+            directory: Directory to scan
+        """
+        self.cancel()
+        self._cancelled = threading.Event()
+        self._pool.start(_ScanTask(self, self._request_id, directory, self._cancelled))
+    
+    def cancel(self):
+        """Drop pending loads, stop the running one and ignore its results"""
+        self._request_id += 1
+        self._cancelled.set()
+        self._pool.clear()
+    
+    def shutdown(self):
+        """Cancel loads and wait for the running one to stop"""
+        self.cancel()
+        self._pool.waitForDone()
+    
+    def _on_images_found(self, request_id: int, images: List):
+        """Forward loaded images unless the request was superseded"""
+        if request_id == self._request_id:
+            self.images_found.emit(images)
+    
+    def _on_finished(self, request_id: int, images: List, warnings: List[str]):
+        """Forward the end of a load unless the request was superseded"""
+        if request_id == self._request_id:
+            self.finished.emit(images, warnings)
@@ -8,9 +8,7 @@ from PySide6.QtWidgets import (
     QWidget, QMessageBox, QHeaderView
 )
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap
-from PIL import Image
-import io
+from PySide6.QtGui import QImage, QPixmap
 
 from ..services.reverse_geocoding_service import ReverseGeocodingService
 
@@ -209,21 +207,27 @@ class GeolocationDialog(QDialog):
         Returns:
             QPixmap with the thumbnail
         """
+        from PIL import Image
+        
         image = Image.open(image_path)
+        # Let the JPEG decoder scale down while decoding (before any full-size convert)
+        image.draft('RGB', (width, height))
         
         if image.mode != 'RGB':
             image = image.convert('RGB')
         
         image.thumbnail((width, height), Image.Resampling.LANCZOS)
         
-        buffer = io.BytesIO()
-        image.save(buffer, format='PNG')
-        buffer.seek(0)
-        
-        pixmap = QPixmap()
-        pixmap.loadFromData(buffer.read())
+        # Convert to QPixmap from the raw RGB pixels (the QImage keeps the bytes alive)
+        qimage = QImage(
+            image.tobytes('raw', 'RGB'),
+            image.width,
+            image.height,
+            3 * image.width,
+            QImage.Format.Format_RGB888
+        )
         
-        return pixmap
+        return QPixmap.fromImage(qimage)
     
     def _on_location_selected(self, checked):
         """Handle location selection"""
@@ -0,0 +1,155 @@
+"""
+Image Preview Loader - Decodes viewer previews off the GUI thread
+"""
+from pathlib import Path
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage
+
+
+# QImage format and bytes per pixel of the Pillow modes Qt can wrap without conversion
+_QIMAGE_FORMATS = {
+    'RGB': (QImage.Format.Format_RGB888, 3),
+    'RGBA': (QImage.Format.Format_RGBA8888, 4),
+    'L': (QImage.Format.Format_Grayscale8, 1),
+}
+
+
+class _PreviewTask(QRunnable):
+    """Decode one downscaled preview in a pool thread"""
+    
+    def __init__(
+        self,
+        loader: 'ImagePreviewLoader',
+        request_id: int,
+        filepath: Path,
+        max_size: int,
+        auto_rotate: bool,
+        resample: str
+    ):
+        """
+        Initialize the task
+        
+        Args:
+            loader: Loader notified of the result
+            request_id: Identifier of the request
+            filepath: Image file to decode
+            max_size: Maximum width and height of the preview in pixels
+            auto_rotate: Whether to apply the EXIF orientation
+            resample: Name of the Pillow resampling filter used to downscale
+        """
+        super().__init__()
+        self.loader = loader
+        self.request_id = request_id
+        self.filepath = filepath
+        self.max_size = max_size
+        self.auto_rotate = auto_rotate
+        self.resample = resample
+    
+    def run(self):
+        """Decode the preview and report it to the loader"""
+        from PIL import Image, ImageOps
+        
+        resample = getattr(Image.Resampling, str(self.resample).upper(), Image.Resampling.BILINEAR)
+        try:
+            with Image.open(self.filepath) as pil_image:
+                # Let the JPEG decoder scale down while decoding (no-op for other formats)
+                pil_image.draft('RGB', (self.max_size, self.max_size))
+                
+                if self.auto_rotate:
+                    pil_image = ImageOps.exif_transpose(pil_image)
+                
+                # Convert only the modes Qt cannot use as is (palette, CMYK, ...)
+                if pil_image.mode not in _QIMAGE_FORMATS:
+                    pil_image = pil_image.convert('RGB')
+                
+                pil_image.thumbnail((self.max_size, self.max_size), resample)
+                
+                # QImage is safe to build outside the GUI thread (QPixmap is not).
+                # It wraps the bytes without copying and keeps a reference to them
+                # until it is destroyed.
+                width, height = pil_image.size
+                qimage_format, bytes_per_pixel = _QIMAGE_FORMATS[pil_image.mode]
+                qimage = QImage(
+                    pil_image.tobytes(),
+                    width,
+                    height,
+                    bytes_per_pixel * width,
+                    qimage_format
+                )
+        except Exception as e:
+            self.loader._failed.emit(self.request_id, str(e))
+            return
+        
+        self.loader._loaded.emit(self.request_id, qimage)
+
+
+class ImagePreviewLoader(QObject):
+    """Loads image previews in a background thread, keeping only the latest request
+    
+    Pending requests are dropped when a new one is made, and results of requests
+    that were superseded while decoding are discarded, so quickly moving through
+    the image list only decodes the image that ends up selected.
+    """
+    
+    loaded = Signal(QImage)  # Preview of the latest request
+    failed = Signal(str)  # Error message of the latest request
+    
+    # Internal signals emitted from pool threads: (request id, result)
+    _loaded = Signal(int, QImage)
+    _failed = Signal(int, str)
+    
+    # Downscaling filter: at screen size, bilinear looks like Lanczos for a fraction of the cost
+    DEFAULT_RESAMPLE = 'bilinear'
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the loader
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._request_id = 0
+        
+        # A single decoding thread: requests are superseded rather than run in parallel
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        
+        # Results are delivered to the GUI thread (queued connections)
+        self._loaded.connect(self._on_loaded)
+        self._failed.connect(self._on_failed)
+    
+    def request(self, filepath: Path, max_size: int, auto_rotate: bool = False, resample: str = DEFAULT_RESAMPLE):
+        """
+        Request the preview of an image, superseding previous requests
+        
+        Args:
+            filepath: Image file to decode
+            max_size: Maximum width and height of the preview in pixels
+            auto_rotate: Whether to apply the EXIF orientation (default: False)
+            resample: Pillow resampling filter name, e.g. 'bilinear', 'bicubic' or 'lanczos'
+                      (unknown names fall back to bilinear)
+        """
+        self._request_id += 1
+        self._pool.clear()
+        self._pool.start(_PreviewTask(self, self._request_id, filepath, max_size, auto_rotate, resample))
+    
+    def cancel(self):
+        """Drop pending requests and ignore the result of the running one"""
+        self._request_id += 1
+        self._pool.clear()
+    
+    def shutdown(self):
+        """Cancel requests and wait for the running decode to finish"""
+        self.cancel()
+        self._pool.waitForDone()
+    
+    def _on_loaded(self, request_id: int, qimage: QImage):
+        """Forward a decoded preview unless it was superseded"""
+        if request_id == self._request_id:
+            self.loaded.emit(qimage)
+    
+    def _on_failed(self, request_id: int, message: str):
+        """Forward a decoding error unless the request was superseded"""
+        if request_id == self._request_id:
+            self.failed.emit(message)
@@ -0,0 +1,243 @@
+"""
+Image Table Model - Model backing the main window image list
+"""
+from typing import Iterable, List, Optional
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from ..models.image_model import ImageModel
+
+
+class ImageTableModel(QAbstractTableModel):
+    """Table model exposing a list of ImageModel objects, one row per image
+    
+    Cell text is formatted on demand in data() and memoized on each ImageModel,
+    so the view only pays for the rows it displays, once per value. Sorting reorders the image list itself, which
+    keeps view rows and model rows identical.
+    """
+    
+    # Emitted when a cell is edited in place: (row, column, new text)
+    cell_edited = Signal(int, int, str)
+    
+    # Column attributes, in display order
+    COLUMNS = (
+        'filename',        # 0
+        'taken_date',      # 1
+        'tz_offset',       # 2
+        'gps_coordinates', # 3
+        'city',            # 4
+        'sublocation',     # 5
+        'headline',        # 6
+        'camera_model',    # 7
+        'size',            # 8
+        'gps_date',        # 9
+        'country',         # 10
+        'keywords',        # 11
+        'created_date',    # 12
+    )
+    
+    HEADERS = (
+        "Filename",
+        "Taken Date",
+        "TZ Offset",
+        "GPS Coordinates",
+        "City",
+        "Sublocation",
+        "Headline",
+        "Camera Model",
+        "Size",
+        "GPS Date",
+        "Country",
+        "Keywords",
+        "Created Date",
+    )
+    
+    # Filename can only be changed via the Rename dialog, size is not metadata
+    READ_ONLY_COLUMNS = frozenset({0, 8})
+    
+    # Item flags of each column, computed once
+    COLUMN_FLAGS = tuple(
+        Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        | (Qt.ItemFlag.NoItemFlags if read_only else Qt.ItemFlag.ItemIsEditable)
+        for read_only in map(READ_ONLY_COLUMNS.__contains__, range(len(COLUMNS)))
+    )
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the model
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.images: List[ImageModel] = []
+        
+        # Last sort requested by the view, re-applied when images are replaced
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+    
+    def set_images(self, images: List[ImageModel]):
+        """
+        Replace the images shown by the model
+        
+        The current sort order is applied within the reset, so views lay out
+        the new rows only once.
+        
+        Args:
+            images: List of images (kept by reference, reordered when sorting)
+        """
+        self.beginResetModel()
+        self.images = images
+        if 0 <= self._sort_column < len(self.COLUMNS):
+            self._sort_images(self._sort_column, self._sort_order)
+        self.endResetModel()
+    
+    def append_images(self, images: List[ImageModel]):
+        """
+        Add images at the end of the model, unsorted (see apply_sort)
+        
+        Args:
+            images: Images to add
+        """
+        if not images:
+            return
+        
+        first = len(self.images)
+        self.beginInsertRows(QModelIndex(), first, first + len(images) - 1)
+        self.images.extend(images)
+        self.endInsertRows()
+    
+    def apply_sort(self):
+        """Re-apply the last sort order requested by the view"""
+        self.sort(self._sort_column, self._sort_order)
+    
+    def image_at(self, row: int) -> Optional[ImageModel]:
+        """
+        Get the image displayed in a row
+        
+        Args:
+            row: Row index
+            
+        Returns:
+            ImageModel or None if the row is out of range
+        """
+        if 0 <= row < len(self.images):
+            return self.images[row]
+        return None
+    
+    def refresh_row(self, row: int):
+        """
+        Notify views that the image of a row changed
+        
+        Args:
+            row: Row index
+        """
+        if 0 <= row < len(self.images):
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+    
+    def refresh_rows(self, rows: Iterable[int]):
+        """
+        Notify views that the images of several rows changed
+        
+        A single change spanning all the rows is emitted, so views repaint once.
+        
+        Args:
+            rows: Row indexes
+        """
+        rows = [row for row in rows if 0 <= row < len(self.images)]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), len(self.COLUMNS) - 1))
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of images (flat table, no children)"""
+        if parent.isValid():
+            return 0
+        return len(self.images)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of columns (flat table, no children)"""
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        """Column titles for the horizontal header"""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            if 0 <= section < len(self.HEADERS):
+                return self.HEADERS[section]
+            return None
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Formatted cell text, or the ImageModel itself for UserRole"""
+        if not index.isValid():
+            return None
+        
+        image = self.images[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.display_text(image, index.column())
+        if role == Qt.ItemDataRole.UserRole:
+            return image
+        return None
+    
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """Route in-place edits to the cell_edited signal
+        
+        The model holds no text of its own: handlers update the ImageModel, and
+        the row is refreshed afterwards so that rejected edits are reverted.
+        """
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        
+        row = index.row()
+        self.cell_edited.emit(row, index.column(), str(value) if value is not None else "")
+        self.refresh_row(row)
+        return True
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """All columns are editable except filename and size"""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return self.COLUMN_FLAGS[index.column()]
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Sort images by the displayed text of a column"""
+        self._sort_column = column
+        self._sort_order = order
+        if not 0 <= column < len(self.COLUMNS):
+            return
+        
+        self.layoutAboutToBeChanged.emit()
+        
+        # Remember which image each persistent index (selection, current cell) points to
+        old_indexes = self.persistentIndexList()
+        old_images = [self.images[index.row()] for index in old_indexes]
+        
+        self._sort_images(column, order)
+        
+        new_rows = {id(image): row for row, image in enumerate(self.images)}
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_rows[id(image)], index.column()) for image, index in zip(old_images, old_indexes)]
+        )
+        
+        self.layoutChanged.emit()
+    
+    def _sort_images(self, column: int, order: Qt.SortOrder):
+        """Sort the image list in place by the displayed text of a column"""
+        self.images.sort(
+            key=lambda image: self.display_text(image, column),
+            reverse=order == Qt.SortOrder.DescendingOrder
+        )
+    
+    @classmethod
+    def display_text(cls, image: ImageModel, column: int) -> str:
+        """
+        Format one field of an image for display
+        
+        Args:
+            image: Image to format
+            column: Column index
+            
+        Returns:
+            Display string (empty when the field is not set)
+        """
+        return image.display_text(cls.COLUMNS[column])
@@ -1,29 +1,32 @@
 """
 Main Window - Image list and viewer
 """
+import os
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QTableWidget, QTableWidgetItem, QLabel, QScrollArea, QMenu,
+    QTableView, QAbstractItemView, QLabel, QScrollArea, QMenu,
     QHeaderView, QMessageBox, QDialog, QPushButton, QApplication
 )
-from PySide6.QtCore import Qt, Signal, QEvent, QSize, QPoint, QTimer
-from PySide6.QtGui import QPixmap, QAction, QImage, QKeyEvent, QIcon, QPainter, QColor, QPen
-from PIL import Image, ImageOps
-import io
+from PySide6.QtCore import Qt, Signal, QEvent, QSize, QPoint, QTimer, QModelIndex, QItemSelection, QItemSelectionModel
+from PySide6.QtGui import QPixmap, QPixmapCache, QAction, QImage, QKeyEvent, QIcon, QPainter, QColor, QPen
 from ..models.image_model import ImageModel
 from ..services.file_scanner import FileScanner
 from ..services.exiftool_service import ExifToolService
 from .metadata_editor import MetadataEditor
 from .map_panel import MapPanel
 from .table_delegates import CountryDelegate, DateTimeDelegate, TZOffsetDelegate
-from ..core.utils import format_date, format_file_size, format_gps_coordinates
+from .image_table_model import ImageTableModel
+from .image_preview_loader import ImagePreviewLoader
+from .directory_loader import DirectoryLoader
+from .ai_task_runner import AITaskRunner
 from ..services.reverse_geocoding_service import ReverseGeocodingService
 from .geocoding_dialog import GeocodingDialog
 from ..core.config import Config
+from ..core.utils import format_exif_date, format_exif_time, format_exif_datetime, parse_tz_offset
 from .settings_dialog import SettingsDialog
-from ..services.ai_service import AIService
 from .similarity_dialog import SimilarityDialog
 from .geolocation_dialog import GeolocationDialog
 from .progress_dialog import ProgressDialog
@@ -36,9 +39,86 @@ from .rotate_dialog import RotateDialog
 from .. import __version__
 
 
+# "lat, lon" with optional degree signs and N/S, E/W hemisphere suffixes
+_GPS_RE = re.compile(r'^\s*(-?\d+\.?\d*)°?\s*([NS])?\s*,\s*(-?\d+\.?\d*)°?\s*([EW])?\s*$')
+
+# Time zone offset such as "+05:00" or "-04:30"
+_TZ_RE = re.compile(r'^([+-])(\d{2}):(\d{2})$')
+
+# Tags written for the plain text fields, all set to the field value
+_TEXT_FIELD_TAGS = {
+    'city': ('IPTC:City', 'XMP-photoshop:City'),
+    'sublocation': ('IPTC:Sub-location', 'XMP-iptcCore:Location'),
+    'headline': ('IPTC:Headline', 'XMP-photoshop:Headline'),
+    'camera_model': ('EXIF:Model',),
+}
+
+# Columns edited in place through update_image_field, the field being the column attribute:
+# TZ Offset, City, Sublocation, Headline, Camera Model, Keywords
+_FIELD_EDIT_COLUMNS = frozenset({2, 4, 5, 6, 7, 11})
+
+# Country lookups, built once rather than for every updated image
+_COUNTRY_NAMES = dict(CountryDelegate.COUNTRY_LIST)  # code -> name
+_COUNTRY_CODES = {name: code for code, name in CountryDelegate.COUNTRY_LIST}  # name -> code
+_COUNTRY_CODES_LOWER = {name.lower(): code for name, code in _COUNTRY_CODES.items()}  # lowercase name -> code
+
+
+def _clear_gps_coordinates(image):
+    """Clear both GPS coordinates of an image"""
+    image.gps_latitude = None
+    image.gps_longitude = None
+
+
+def _clear_keywords(image):
+    """Clear the keywords of an image (empty list, never None)"""
+    image.keywords = []
+
+
+# Functions clearing the model field of a column, keyed by column_metadata_map field name
+# (other fields are simply set to None)
+_FIELD_CLEARERS = {
+    'gps_coordinates': _clear_gps_coordinates,
+    'keywords': _clear_keywords,
+}
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Delay before queued cell edits are written to the files
+    WRITE_DELAY_MS = 300
+    
+    # Delay without selection change before the preview of the selected image is decoded
+    PREVIEW_DELAY_MS = 100
+    
+    # Delay before map markers are rebuilt, so bursts of edits and selection changes update the map once
+    MAP_UPDATE_DELAY_MS = 150
+    
+    # Memory for decoded and scaled previews kept for reselection (QPixmapCache, in KB)
+    PREVIEW_CACHE_LIMIT_KB = 256 * 1024
+    
+    # Default widths of the table columns, in ImageTableModel.COLUMNS order
+    COLUMN_WIDTHS = (
+        200,  # Filename
+        150,  # Taken Date
+        100,  # TZ Offset
+        150,  # GPS Coordinates
+        120,  # City
+        120,  # Sublocation
+        150,  # Headline
+        120,  # Camera Model
+        80,   # Size
+        150,  # GPS Date
+        150,  # Country
+        200,  # Keywords
+        150,  # Created Date
+    )
+    
+    # Style sheets
+    H_SCROLLBAR_STYLE = "QScrollBar:horizontal { height: 15px; }"
+    V_SCROLLBAR_STYLE = "QScrollBar:vertical { width: 15px; }"
+    IMAGE_VIEWER_STYLE = "background-color: #2b2b2b; color: #888;"
+    
     def __init__(self, directory: Path, exiftool_service: ExifToolService):
         """
         Initialize the main window
@@ -50,19 +130,70 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.directory = directory
         self.exiftool_service = exiftool_service
+        # Kept across loads, it reuses the images of unchanged files
+        self.file_scanner = FileScanner(exiftool_service)
         self.images: List[ImageModel] = []
         self.current_image: Optional[ImageModel] = None
         self.current_pixmap: Optional[QPixmap] = None  # Store original pixmap for resizing
         self.reverse_geocoding_service = ReverseGeocodingService()
         
+        # Directories are scanned in the background, rows are added as images are read
+        self.directory_loader = DirectoryLoader(self.file_scanner, self)
+        self.directory_loader.images_found.connect(self._on_images_found)
+        self.directory_loader.finished.connect(self._on_images_loaded)
+        self._select_after_load: List[str] = []
+        
+        # AI tools run in the background while a progress dialog is shown (see _start_ai_task)
+        self.ai_runner = AITaskRunner(self)
+        self.ai_runner.progress.connect(self._on_ai_progress)
+        self.ai_runner.finished.connect(self._on_ai_finished)
+        self.ai_runner.failed.connect(self._on_ai_failed)
+        self._ai_task: Optional[tuple] = None  # (progress dialog, result handler, error message, cancel message)
+        
+        # Images of the last handled selection (see on_selection_changed)
+        self._last_selection: Optional[tuple] = None
+        
         # Timer for debouncing resize events
         self.resize_timer = QTimer()
         self.resize_timer.setSingleShot(True)
         self.resize_timer.timeout.connect(self._scale_and_display_image)
         
-        # Initialize AI service
-        ai_settings = Config.get_ai_settings()
-        self.ai_service = AIService(ai_settings['model_cache_dir'])
+        # Previews are decoded in the background, only the latest selection is shown
+        self.preview_loader = ImagePreviewLoader(self)
+        self.preview_loader.loaded.connect(self._on_preview_loaded)
+        self.preview_loader.failed.connect(self._on_preview_failed)
+        
+        # Previews are requested once the selection settles (see display_image)
+        self._pending_preview: Optional[tuple] = None
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(self.PREVIEW_DELAY_MS)
+        self.preview_timer.timeout.connect(self._request_preview)
+        
+        # Recently shown previews are kept in QPixmapCache, under keys identifying the file
+        # version (see _preview_cache_key): the requested preview and the one in current_pixmap
+        QPixmapCache.setCacheLimit(self.PREVIEW_CACHE_LIMIT_KB)
+        self._preview_key: Optional[str] = None
+        self._pixmap_key: Optional[str] = None
+        
+        # Cell edits are queued per file and written together shortly after the last edit
+        self._pending_writes: Dict[Path, Dict[str, Any]] = {}
+        self.write_timer = QTimer()
+        self.write_timer.setSingleShot(True)
+        self.write_timer.setInterval(self.WRITE_DELAY_MS)
+        self.write_timer.timeout.connect(self.flush_pending_writes)
+        
+        # Map markers are rebuilt once changes settle (see update_all_images_on_map)
+        self.map_update_timer = QTimer(self)
+        self.map_update_timer.setSingleShot(True)
+        self.map_update_timer.setInterval(self.MAP_UPDATE_DELAY_MS)
+        self.map_update_timer.timeout.connect(self._do_update_all_images_on_map)
+        
+        # AI service is created on first use of an AI tool (see ai_service property)
+        self._ai_service = None
+        
+        # Header context menu icon, painted on first use (see _show_header_context_menu)
+        self._recycle_bin_icon: Optional[QIcon] = None
         
         self.setWindowTitle(f"Image Metadata Viewer - {directory.name}")
         self.setMinimumSize(600, 400)
@@ -129,27 +260,15 @@ class MainWindow(QMainWindow):
         table_layout.addWidget(self.directory_toolbar)
         
         # Top-left panel - Image list table
-        self.table = QTableWidget()
-        self.table.setColumnCount(13)
-        self.table.setHorizontalHeaderLabels([
-            "Filename",           # 0
-            "Taken Date",        # 1
-            "TZ Offset",         # 2
-            "GPS Coordinates",   # 3
-            "City",              # 4
-            "Sublocation",       # 5
-            "Headline",          # 6
-            "Camera Model",      # 7
-            "Size",              # 8
-            "GPS Date",          # 9
-            "Country",           # 10
-            "Keywords",          # 11
-            "Created Date"       # 12
-        ])
+        # Cells are formatted lazily by the model, only for the rows Qt displays
+        self.table_model = ImageTableModel(self)
+        self.table_model.cell_edited.connect(self.on_item_changed)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         
         # Configure table
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.setAlternatingRowColors(True)
         self.table.setSortingEnabled(True)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -163,15 +282,14 @@ class MainWindow(QMainWindow):
         h_scrollbar = self.table.horizontalScrollBar()
         v_scrollbar = self.table.verticalScrollBar()
         if h_scrollbar:
-            h_scrollbar.setStyleSheet("QScrollBar:horizontal { height: 15px; }")
+            h_scrollbar.setStyleSheet(self.H_SCROLLBAR_STYLE)
         if v_scrollbar:
-            v_scrollbar.setStyleSheet("QScrollBar:vertical { width: 15px; }")
+            v_scrollbar.setStyleSheet(self.V_SCROLLBAR_STYLE)
         
         # Connect signals
-        self.table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
-        self.table.itemDoubleClicked.connect(self.on_table_double_click)
-        self.table.itemChanged.connect(self.on_item_changed)
+        self.table.doubleClicked.connect(self.on_table_double_click)
         
         # Install event filter to handle Delete/Backspace keys
         self.table.installEventFilter(self)
@@ -179,23 +297,11 @@ class MainWindow(QMainWindow):
         # Adjust column widths
         header = self.table.horizontalHeader()
         # All columns use Interactive mode (user can resize)
-        for i in range(0, 13):
-            header.setSectionResizeMode(i, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         
         # Set reasonable default widths for columns
-        self.table.setColumnWidth(0, 200)  # Filename
-        self.table.setColumnWidth(1, 150)  # Taken Date
-        self.table.setColumnWidth(2, 100)  # TZ Offset
-        self.table.setColumnWidth(3, 150)  # GPS Coordinates
-        self.table.setColumnWidth(4, 120)  # City
-        self.table.setColumnWidth(5, 120)  # Sublocation
-        self.table.setColumnWidth(6, 150)  # Headline
-        self.table.setColumnWidth(7, 120)  # Camera Model
-        self.table.setColumnWidth(8, 80)   # Size
-        self.table.setColumnWidth(9, 150)  # GPS Date
-        self.table.setColumnWidth(10, 150) # Country
-        self.table.setColumnWidth(11, 200) # Keywords
-        self.table.setColumnWidth(12, 150) # Created Date
+        for column, width in enumerate(self.COLUMN_WIDTHS):
+            self.table.setColumnWidth(column, width)
         
         # Set custom delegates for country column
         country_col = 10   # Country column index
@@ -223,7 +329,7 @@ class MainWindow(QMainWindow):
         # Bottom-left panel - Image viewer
         self.image_viewer = QLabel()
         self.image_viewer.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_viewer.setStyleSheet("background-color: #2b2b2b; color: #888;")
+        self.image_viewer.setStyleSheet(self.IMAGE_VIEWER_STYLE)
         self.image_viewer.setText("Select an image to view")
         self.image_viewer.setScaledContents(False)  # We'll handle scaling manually
         
@@ -350,9 +456,12 @@ class MainWindow(QMainWindow):
             )
             return
         
+        self.flush_pending_writes()
+        
         # Create and show rename dialog
         dialog = RenameDialog(self.images, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            QPixmapCache.clear()
             # Refresh the table to show updated filenames
             self.load_images()
             self.statusBar().showMessage(
@@ -370,8 +479,11 @@ class MainWindow(QMainWindow):
             )
             return
 
+        self.flush_pending_writes()
         dialog = RotateDialog(self.images, self.exiftool_service, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            # Rotated files may keep their dates, cached previews cannot be trusted
+            QPixmapCache.clear()
             self.reload_images()
             self.statusBar().showMessage(
                 f"Successfully rotated images",
@@ -380,8 +492,8 @@ class MainWindow(QMainWindow):
 
     def _date_time_shift(self):
         """Show the date/time shift dialog"""
-        selected_rows = self.table.selectionModel().selectedRows()
-        if not selected_rows:
+        selected_images = self._selected_images()
+        if not selected_images:
             QMessageBox.information(
                 self,
                 "No Images Selected",
@@ -397,17 +509,10 @@ class MainWindow(QMainWindow):
                 self.statusBar().showMessage("No time shift specified.", 3000)
                 return
 
-            selected_images = []
-            for row in selected_rows:
-                item = self.table.item(row.row(), 0)
-                if item:
-                    image = item.data(Qt.ItemDataRole.UserRole)
-                    if image:
-                        selected_images.append(image)
-            
-            filepaths = [img.filepath for img in selected_images]
+            filepaths = [img.filepath for _, img in selected_images]
 
             try:
+                self.flush_pending_writes()
                 self.exiftool_service.shift_date_time(filepaths, time_shift, operation)
                 self.statusBar().showMessage(f"Successfully shifted date/time for {len(filepaths)} images.", 5000)
                 self.reload_images()
@@ -419,23 +524,75 @@ class MainWindow(QMainWindow):
                     self
                 )
     
-    def load_images(self):
-        """Load images from the directory"""
+    def load_images(self, select_filenames: Optional[List[str]] = None):
+        """
+        Load images from the directory
+        
+        The directory is scanned in the background: rows are added as metadata
+        is read and the table is sorted once all images are loaded.
+        
+        Args:
+            select_filenames: Filenames of the images to select once loaded
+        """
         self.statusBar().showMessage("Loading images...")
         
-        # Create file scanner
-        scanner = FileScanner(self.exiftool_service)
+        # Make sure the scan sees all edits
+        self.flush_pending_writes()
         
-        # Scan directory
-        self.images = scanner.scan_directory(self.directory)
+        self._select_after_load = select_filenames or []
+        self._last_selection = None
+        self.images = []
+        self.table_model.set_images(self.images)
+        self.directory_loader.load(self.directory)
+    
+    def _on_images_found(self, images: List[ImageModel]):
+        """
+        Add a group of loaded images to the table
         
-        # Populate table
-        self.populate_table()
+        Args:
+            images: Images loaded by the current scan
+        """
+        self.table_model.append_images(images)
+        self.statusBar().showMessage(f"Loading images... ({len(self.images)})")
+    
+    def _on_images_loaded(self, images: List[ImageModel], warnings: List[str]):
+        """
+        Finish loading the directory
+        
+        Args:
+            images: All images of the directory, in file name order
+            warnings: Problems met while scanning
+        """
+        # Show the images in the current sort order (keeps selected rows selected)
+        self.table_model.apply_sort()
         
         # Update map with all images that have GPS coordinates
         self.update_all_images_on_map()
         
-        self.statusBar().showMessage(f"Loaded {len(self.images)} images")
+        # Restore selection, with a single selection change for all rows
+        if self._select_after_load:
+            selected_filenames = set(self._select_after_load)
+            self._select_after_load = []
+            rows = [row for row, image in enumerate(self.table_model.images) if image.filename in selected_filenames]
+            
+            # One selection range per run of consecutive rows
+            last_column = self.table_model.columnCount() - 1
+            selection = QItemSelection()
+            run_start = 0
+            for i, row in enumerate(rows):
+                if i + 1 == len(rows) or rows[i + 1] != row + 1:
+                    selection.select(self.table_model.index(rows[run_start], 0), self.table_model.index(row, last_column))
+                    run_start = i + 1
+            if not selection.isEmpty():
+                self.table.selectionModel().select(
+                    selection,
+                    QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows
+                )
+        
+        status = f"Loaded {len(images)} images"
+        if warnings:
+            status += f" ({len(warnings)} warnings, see console)"
+        self.statusBar().showMessage(status)
     
     def on_directory_changed(self, new_directory: Path):
         """
@@ -451,6 +608,9 @@ class MainWindow(QMainWindow):
         self.table.clearSelection()
         self.current_image = None
         self.current_pixmap = None
+        self._pixmap_key = None
+        self.preview_timer.stop()
+        self.preview_loader.cancel()
         self.image_viewer.clear()
         self.image_viewer.setText("Select an image to view")
         
@@ -458,135 +618,58 @@ class MainWindow(QMainWindow):
         self.load_images()
 
     
-    def populate_table(self):
-        """Populate the table with image data"""
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(len(self.images))
-        
-        # Block signals during table population to avoid triggering on_item_changed
-        self.table.blockSignals(True)
-        
-        for row, image in enumerate(self.images):
-            # Filename (0) - read-only, can only be changed via Rename dialog
-            filename_item = QTableWidgetItem(image.filename)
-            filename_item.setData(Qt.ItemDataRole.UserRole, image)
-            filename_item.setFlags(filename_item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Read-only
-            self.table.setItem(row, 0, filename_item)
-            
-            # Taken Date (1) - editable with date picker
-            taken_date_str = format_date(image.taken_date) if image.taken_date else ""
-            taken_date_item = QTableWidgetItem(taken_date_str)
-            taken_date_item.setFlags(taken_date_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 1, taken_date_item)
-            
-            # TZ Offset (2) - editable with dropdown
-            tz_offset_item = QTableWidgetItem(image.tz_offset or "")
-            tz_offset_item.setFlags(tz_offset_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 2, tz_offset_item)
-            
-            # GPS Coordinates (3) - editable
-            gps_item = QTableWidgetItem(
-                format_gps_coordinates(image.gps_latitude, image.gps_longitude)
-            )
-            gps_item.setFlags(gps_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 3, gps_item)
-            
-            # City (4) - editable
-            city_item = QTableWidgetItem(image.city or "")
-            city_item.setFlags(city_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 4, city_item)
-            
-            # Sublocation (5) - editable
-            sublocation_item = QTableWidgetItem(image.sublocation or "")
-            sublocation_item.setFlags(sublocation_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 5, sublocation_item)
-            
-            # Headline (6) - editable
-            headline_item = QTableWidgetItem(image.headline or "")
-            headline_item.setFlags(headline_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 6, headline_item)
-            
-            # Camera Model (7) - editable
-            camera_item = QTableWidgetItem(image.camera_model or "")
-            camera_item.setFlags(camera_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 7, camera_item)
-            
-            # Size (8) - read-only
-            size_item = QTableWidgetItem(format_file_size(image.size))
-            size_item.setFlags(size_item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Read-only
-            self.table.setItem(row, 8, size_item)
-            
-            # GPS Date (9) - editable with date picker
-            gps_date_str = format_date(image.gps_date) if image.gps_date else ""
-            gps_date_item = QTableWidgetItem(gps_date_str)
-            gps_date_item.setFlags(gps_date_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 9, gps_date_item)
-            
-            # Country (10) - editable with dropdown
-            country_item = QTableWidgetItem(image.country or "")
-            country_item.setFlags(country_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 10, country_item)
-            
-            # Keywords (11) - editable, semicolon-separated for display
-            keywords_str = "; ".join(image.keywords) if image.keywords else ""
-            keywords_item = QTableWidgetItem(keywords_str)
-            keywords_item.setFlags(keywords_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 11, keywords_item)
-            
-            # Created Date (12) - editable with date picker
-            created_date_str = format_date(image.created_date) if image.created_date else ""
-            created_date_item = QTableWidgetItem(created_date_str)
-            created_date_item.setFlags(created_date_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 12, created_date_item)
+    def _selected_images(self) -> List[tuple]:
+        """
+        Get the selected images with their rows
         
-        # Unblock signals after population is complete
-        self.table.blockSignals(False)
+        Rows are read from the selection ranges: selectedRows() checks every
+        cell of every row and creates an index per selected row.
         
-        self.table.setSortingEnabled(True)
+        Returns:
+            List of (row, image) tuples, in selection order
+        """
+        rows = {}
+        for selection_range in self.table.selectionModel().selection():
+            rows.update(dict.fromkeys(range(selection_range.top(), selection_range.bottom() + 1)))
+        images = self.table_model.images
+        return [(row, images[row]) for row in rows if row < len(images)]
     
     def on_selection_changed(self):
         """Handle selection change in the table"""
-        selected_rows = self.table.selectionModel().selectedRows()
+        images = [image for _, image in self._selected_images()]
         
-        if selected_rows:
+        # Nothing to update if the same images are still selected
+        selection = tuple(map(id, images))
+        if selection == self._last_selection:
+            return
+        self._last_selection = selection
+        
+        if images:
             # Get the first selected row for image display
-            row = selected_rows[0].row()
-            item = self.table.item(row, 0)
-            
-            if item:
-                image = item.data(Qt.ItemDataRole.UserRole)
-                if image:
-                    self.display_image(image)
+            self.display_image(images[0])
             
             # Update map to highlight selected images
             self.update_all_images_on_map()
             
-            # Enable/disable set marker action based on whether selected image has GPS
-            has_gps = False
-            if len(selected_rows) == 1:
-                item = self.table.item(selected_rows[0].row(), 0)
-                if item:
-                    image = item.data(Qt.ItemDataRole.UserRole)
-                    if image and image.gps_latitude is not None and image.gps_longitude is not None:
-                        has_gps = True
+            # Single pass over the selection:
+            # - set marker action needs exactly one selected image, with GPS
+            # - set Taken Date / GPS Date actions need an image without Taken Date / GPS Date
+            has_gps = (
+                len(images) == 1
+                and images[0].gps_latitude is not None and images[0].gps_longitude is not None
+            )
+            needs_taken_date = False
+            needs_gps_date = False
+            for image in images:
+                if not image.taken_date:
+                    needs_taken_date = True
+                elif not image.gps_date:
+                    needs_gps_date = True
             
             self.map_panel.enable_set_marker_action(has_gps)
             
             # Enable repair action if any images are selected
-            self.map_panel.enable_repair_action(len(selected_rows) > 0)
-            
-            # Check if any selected image needs Taken Date or GPS Date
-            needs_taken_date = False
-            needs_gps_date = False
-            for row in selected_rows:
-                item = self.table.item(row.row(), 0)
-                if item:
-                    image = item.data(Qt.ItemDataRole.UserRole)
-                    if image:
-                        if not image.taken_date:
-                            needs_taken_date = True
-                        if image.taken_date and not image.gps_date:
-                            needs_gps_date = True
+            self.map_panel.enable_repair_action(True)
             
             self.map_panel.enable_set_taken_date_action(needs_taken_date)
             self.map_panel.enable_set_gps_date_action(needs_gps_date)
@@ -615,11 +698,7 @@ class MainWindow(QMainWindow):
             country_code: Country code to add
         """
         # Get the image
-        filename_item = self.table.item(row, 0)
-        if not filename_item:
-            return
-        
-        image = filename_item.data(Qt.ItemDataRole.UserRole)
+        image = self.table_model.image_at(row)
         if not image:
             return
         
@@ -633,268 +712,346 @@ class MainWindow(QMainWindow):
                     'IPTC:Keywords': metadata['IPTC:Keywords'],
                     'XMP-dc:Subject': metadata['XMP-dc:Subject']
                 }
-                self.exiftool_service.write_metadata([image.filepath], keywords_metadata)
-            
-            # Update the keywords column display
-            keywords_item = self.table.item(row, 11)
-            if keywords_item:
-                new_keywords_str = "; ".join(image.keywords) if image.keywords else ""
-                keywords_item.setText(new_keywords_str)
+                self.queue_write(image.filepath, keywords_metadata)
         except Exception as e:
             self.statusBar().showMessage(f"Error updating keywords: {e}")
+        
+        # Update the country and keywords columns display
+        self.table_model.refresh_row(row)
     
-    def on_item_changed(self, item: QTableWidgetItem):
-        """Handle changes to editable table items"""
-        # Temporarily block signals to prevent recursion
-        self.table.blockSignals(True)
+    def on_item_changed(self, row: int, col: int, new_value: str):
+        """
+        Handle in-place edits of table cells
         
-        try:
-            row = item.row()
-            col = item.column()
-            new_value = item.text().strip()
-            
-            # Get the image for this row
-            filename_item = self.table.item(row, 0)
-            if not filename_item:
-                return
-            
-            image = filename_item.data(Qt.ItemDataRole.UserRole)
-            if not image:
-                return
-            
-            # Handle filename column (column 0)
-            if col == 0:
-                # Filename cannot be empty
-                if not new_value:
-                    # Revert to original filename
-                    item.setText(image.filename)
-                    self.statusBar().showMessage("Filename cannot be empty")
-                    return
-                
-                # If filename changed, rename the file
-                if new_value != image.filename:
-                    try:
-                        old_path = image.filepath
-                        new_path = old_path.parent / new_value
-                        
-                        # Check if new filename already exists
-                        if new_path.exists():
-                            QMessageBox.warning(
-                                self,
-                                "File Exists",
-                                f"A file named '{new_value}' already exists in this directory."
-                            )
-                            # Revert to original filename
-                            item.setText(image.filename)
-                            return
-                        
-                        # Rename the file
-                        old_path.rename(new_path)
-                        
-                        # Check if ExifTool backup exists and rename it too
-                        old_backup_path = old_path.parent / (old_path.name + "_original")
-                        if old_backup_path.exists():
-                            new_backup_path = new_path.parent / (new_path.name + "_original")
-                            try:
-                                old_backup_path.rename(new_backup_path)
-                            except Exception as backup_error:
-                                # Log warning but don't fail the rename operation
-                                print(f"Warning: Could not rename backup file: {backup_error}")
-                        
-                        # Update image model
-                        image.filename = new_value
-                        image.filepath = new_path
-                        
-                        self.statusBar().showMessage(f"Renamed file to {new_value}")
-                    except Exception as e:
-                        QMessageBox.critical(
-                            self,
-                            "Rename Failed",
-                            f"Failed to rename file: {str(e)}"
-                        )
-                        # Revert to original filename
-                        item.setText(image.filename)
+        Rejected edits need no explicit revert: the model refreshes the row from
+        the image afterwards.
+        
+        Args:
+            row: Row index in the table
+            col: Column index
+            new_value: Text entered by the user
+        """
+        new_value = new_value.strip()
+        
+        # Get the image for this row
+        image = self.table_model.image_at(row)
+        if not image:
+            return
+        
+        # Handle filename column (column 0)
+        if col == 0:
+            # Filename cannot be empty
+            if not new_value:
+                self.statusBar().showMessage("Filename cannot be empty")
                 return
             
-            # Determine which field was edited and save to file
-            metadata = {}
-            field_name = None
-            gps_date_updated = False
-            
-            if col == 2:  # TZ Offset
-                field_name = 'tz_offset'
-                metadata = self.update_image_field(image, field_name, new_value)
-                if '_gps_date_updated' in metadata:
-                    gps_date_updated = metadata.pop('_gps_date_updated')
-            elif col == 3:  # GPS Coordinates
-                # Parse GPS coordinates in various formats or empty to clear
-                if new_value.strip():
+            # If filename changed, rename the file
+            if new_value != image.filename:
+                try:
+                    old_path = image.filepath
+                    new_path = old_path.parent / new_value
+                    
+                    # Rename the file (queued edits still refer to the old path).
+                    # os.rename silently replaces an existing file on POSIX, hence the
+                    # lstat-based check; on Windows it raises FileExistsError itself.
                     try:
-                        # Remove degree symbols
-                        coord_str = new_value.replace('°', '')
-                        
-                        # Split by comma
-                        parts = coord_str.split(',')
-                        if len(parts) == 2:
-                            # Parse latitude (may have N/S suffix)
-                            lat_str = parts[0].strip()
-                            lat_multiplier = 1
-                            if lat_str.endswith((' N', ' S')):
-                                lat_multiplier = 1 if lat_str.endswith('N') else -1
-                                lat_str = lat_str[:-2].strip()
-                            lat = float(lat_str) * lat_multiplier
-                            
-                            # Parse longitude (may have E/W suffix)
-                            lon_str = parts[1].strip()
-                            lon_multiplier = 1
-                            if lon_str.endswith((' E', ' W')):
-                                lon_multiplier = 1 if lon_str.endswith('E') else -1
-                                lon_str = lon_str[:-2].strip()
-                            lon = float(lon_str) * lon_multiplier
-                            
-                            # Validate ranges
-                            if -90 <= lat <= 90 and -180 <= lon <= 180:
-                                metadata['EXIF:GPSLatitude'] = str(lat)
-                                metadata['EXIF:GPSLongitude'] = str(lon)
-                                
-                                # Update image model
-                                image.gps_latitude = lat
-                                image.gps_longitude = lon
-                            else:
-                                QMessageBox.warning(
-                                    self,
-                                    "Invalid Coordinates",
-                                    "Latitude must be between -90 and 90, Longitude between -180 and 180."
-                                )
-                                return
-                        else:
-                            QMessageBox.warning(
-                                self,
-                                "Invalid Format",
-                                "GPS coordinates must be in format: latitude, longitude (e.g., 48.856614, 2.352222 or 48.856614° N, 2.352222° E)"
-                            )
-                            return
-                    except ValueError:
+                        if os.path.lexists(new_path):
+                            raise FileExistsError(new_path)
+                        self.flush_pending_writes()
+                        os.rename(old_path, new_path)
+                    except FileExistsError:
                         QMessageBox.warning(
                             self,
-                            "Invalid Format",
-                            "GPS coordinates must be numeric values (e.g., 48.856614, 2.352222)"
+                            "File Exists",
+                            f"A file named '{new_value}' already exists in this directory."
                         )
                         return
-                else:
-                    # Clear GPS coordinates
-                    metadata['EXIF:GPSLatitude'] = ''
-                    metadata['EXIF:GPSLongitude'] = ''
-                    image.gps_latitude = None
-                    image.gps_longitude = None
-                
-                # Write metadata
-                try:
-                    self.exiftool_service.write_metadata([image.filepath], metadata)
-                    # Update map to reflect changes
-                    self.update_all_images_on_map()
-                    self.statusBar().showMessage(f"Updated GPS coordinates for {image.filename}")
+                    
+                    # Rename the ExifTool backup too, if any
+                    old_backup_path = old_path.parent / (old_path.name + "_original")
+                    new_backup_path = new_path.parent / (new_path.name + "_original")
+                    try:
+                        os.replace(old_backup_path, new_backup_path)
+                    except FileNotFoundError:
+                        pass
+                    except OSError as backup_error:
+                        # Log warning but don't fail the rename operation
+                        print(f"Warning: Could not rename backup file: {backup_error}")
+                    
+                    # Update image model
+                    image.filename = new_value
+                    image.filepath = new_path
+                    
+                    self.statusBar().showMessage(f"Renamed file to {new_value}")
                 except Exception as e:
-                    show_exiftool_error(
-                        "Error Updating GPS Coordinates",
-                        "Failed to update GPS coordinates:",
-                        str(e),
-                        self
+                    QMessageBox.critical(
+                        self,
+                        "Rename Failed",
+                        f"Failed to rename file: {str(e)}"
                     )
-                return  # GPS coordinates handled separately
-            elif col == 4:  # City
-                field_name = 'city'
-                metadata = self.update_image_field(image, field_name, new_value)
-            elif col == 5:  # Sublocation
-                field_name = 'sublocation'
-                metadata = self.update_image_field(image, field_name, new_value)
-            elif col == 6:  # Headline
-                field_name = 'headline'
-                metadata = self.update_image_field(image, field_name, new_value)
-            elif col == 7:  # Camera Model
-                field_name = 'camera_model'
-                metadata = self.update_image_field(image, field_name, new_value)
-            elif col == 11:  # Keywords
-                field_name = 'keywords'
-                metadata = self.update_image_field(image, field_name, new_value)
-            else:
-                # Other columns are handled by delegates (dates, country) or are not editable
-                return
-            
-            # Write to file
-            try:
-                self.exiftool_service.write_metadata([image.filepath], metadata)
+            return
+        
+        # Determine which field was edited and save to file
+        metadata = {}
+        field_name = None
+        
+        if col in _FIELD_EDIT_COLUMNS:
+            field_name = ImageTableModel.COLUMNS[col]
+            metadata = self.update_image_field(image, field_name, new_value)
+        elif col == 3:  # GPS Coordinates
+            # Parse GPS coordinates in various formats or empty to clear
+            if new_value:
+                match = _GPS_RE.match(new_value)
+                if not match:
+                    QMessageBox.warning(
+                        self,
+                        "Invalid Format",
+                        "GPS coordinates must be in format: latitude, longitude (e.g., 48.856614, 2.352222 or 48.856614° N, 2.352222° E)"
+                    )
+                    return
                 
-                # Update image metadata cache
-                if not image.metadata:
-                    image.metadata = {}
-                for tag, value in metadata.items():
-                    image.metadata[tag] = value
+                lat = float(match[1]) * (-1 if match[2] == 'S' else 1)
+                lon = float(match[3]) * (-1 if match[4] == 'W' else 1)
                 
-                # If GPS date was updated, refresh the GPS date column display
-                if gps_date_updated:
-                    gps_date_col = self._get_column_for_field('gps_date')
-                    if gps_date_col is not None:
-                        gps_item = self.table.item(row, gps_date_col)
-                        if gps_item and image.gps_date:
-                            gps_item.setText(image.gps_date.strftime('%Y-%m-%d %H:%M:%S'))
+                # Validate ranges
+                if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                    QMessageBox.warning(
+                        self,
+                        "Invalid Coordinates",
+                        "Latitude must be between -90 and 90, Longitude between -180 and 180."
+                    )
+                    return
                 
-                self.statusBar().showMessage(f"Updated {field_name.replace('_', ' ')} for {image.filename}")
-            except Exception as e:
-                self.statusBar().showMessage(f"Error updating {field_name}: {e}")
-                # Revert the change in the UI
-                if field_name == 'keywords':
-                    old_value = '; '.join(image.keywords) if image.keywords else ""
-                else:
-                    old_value = getattr(image, field_name, "")
-                item.setText(old_value or "")
+                metadata['EXIF:GPSLatitude'] = str(lat)
+                metadata['EXIF:GPSLongitude'] = str(lon)
+                
+                # Update image model
+                image.gps_latitude = lat
+                image.gps_longitude = lon
+            else:
+                # Clear GPS coordinates
+                metadata['EXIF:GPSLatitude'] = ''
+                metadata['EXIF:GPSLongitude'] = ''
+                image.gps_latitude = None
+                image.gps_longitude = None
+            
+            # Queue metadata write
+            self.queue_write(image.filepath, metadata)
+            # Update map to reflect changes
+            self.update_all_images_on_map()
+            self.statusBar().showMessage(f"Updated GPS coordinates for {image.filename}")
+            return  # GPS coordinates handled separately
+        else:
+            # Other columns are handled by delegates (dates, country) or are not editable
+            return
+        
+        # Queue write to file
+        self.queue_write(image.filepath, metadata)
+        
+        # Update image metadata cache
+        if not image.metadata:
+            image.metadata = {}
+        for tag, value in metadata.items():
+            image.metadata[tag] = value
+        
+        self.statusBar().showMessage(f"Updated {field_name.replace('_', ' ')} for {image.filename}")
+    
+    def queue_write(self, filepath: Path, metadata: Dict[str, Any]):
+        """
+        Queue metadata to be written to a file, merged with other pending edits
+        
+        The write happens once no edit occurred for WRITE_DELAY_MS, or earlier when
+        flush_pending_writes() is called.
+        
+        Args:
+            filepath: Path to the image file
+            metadata: Dictionary of tag names and values
+        """
+        self._pending_writes.setdefault(filepath, {}).update(metadata)
+        self.write_timer.start()
+    
+    def flush_pending_writes(self):
+        """
+        Write all queued metadata with a single ExifTool call
+        
+        Must be called before any other operation reads or writes the files, so
+        that queued edits are neither lost nor applied out of order.
+        """
+        self.write_timer.stop()
+        if not self._pending_writes:
+            return
+        
+        pending, self._pending_writes = self._pending_writes, {}
+        
+        # Files receiving identical tags share one command
+        groups: Dict[tuple, List[Path]] = {}
+        for filepath, metadata in pending.items():
+            groups.setdefault(tuple(sorted(metadata.items())), []).append(filepath)
+        
+        try:
+            self.exiftool_service.write_metadata_batch(
+                [(filepaths, dict(tags)) for tags, filepaths in groups.items()]
+            )
+        except Exception as e:
+            # The edits are not on disk: show the files' actual values again
+            self._reload_image_metadata(pending.keys())
+            show_exiftool_error(
+                "Error Writing Metadata",
+                f"Failed to write metadata changes of {len(pending)} image(s):",
+                str(e),
+                self
+            )
+    
+    def _reload_image_metadata(self, filepaths: Iterable[Path]):
+        """
+        Re-read the metadata of some images from their files and refresh their rows
         
-        finally:
-            self.table.blockSignals(False)
+        Args:
+            filepaths: Paths of the images to refresh (images no longer listed are ignored)
+        """
+        rows = {}
+        wanted = set(filepaths)
+        for row, image in enumerate(self.table_model.images):
+            if image.filepath in wanted:
+                rows[image.filepath] = row
+        if not rows:
+            return
+        
+        images = self.table_model.images
+        try:
+            results = self.exiftool_service.read_metadata_batch(list(rows))
+        except Exception as e:
+            print(f"Warning: Could not re-read metadata: {e}")
+            return
+        
+        for row, metadata in zip(rows.values(), results):
+            if metadata is not None:
+                images[row].update_metadata(metadata)
+        
+        self.table_model.refresh_rows(rows.values())
+        self.update_all_images_on_map()
+    
+    def closeEvent(self, event):
+        """Write pending edits before the window closes"""
+        self.flush_pending_writes()
+        self.preview_timer.stop()
+        self.map_update_timer.stop()
+        self.preview_loader.shutdown()
+        self.directory_loader.shutdown()
+        self._close_ai_service()
+        self.map_panel.map_widget.shutdown()
+        # All metadata operations share the persistent ExifTool processes, stop them with the window
+        self.exiftool_service.close_daemons()
+        super().closeEvent(event)
     
     def display_image(self, image: ImageModel):
         """
         Display an image in the viewer
         
+        The image is decoded in the background at screen resolution rather than
+        full resolution, the viewer is updated when the preview is ready. Decoding
+        starts after PREVIEW_DELAY_MS, so scrolling through the list only decodes
+        the image the selection stops on.
+        
         Args:
             image: ImageModel to display
         """
         self.current_image = image
         
-        try:
-            # Load image using PIL
-            pil_image = Image.open(image.filepath)
-
-            # Get app settings and auto-rotate if enabled
-            app_settings = Config.get_app_settings()
-            if app_settings.get('auto_rotate_images', False):
-                orientation = image.metadata.get('EXIF:Orientation') if image.metadata else None
-                if orientation and orientation != 1:
-                    pil_image = ImageOps.exif_transpose(pil_image)
-            
-            # Convert to RGB if necessary
-            if pil_image.mode != 'RGB':
-                pil_image = pil_image.convert('RGB')
-            
-            # Convert PIL Image to QPixmap directly (no temp file needed)
-            # Convert PIL Image to bytes
-            img_byte_array = io.BytesIO()
-            pil_image.save(img_byte_array, format='PNG')
-            img_byte_array.seek(0)
-            
-            # Load into QImage and convert to QPixmap
-            qimage = QImage.fromData(img_byte_array.read())
-            self.current_pixmap = QPixmap.fromImage(qimage)
-            
-            # Scale and display the pixmap
+        # Get app settings and auto-rotate if enabled
+        app_settings = Config.get_app_settings()
+        auto_rotate = False
+        if app_settings.get('auto_rotate_images', False):
+            orientation = image.metadata.get('EXIF:Orientation') if image.metadata else None
+            auto_rotate = bool(orientation and orientation != 1)
+        resample = app_settings.get('preview_resample', ImagePreviewLoader.DEFAULT_RESAMPLE)
+        
+        # The viewer never gets larger than the screen
+        screen = self.screen()
+        screen_size = screen.size()
+        max_size = int(max(screen_size.width(), screen_size.height()) * screen.devicePixelRatio())
+        
+        # Reuse the preview if the file did not change since it was decoded
+        self._preview_key = self._preview_cache_key(image.filepath, max_size, auto_rotate, resample)
+        pixmap = QPixmapCache.find(self._preview_key) if self._preview_key else None
+        if pixmap is not None:
+            self.preview_timer.stop()
+            self.preview_loader.cancel()
+            self.current_pixmap = pixmap
+            self._pixmap_key = self._preview_key
             self._scale_and_display_image()
-            
             self.statusBar().showMessage(f"Displaying: {image.filename}")
+            return
+        
+        # Drop the preview being decoded for a previous selection
+        self.preview_loader.cancel()
+        self._pending_preview = (image.filepath, max_size, auto_rotate, resample)
+        self.preview_timer.start()
+        self.statusBar().showMessage(f"Loading: {image.filename}")
+    
+    def _request_preview(self):
+        """Start decoding the preview of the image selected last"""
+        if self._pending_preview is not None:
+            self.preview_loader.request(*self._pending_preview)
+            self._pending_preview = None
+    
+    def _on_preview_loaded(self, qimage: QImage):
+        """
+        Show the preview of the current image
+        
+        Args:
+            qimage: Decoded preview
+        """
+        if not self.current_image:
+            return
+        
+        self.current_pixmap = QPixmap.fromImage(qimage)
+        self._pixmap_key = self._preview_key
+        if self._pixmap_key:
+            QPixmapCache.insert(self._pixmap_key, self.current_pixmap)
+        
+        # Scale and display the pixmap
+        self._scale_and_display_image()
+        
+        self.statusBar().showMessage(f"Displaying: {self.current_image.filename}")
+    
+    @staticmethod
+    def _preview_cache_key(filepath: Path, max_size: int, auto_rotate: bool, resample: str) -> Optional[str]:
+        """
+        Build the preview cache key of a file version
+        
+        The change time is included as metadata writes keep the modification
+        time (ExifTool -P), so previews of edited or repaired files are decoded again.
+        
+        Args:
+            filepath: Image file
+            max_size: Preview size
+            auto_rotate: Whether the EXIF orientation is applied
+            resample: Downscaling filter name
             
-        except Exception as e:
-            self.current_pixmap = None
-            self.image_viewer.setText(f"Error loading image:\n{str(e)}")
-            self.statusBar().showMessage(f"Error loading {image.filename}")
+        Returns:
+            Cache key or None if the file cannot be accessed
+        """
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return None
+        return f"preview:{filepath}:{stat.st_mtime_ns}:{stat.st_ctime_ns}:{stat.st_size}:{max_size}:{int(auto_rotate)}:{resample}"
+    
+    def _on_preview_failed(self, message: str):
+        """
+        Report an error decoding the current image
+        
+        Args:
+            message: Error message
+        """
+        if not self.current_image:
+            return
+        
+        self.current_pixmap = None
+        self._pixmap_key = None
+        self.image_viewer.setText(f"Error loading image:\n{message}")
+        self.statusBar().showMessage(f"Error loading {self.current_image.filename}")
     
     def _scale_and_display_image(self):
         """Scale the current pixmap to fit the viewer while maintaining aspect ratio"""
@@ -906,13 +1063,20 @@ class MainWindow(QMainWindow):
         max_width = max(available_size.width() - 20, 1)
         max_height = max(available_size.height() - 20, 1)
         
-        # Scale pixmap to fit while maintaining aspect ratio
-        scaled_pixmap = self.current_pixmap.scaled(
-            max_width,
-            max_height,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        # Previews shown before at this viewer size were already scaled
+        scaled_key = f"{self._pixmap_key}:{max_width}x{max_height}" if self._pixmap_key else None
+        scaled_pixmap = QPixmapCache.find(scaled_key) if scaled_key else None
+        
+        if scaled_pixmap is None:
+            # Scale pixmap to fit while maintaining aspect ratio
+            scaled_pixmap = self.current_pixmap.scaled(
+                max_width,
+                max_height,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            if scaled_key:
+                QPixmapCache.insert(scaled_key, scaled_pixmap)
         
         self.image_viewer.setPixmap(scaled_pixmap)
     
@@ -953,40 +1117,29 @@ class MainWindow(QMainWindow):
         # Show menu at cursor position
         menu.exec(self.table.viewport().mapToGlobal(position))
     
-    def on_table_double_click(self, item: QTableWidgetItem):
+    def on_table_double_click(self, index: QModelIndex):
         """
         Handle double-click on table - open metadata editor only for Filename column
         
         Args:
-            item: The clicked table item
+            index: The clicked model index
         """
         # Only open Edit Metadata dialog if double-clicking on Filename column (column 0)
-        if item and item.column() == 0:
+        if index.isValid() and index.column() == 0:
             self.edit_metadata()
     
     def edit_metadata(self):
         """Open metadata editor for selected images"""
-        selected_rows = self.table.selectionModel().selectedRows()
-        
-        if not selected_rows:
-            return
-        
-        # Get selected images
-        selected_images = []
-        for row in selected_rows:
-            item = self.table.item(row.row(), 0)
-            if item:
-                image = item.data(Qt.ItemDataRole.UserRole)
-                if image:
-                    selected_images.append(image)
+        selected_images = self._selected_images()
         
         if not selected_images:
             return
         
         # Get file paths
-        filepaths = [img.filepath for img in selected_images]
+        filepaths = [img.filepath for _, img in selected_images]
         
         # Open metadata editor
+        self.flush_pending_writes()
         editor = MetadataEditor(filepaths, self.exiftool_service, self)
         result = editor.exec()
         
@@ -1007,62 +1160,51 @@ class MainWindow(QMainWindow):
         Returns:
             Dictionary of metadata tags to write to file
             Special key '_country_info' contains country name/code for keyword updates
-            Special key '_gps_date_updated' indicates GPS date was recalculated
         """
         metadata = {}
         
         if field_name == 'tz_offset':
-            if new_value:
-                try:
-                    # Parse "+05:00" or "-04:30" format
-                    sign = 1 if new_value[0] == '+' else -1
-                    hours = int(new_value[1:3])
-                    minutes = int(new_value[4:6])
-                    tz_offset_hours = sign * (hours + minutes / 60.0)
-                    
-                    metadata['EXIF:TimeZoneOffset'] = str(tz_offset_hours)
-                    metadata['EXIF:OffsetTime'] = new_value
-                    metadata['EXIF:OffsetTimeOriginal'] = new_value
-                    metadata['EXIF:OffsetTimeDigitized'] = new_value
-                    
-                    # Update XMP date tags with timezone offset
-                    if image.taken_date:
-                        taken_date_str = image.taken_date.strftime('%Y:%m:%d %H:%M:%S')
-                        metadata['XMP-exif:DateTimeOriginal'] = taken_date_str + new_value
-                    
-                    if image.created_date:
-                        created_date_str = image.created_date.strftime('%Y:%m:%d %H:%M:%S')
-                        metadata['XMP-exif:DateTimeDigitized'] = created_date_str + new_value
-                    
-                    # Recalculate GPS Date to UTC if both taken_date and gps_date exist
-                    if image.taken_date and image.gps_date:
-                        from datetime import timedelta
-                        offset_seconds = sign * (hours * 3600 + minutes * 60)
-                        gps_utc = image.taken_date - timedelta(seconds=offset_seconds)
-                        
-                        metadata['EXIF:GPSDateStamp'] = gps_utc.strftime('%Y:%m:%d')
-                        metadata['EXIF:GPSTimeStamp'] = gps_utc.strftime('%H:%M:%S')
-                        metadata['_gps_date_updated'] = True  # Flag for special handling
-                        image.gps_date = gps_utc
+            match = _TZ_RE.match(new_value)
+            if match:
+                sign = 1 if match[1] == '+' else -1
+                hours = int(match[2])
+                minutes = int(match[3])
+                tz_offset_hours = sign * (hours + minutes / 60.0)
+                
+                metadata['EXIF:TimeZoneOffset'] = str(tz_offset_hours)
+                metadata['EXIF:OffsetTime'] = new_value
+                metadata['EXIF:OffsetTimeOriginal'] = new_value
+                metadata['EXIF:OffsetTimeDigitized'] = new_value
+                
+                # Update XMP date tags with timezone offset
+                if image.taken_date:
+                    taken_date_str = format_exif_datetime(image.taken_date)
+                    metadata['XMP-exif:DateTimeOriginal'] = taken_date_str + new_value
+                
+                if image.created_date:
+                    created_date_str = format_exif_datetime(image.created_date)
+                    metadata['XMP-exif:DateTimeDigitized'] = created_date_str + new_value
+                
+                # Recalculate GPS Date to UTC if both taken_date and gps_date exist
+                if image.taken_date and image.gps_date:
+                    gps_utc = image.taken_date - parse_tz_offset(new_value)
                     
-                    image.tz_offset = new_value
-                except (ValueError, IndexError):
-                    pass
+                    metadata['EXIF:GPSDateStamp'] = format_exif_date(gps_utc)
+                    metadata['EXIF:GPSTimeStamp'] = format_exif_time(gps_utc)
+                    # Same value as ExifTool's Composite:GPSDateTime, without reading it back
+                    metadata['XMP-exif:GPSDateTime'] = format_exif_datetime(gps_utc) + 'Z'
+                    image.gps_date = gps_utc
+                
+                image.tz_offset = new_value
         
         elif field_name == 'country' or field_name == 'country_code':
             if new_value:
-                from .table_delegates import CountryDelegate
-                
-                # Create lookup dictionaries for efficient searches
-                code_to_name = {code: name for code, name in CountryDelegate.COUNTRY_LIST}
-                name_to_code = {name: code for code, name in CountryDelegate.COUNTRY_LIST}
-                
                 if field_name == 'country_code':
                     country_code = new_value
-                    country_name = code_to_name.get(country_code)
+                    country_name = _COUNTRY_NAMES.get(country_code)
                 else:
                     country_name = new_value
-                    country_code = name_to_code.get(country_name)
+                    country_code = _COUNTRY_CODES.get(country_name)
                 
                 if country_name and country_code:
                     metadata['XMP-photoshop:Country'] = country_name
@@ -1071,45 +1213,29 @@ class MainWindow(QMainWindow):
                     metadata['IPTC:Country-PrimaryLocationCode'] = country_code
                     image.country = country_name  # Store country name, not code
                     
-                    # Add country to keywords
-                    keywords_list = list(image.keywords) if image.keywords else []
-                    if country_code and country_code not in keywords_list:
-                        keywords_list.append(country_code)
-                    if country_name and country_name not in keywords_list:
-                        keywords_list.append(country_name)
+                    # Add country to keywords (dict keys: ordered, constant time membership)
+                    keywords = dict.fromkeys(image.keywords or ())
+                    keyword_count = len(keywords)
+                    keywords[country_code] = None
+                    keywords[country_name] = None
                     
-                    # Update keywords in metadata
-                    if keywords_list:
-                        keywords_str = '*'.join(keywords_list)
+                    # Update keywords in metadata, unless they were already there
+                    if len(keywords) != keyword_count:
+                        keywords_str = '*'.join(keywords)
                         metadata['IPTC:Keywords'] = keywords_str
                         metadata['XMP-dc:Subject'] = keywords_str
-                        image.keywords = keywords_list
+                        image.keywords = list(keywords)
                     
                     # Return country info for backward compatibility
                     metadata['_country_info'] = {'name': country_name, 'code': country_code}
                     
-        elif field_name == 'city':
-            metadata['IPTC:City'] = new_value
-            metadata['XMP-photoshop:City'] = new_value
-            image.city = new_value if new_value else None
-        
-        elif field_name == 'sublocation':
-            metadata['IPTC:Sub-location'] = new_value
-            metadata['XMP-iptcCore:Location'] = new_value
-            image.sublocation = new_value if new_value else None
-        
-        elif field_name == 'headline':
-            metadata['IPTC:Headline'] = new_value
-            metadata['XMP-photoshop:Headline'] = new_value
-            image.headline = new_value if new_value else None
-        
-        elif field_name == 'camera_model':
-            metadata['EXIF:Model'] = new_value
-            image.camera_model = new_value if new_value else None
+        elif field_name in _TEXT_FIELD_TAGS:
+            metadata.update(dict.fromkeys(_TEXT_FIELD_TAGS[field_name], new_value))
+            setattr(image, field_name, new_value if new_value else None)
         
         elif field_name == 'keywords':
-            # Parse semicolon-separated keywords (display format)
-            keywords_list = [k.strip() for k in new_value.split(';') if k.strip()] if new_value else []
+            # Parse semicolon-separated keywords (display format), dropping duplicates
+            keywords_list = list(dict.fromkeys(k for k in map(str.strip, new_value.split(';')) if k)) if new_value else []
             if keywords_list:
                 keywords_str = '*'.join(keywords_list)
                 metadata['IPTC:Keywords'] = keywords_str
@@ -1121,25 +1247,11 @@ class MainWindow(QMainWindow):
         
         return metadata
     
-    def _get_column_for_field(self, field_name: str) -> Optional[int]:
-        """Get column index for a field name"""
-        field_to_column = {
-            'tz_offset': 2,
-            'country': 10,
-            'city': 4,
-            'sublocation': 5,
-            'headline': 6,
-            'camera_model': 7,
-            'keywords': 11,
-            'gps_date': 9
-        }
-        return field_to_column.get(field_name)
-    
     def quick_edit_metadata(self):
         """Open quick edit dialog for selected images"""
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_images = self._selected_images()
         
-        if len(selected_rows) < 2:
+        if len(selected_images) < 2:
             QMessageBox.information(
                 self,
                 "Selection Required",
@@ -1147,18 +1259,6 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Get selected images
-        selected_images = []
-        for row in selected_rows:
-            item = self.table.item(row.row(), 0)
-            if item:
-                image = item.data(Qt.ItemDataRole.UserRole)
-                if image:
-                    selected_images.append((row.row(), image))
-        
-        if not selected_images:
-            return
-        
         # Open quick edit dialog
         dialog = QuickEditDialog(len(selected_images), self)
         result = dialog.exec()
@@ -1180,67 +1280,31 @@ class MainWindow(QMainWindow):
                 return
             
             try:
+                self.flush_pending_writes()
+                
+                # Metadata of each image, written in one batch after the loop
+                writes = []
+                
                 # Update each image using centralized logic
-                for row, image in selected_images:
+                for _, image in selected_images:
                     all_metadata = {}
-                    country_info = None
-                    gps_date_updated = False
                     
-                    # Process each field using centralized update logic
+                    # Process each field using centralized update logic (a country
+                    # also adds its keywords, written along with the other tags)
                     for field_name, field_value in fields_to_update.items():
                         metadata = self.update_image_field(image, field_name, field_value)
-                        
-                        # Extract special flags
-                        if '_country_info' in metadata:
-                            country_info = metadata.pop('_country_info')
-                        if '_gps_date_updated' in metadata:
-                            gps_date_updated = metadata.pop('_gps_date_updated')
-                        
+                        metadata.pop('_country_info', None)
                         all_metadata.update(metadata)
                     
-                    # Write metadata for this image
                     if all_metadata:
-                        self.exiftool_service.write_metadata([image.filepath], all_metadata)
-                        
-                        # Handle Composite:GPSDateTime if GPS date was updated
-                        if gps_date_updated:
-                            try:
-                                file_metadata = self.exiftool_service.read_metadata(image.filepath)
-                                composite_gps = file_metadata.get('Composite:GPSDateTime')
-                                if composite_gps:
-                                    self.exiftool_service.write_metadata(
-                                        [image.filepath],
-                                        {'XMP-exif:GPSDateTime': composite_gps}
-                                    )
-                            except Exception:
-                                pass
-                        
-                        # Update keywords with country if country was set
-                        if country_info:
-                            self.update_keywords_with_country(
-                                row,
-                                country_info['name'],
-                                country_info['code']
-                            )
+                        writes.append(([image.filepath], all_metadata))
                 
-                # Update UI
-                self.table.blockSignals(True)
-                for row, image in selected_images:
-                    for field_name, field_value in fields_to_update.items():
-                        col = self._get_column_for_field(field_name)
-                        if col is not None:
-                            item = self.table.item(row, col)
-                            if item:
-                                item.setText(field_value)
-                    
-                    # Update GPS Date display if it was recalculated
-                    if 'tz_offset' in fields_to_update and image.gps_date:
-                        gps_date_col = self._get_column_for_field('gps_date')
-                        gps_date_item = self.table.item(row, gps_date_col)
-                        if gps_date_item:
-                            gps_date_item.setText(format_date(image.gps_date))
+                # Write metadata of all images at once (images sharing the same
+                # values, e.g. without TZ offset, are written by a single command)
+                self.exiftool_service.write_metadata_batch(writes)
                 
-                self.table.blockSignals(False)
+                # Update UI in one model change (including GPS Date and keywords)
+                self.table_model.refresh_rows(row for row, _ in selected_images)
                 
                 QMessageBox.information(
                     self,
@@ -1261,33 +1325,35 @@ class MainWindow(QMainWindow):
                 )
     
     def update_all_images_on_map(self):
+        """
+        Schedule a map update with markers for all images, highlighting selected ones
+        
+        The markers are rebuilt after MAP_UPDATE_DELAY_MS, once for all the
+        updates requested in the meantime.
+        """
+        self.map_update_timer.start()
+    
+    def _do_update_all_images_on_map(self):
         """Update map with markers for all images, highlighting selected ones"""
-        selected_rows = self.table.selectionModel().selectedRows()
-        selected_filenames = set()
-        
-        for row in selected_rows:
-            item = self.table.item(row.row(), 0)
-            if item:
-                image = item.data(Qt.ItemDataRole.UserRole)
-                if image:
-                    selected_filenames.add(image.filename)
-        
-        # Create markers for all images with GPS coordinates
-        markers = []
-        for image in self.images:
-            if image.gps_latitude is not None and image.gps_longitude is not None:
-                is_selected = image.filename in selected_filenames
-                markers.append((
-                    image.gps_latitude,
-                    image.gps_longitude,
-                    image.filename,
-                    is_selected,
-                    str(image.filepath)  # Add filepath for thumbnail generation
-                ))
+        # Selected images, by identity (no per-image filename hashing)
+        selected_ids = {id(image) for _, image in self._selected_images()}
+        
+        # Create markers for all images with GPS coordinates, in a single pass
+        markers = [
+            (
+                image.gps_latitude,
+                image.gps_longitude,
+                image.filename,
+                id(image) in selected_ids,
+                str(image.filepath)  # Add filepath for thumbnail generation
+            )
+            for image in self.images
+            if image.gps_latitude is not None and image.gps_longitude is not None
+        ]
         
         # Update map with markers
         # Pass has_active_selection=True if user has selected any photos (even without geolocation)
-        has_active_selection = len(selected_filenames) > 0
+        has_active_selection = bool(selected_ids)
         self.map_panel.map_widget.update_markers(markers, has_active_selection)
     
     def on_map_clicked(self, lat: float, lng: float):
@@ -1311,29 +1377,27 @@ class MainWindow(QMainWindow):
             )
             return
         
-        item = self.table.item(selected_rows[0].row(), 0)
-        if item:
-            image = item.data(Qt.ItemDataRole.UserRole)
-            if image and image.gps_latitude is not None and image.gps_longitude is not None:
-                self.map_panel.map_widget.set_active_marker(
-                    image.gps_latitude,
-                    image.gps_longitude
-                )
-                # Update the info label with the coordinates
-                self.map_panel.info_label.setText(
-                    f"Active: {image.gps_latitude:.6f}°, {image.gps_longitude:.6f}°"
-                )
-                self.map_panel.enable_update_coords_action(True)
-                self.statusBar().showMessage(
-                    f"Active marker set from {image.filename}: "
-                    f"{image.gps_latitude:.6f}°, {image.gps_longitude:.6f}°"
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "No GPS Data",
-                    "Selected image does not have GPS coordinates."
-                )
+        image = self.table_model.image_at(selected_rows[0].row())
+        if image and image.gps_latitude is not None and image.gps_longitude is not None:
+            self.map_panel.map_widget.set_active_marker(
+                image.gps_latitude,
+                image.gps_longitude
+            )
+            # Update the info label with the coordinates
+            self.map_panel.info_label.setText(
+                f"Active: {image.gps_latitude:.6f}°, {image.gps_longitude:.6f}°"
+            )
+            self.map_panel.enable_update_coords_action(True)
+            self.statusBar().showMessage(
+                f"Active marker set from {image.filename}: "
+                f"{image.gps_latitude:.6f}°, {image.gps_longitude:.6f}°"
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "No GPS Data",
+                "Selected image does not have GPS coordinates."
+            )
     
     def update_selected_images_gps(self):
         """Update selected images with GPS coordinates from active marker"""
@@ -1347,9 +1411,9 @@ class MainWindow(QMainWindow):
             )
             return
         
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_images = self._selected_images()
         
-        if not selected_rows:
+        if not selected_images:
             QMessageBox.warning(
                 self,
                 "No Selection",
@@ -1357,18 +1421,6 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Get selected images
-        selected_images = []
-        for row in selected_rows:
-            item = self.table.item(row.row(), 0)
-            if item:
-                image = item.data(Qt.ItemDataRole.UserRole)
-                if image:
-                    selected_images.append(image)
-        
-        if not selected_images:
-            return
-        
         # Confirm action
         lat, lon = active_marker
         result = QMessageBox.question(
@@ -1453,29 +1505,49 @@ class MainWindow(QMainWindow):
                     return
         
         # Update metadata
+        self.flush_pending_writes()
         try:
             # Check if we have geocoding info with keywords to update
             if geocoding_info is not None:
                 country = geocoding_info.get('country')
                 country_code = geocoding_info.get('country_code')
                 
-                # Update each image individually to handle keywords properly
-                for image in selected_images:
-                    # Start with base GPS metadata
-                    image_metadata = metadata.copy()
+                # Country tags are the same for all images, only the keywords differ: images
+                # whose keywords do not change share the common metadata, others get a copy
+                # with their keywords, all written in one batch
+                common_metadata = metadata
+                keywords_writes = []
+                unchanged_filepaths = []
+                for _, image in selected_images:
+                    keywords_metadata = None
                     
                     # Add keywords with country information if country data exists
                     if country and country_code:
                         # Use centralized update logic
                         country_metadata = self.update_image_field(image, 'country_code', country_code)
-                        # Merge country metadata into image_metadata
-                        image_metadata.update({k: v for k, v in country_metadata.items() if not k.startswith('_')})
+                        country_metadata.pop('_country_info', None)
+                        if 'IPTC:Keywords' in country_metadata:
+                            keywords_metadata = {
+                                'IPTC:Keywords': country_metadata.pop('IPTC:Keywords'),
+                                'XMP-dc:Subject': country_metadata.pop('XMP-dc:Subject')
+                            }
+                        if common_metadata is metadata:
+                            common_metadata = {**metadata, **country_metadata}
                     
-                    # Write metadata for this image
-                    self.exiftool_service.write_metadata([image.filepath], image_metadata)
+                    if keywords_metadata:
+                        keywords_writes.append((image.filepath, keywords_metadata))
+                    else:
+                        unchanged_filepaths.append(image.filepath)
+                
+                writes = [(unchanged_filepaths, common_metadata)]
+                writes.extend(
+                    ([filepath], {**common_metadata, **keywords_metadata})
+                    for filepath, keywords_metadata in keywords_writes
+                )
+                self.exiftool_service.write_metadata_batch(writes)
             else:
                 # No geocoding or no keywords to update, write all at once
-                filepaths = [img.filepath for img in selected_images]
+                filepaths = [img.filepath for _, img in selected_images]
                 self.exiftool_service.write_metadata(filepaths, metadata)
             
             QMessageBox.information(
@@ -1484,8 +1556,22 @@ class MainWindow(QMainWindow):
                 f"GPS coordinates updated for {len(selected_images)} image(s)."
             )
             
-            # Reload images
-            self.reload_images()
+            # Update the images in memory rather than reloading the directory
+            # (country and keywords were already set by update_image_field)
+            for _, image in selected_images:
+                image.gps_latitude = lat
+                image.gps_longitude = lon
+                if geocoding_info is not None:
+                    if geocoding_info.get('city'):
+                        image.city = geocoding_info['city']
+                    if geocoding_info.get('country') and not geocoding_info.get('country_code'):
+                        image.country = geocoding_info['country']
+            
+            self.table_model.refresh_rows(row for row, _ in selected_images)
+            
+            # Refresh map markers and actions depending on the GPS position
+            self._last_selection = None
+            self.on_selection_changed()
             
         except Exception as e:
             show_exiftool_error(
@@ -1497,9 +1583,9 @@ class MainWindow(QMainWindow):
     
     def repair_selected_images_metadata(self):
         """Repair/fix metadata for selected images"""
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_images = self._selected_images()
         
-        if not selected_rows:
+        if not selected_images:
             QMessageBox.information(
                 self,
                 "No Selection",
@@ -1511,7 +1597,7 @@ class MainWindow(QMainWindow):
         reply = QMessageBox.question(
             self,
             "Confirm Repair",
-            f"This will repair metadata for {len(selected_rows)} selected image(s).\n\n"
+            f"This will repair metadata for {len(selected_images)} selected image(s).\n\n"
             "The repair process will:\n"
             "- Remove all metadata\n"
             "- Copy it back from the original\n"
@@ -1524,24 +1610,13 @@ class MainWindow(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
         
-        # Get selected images
-        selected_images = []
-        filepaths = []
-        for row in selected_rows:
-            item = self.table.item(row.row(), 0)
-            if item:
-                image = item.data(Qt.ItemDataRole.UserRole)
-                if image:
-                    selected_images.append(image)
-                    filepaths.append(image.filepath)
-        
-        if not filepaths:
-            return
+        filepaths = [image.filepath for _, image in selected_images]
         
         try:
             self.statusBar().showMessage(f"Repairing metadata for {len(filepaths)} image(s)...")
             
             # Repair metadata
+            self.flush_pending_writes()
             self.exiftool_service.repair_metadata(filepaths)
             
             QMessageBox.information(
@@ -1563,9 +1638,9 @@ class MainWindow(QMainWindow):
     
     def set_taken_date_from_creation(self):
         """Set Taken Date from file creation date for selected images"""
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_images = self._selected_images()
         
-        if not selected_rows:
+        if not selected_images:
             QMessageBox.information(
                 self,
                 "No Selection",
@@ -1574,17 +1649,9 @@ class MainWindow(QMainWindow):
             return
         
         # Get selected images without Taken Date
-        images_to_update = []
-        filepaths = []
-        for row in selected_rows:
-            item = self.table.item(row.row(), 0)
-            if item:
-                image = item.data(Qt.ItemDataRole.UserRole)
-                if image and not image.taken_date and image.creation_date:
-                    images_to_update.append(image)
-                    filepaths.append(image.filepath)
-        
-        if not filepaths:
+        images_to_update = [image for _, image in selected_images if not image.taken_date and image.creation_date]
+        
+        if not images_to_update:
             QMessageBox.information(
                 self,
                 "No Images to Update",
@@ -1596,7 +1663,7 @@ class MainWindow(QMainWindow):
         reply = QMessageBox.question(
             self,
             "Confirm Set Taken Date",
-            f"Set Taken Date from file creation date for {len(filepaths)} image(s)?",
+            f"Set Taken Date from file creation date for {len(images_to_update)} image(s)?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
@@ -1604,24 +1671,31 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            self.statusBar().showMessage(f"Setting Taken Date for {len(filepaths)} image(s)...")
+            self.statusBar().showMessage(f"Setting Taken Date for {len(images_to_update)} image(s)...")
             
-            # Write Taken Date for each image
+            self.flush_pending_writes()
+            
+            # Group images writing the same dates, then write all groups at once
+            groups: Dict[tuple, List[Path]] = {}
             for image in images_to_update:
-                taken_date_str = image.creation_date.strftime('%Y:%m:%d %H:%M:%S')
+                taken_date_str = format_exif_datetime(image.creation_date)
                 # Concatenate timezone offset to XMP tag if available
                 tz_offset = image.tz_offset or ""
                 xmp_date_str = taken_date_str + tz_offset if tz_offset else taken_date_str
-                metadata = {
+                groups.setdefault((taken_date_str, xmp_date_str), []).append(image.filepath)
+            
+            self.exiftool_service.write_metadata_batch([
+                (paths, {
                     'EXIF:DateTimeOriginal': taken_date_str,
                     'XMP-exif:DateTimeOriginal': xmp_date_str
-                }
-                self.exiftool_service.write_metadata([image.filepath], metadata)
+                })
+                for (taken_date_str, xmp_date_str), paths in groups.items()
+            ])
             
             QMessageBox.information(
                 self,
                 "Success",
-                f"Taken Date set successfully for {len(filepaths)} image(s)."
+                f"Taken Date set successfully for {len(images_to_update)} image(s)."
             )
             
             # Reload images
@@ -1637,9 +1711,9 @@ class MainWindow(QMainWindow):
     
     def set_gps_date_from_taken(self):
         """Set GPS Date from Taken Date for selected images"""
-        selected_rows = self.table.selectionModel().selectedRows()
+        selected_images = self._selected_images()
         
-        if not selected_rows:
+        if not selected_images:
             QMessageBox.information(
                 self,
                 "No Selection",
@@ -1648,17 +1722,9 @@ class MainWindow(QMainWindow):
             return
         
         # Get selected images with Taken Date but without GPS Date
-        images_to_update = []
-        filepaths = []
-        for row in selected_rows:
-            item = self.table.item(row.row(), 0)
-            if item:
-                image = item.data(Qt.ItemDataRole.UserRole)
-                if image and image.taken_date and not image.gps_date:
-                    images_to_update.append(image)
-                    filepaths.append(image.filepath)
-        
-        if not filepaths:
+        images_to_update = [image for _, image in selected_images if image.taken_date and not image.gps_date]
+        
+        if not images_to_update:
             QMessageBox.information(
                 self,
                 "No Images to Update",
@@ -1670,7 +1736,7 @@ class MainWindow(QMainWindow):
         reply = QMessageBox.question(
             self,
             "Confirm Set GPS Date",
-            f"Set GPS Date from Taken Date for {len(filepaths)} image(s)?",
+            f"Set GPS Date from Taken Date for {len(images_to_update)} image(s)?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
@@ -1678,53 +1744,37 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            self.statusBar().showMessage(f"Setting GPS Date for {len(filepaths)} image(s)...")
+            self.statusBar().showMessage(f"Setting GPS Date for {len(images_to_update)} image(s)...")
+            
+            self.flush_pending_writes()
             
-            # Write GPS Date for each image (convert to UTC)
+            # Group images by GPS date/time (UTC), then write all groups at once
+            groups: Dict[tuple, List[Path]] = {}
             for image in images_to_update:
                 # Convert Taken Date (local time) to UTC using TZ Offset
-                if image.tz_offset:
-                    # Parse offset string
-                    try:
-                        from datetime import timedelta
-                        sign = 1 if image.tz_offset[0] == '+' else -1
-                        hours = int(image.tz_offset[1:3])
-                        minutes = int(image.tz_offset[4:6])
-                        offset_seconds = sign * (hours * 3600 + minutes * 60)
-                        
-                        # Convert to UTC by subtracting the offset
-                        gps_utc = image.taken_date - timedelta(seconds=offset_seconds)
-                    except (ValueError, IndexError):
-                        # If offset parsing fails, use taken_date as-is
-                        gps_utc = image.taken_date
-                else:
-                    # No offset, assume taken_date is already in UTC
+                utc_offset = parse_tz_offset(image.tz_offset)
+                if utc_offset is None:
+                    # No offset or parsing fails: assume taken_date is already in UTC
                     gps_utc = image.taken_date
-                
-                gps_date_str = gps_utc.strftime('%Y:%m:%d')
-                gps_time_str = gps_utc.strftime('%H:%M:%S')
-                metadata = {
+                else:
+                    # Convert to UTC by subtracting the offset
+                    gps_utc = image.taken_date - utc_offset
+                groups.setdefault((format_exif_date(gps_utc), format_exif_time(gps_utc)), []).append(image.filepath)
+            
+            self.exiftool_service.write_metadata_batch([
+                (paths, {
                     'EXIF:GPSDateStamp': gps_date_str,
-                    'EXIF:GPSTimeStamp': gps_time_str
-                }
-                self.exiftool_service.write_metadata([image.filepath], metadata)
-                
-                # Read Composite:GPSDateTime and write to XMP-exif:GPSDateTime
-                try:
-                    file_metadata = self.exiftool_service.read_metadata(image.filepath)
-                    composite_gps = file_metadata.get('Composite:GPSDateTime')
-                    if composite_gps:
-                        self.exiftool_service.write_metadata(
-                            [image.filepath],
-                            {'XMP-exif:GPSDateTime': composite_gps}
-                        )
-                except Exception:
-                    pass  # Silently ignore if composite read/write fails
+                    'EXIF:GPSTimeStamp': gps_time_str,
+                    # Same value as ExifTool's Composite:GPSDateTime, without reading it back
+                    'XMP-exif:GPSDateTime': f"{gps_date_str} {gps_time_str}Z"
+                })
+                for (gps_date_str, gps_time_str), paths in groups.items()
+            ])
             
             QMessageBox.information(
                 self,
                 "Success",
-                f"GPS Date set successfully for {len(filepaths)} image(s)."
+                f"GPS Date set successfully for {len(images_to_update)} image(s)."
             )
             
             # Reload images
@@ -1743,103 +1793,45 @@ class MainWindow(QMainWindow):
         if obj == self.table and event.type() == QEvent.Type.KeyPress:
             key_event = event
             if key_event.key() in (Qt.Key.Key_Delete, Qt.Key.Key_Backspace):
-                # Get current item
-                current_item = self.table.currentItem()
-                if current_item:
-                    col = current_item.column()
-                    # Allow deletion for editable columns: Taken Date (1), TZ Offset (2), GPS Coordinates (3), City (4), Sublocation (5),
-                    # Headline (6), Camera Model (7), GPS Date (9), Country (10), Keywords (11), Created Date (12)
-                    if col in (1, 2, 3, 4, 5, 6, 7, 9, 10, 11, 12):
-                        row = current_item.row()
-                        filename_item = self.table.item(row, 0)
-                        if filename_item:
-                            image = filename_item.data(Qt.ItemDataRole.UserRole)
-                            if image:
-                                # Clear the value
-                                current_item.setText("")
-                                
-                                # Determine which metadata tags to clear
-                                tags_to_clear = []
-                                field_name = None
+                # Get current cell
+                current_index = self.table.currentIndex()
+                if current_index.isValid():
+                    # Columns that can be cleared, with their tags (same as the header context menu)
+                    metadata_info = self.column_metadata_map.get(current_index.column())
+                    if metadata_info is not None:
+                        row = current_index.row()
+                        image = self.table_model.image_at(row)
+                        if image:
+                            tags_to_clear = metadata_info['tags']
+                            field_name = metadata_info['field']
+                            
+                            # Clear from file
+                            self.flush_pending_writes()
+                            try:
+                                self.exiftool_service.delete_tags([image.filepath], tags_to_clear)
                                 
-                                if col == 1:  # Taken Date
-                                    tags_to_clear = ['EXIF:DateTimeOriginal', 'XMP-exif:DateTimeOriginal']
-                                    field_name = 'taken_date'
-                                elif col == 2:  # TZ Offset
-                                    tags_to_clear = [
-                                        'EXIF:TimeZoneOffset',
-                                        'EXIF:OffsetTime',
-                                        'EXIF:OffsetTimeOriginal',
-                                        'EXIF:OffsetTimeDigitized'
-                                    ]
-                                    field_name = 'tz_offset'
-                                elif col == 3:  # GPS Coordinates
-                                    tags_to_clear = [
-                                        'EXIF:GPSLatitude',
-                                        'EXIF:GPSLongitude',
-                                        'EXIF:GPSLatitudeRef',
-                                        'EXIF:GPSLongitudeRef'
-                                    ]
-                                    field_name = 'gps_coordinates'
-                                elif col == 4:  # City
-                                    tags_to_clear = ['IPTC:City', 'XMP-photoshop:City']
-                                    field_name = 'city'
-                                elif col == 5:  # Sublocation
-                                    tags_to_clear = ['IPTC:Sub-location', 'XMP-iptcCore:Location']
-                                    field_name = 'sublocation'
-                                elif col == 6:  # Headline
-                                    tags_to_clear = ['IPTC:Headline', 'XMP-photoshop:Headline']
-                                    field_name = 'headline'
-                                elif col == 7:  # Camera Model
-                                    tags_to_clear = ['EXIF:Model']
-                                    field_name = 'camera_model'
-                                elif col == 9:  # GPS Date
-                                    tags_to_clear = ['EXIF:GPSDateStamp', 'EXIF:GPSTimeStamp']
-                                    field_name = 'gps_date'
-                                elif col == 10:  # Country
-                                    tags_to_clear = [
-                                        'XMP-photoshop:Country',
-                                        'IPTC:Country-PrimaryLocationName',
-                                        'XMP-iptcCore:CountryCode',
-                                        'IPTC:Country-PrimaryLocationCode'
-                                    ]
-                                    field_name = 'country'
-                                elif col == 11:  # Keywords
-                                    tags_to_clear = ['IPTC:Keywords', 'XMP-dc:Subject']
-                                    field_name = 'keywords'
-                                elif col == 12:  # Created Date
-                                    tags_to_clear = ['EXIF:CreateDate', 'XMP-exif:DateTimeDigitized']
-                                    field_name = 'created_date'
+                                # Update image model
+                                clear_field = _FIELD_CLEARERS.get(field_name)
+                                if clear_field:
+                                    clear_field(image)
                                 else:
-                                    return super().eventFilter(obj, event)
+                                    setattr(image, field_name, None)
+                                metadata = image.metadata
+                                for tag in tags_to_clear:
+                                    metadata.pop(tag, None)
                                 
-                                # Clear from file
-                                try:
-                                    for tag in tags_to_clear:
-                                        self.exiftool_service.delete_tag([image.filepath], tag)
-                                    
-                                    # Update image model
-                                    if field_name == 'keywords':
-                                        # For keywords, set to empty list
-                                        image.keywords = []
-                                    elif field_name == 'gps_coordinates':
-                                        # For GPS coordinates, clear both lat and lon
-                                        image.gps_latitude = None
-                                        image.gps_longitude = None
-                                        # Update map to remove marker
-                                        self.update_all_images_on_map()
-                                    else:
-                                        setattr(image, field_name, None)
-                                    
-                                    for tag in tags_to_clear:
-                                        if tag in image.metadata:
-                                            del image.metadata[tag]
-                                    
-                                    self.statusBar().showMessage(f"Cleared {field_name.replace('_', ' ')} for {image.filename}")
-                                except Exception as e:
-                                    self.statusBar().showMessage(f"Error clearing {field_name}: {e}")
+                                if field_name == 'gps_coordinates':
+                                    # Update map to remove marker
+                                    self.update_all_images_on_map()
                                 
-                                return True  # Event handled
+                                self.statusBar().showMessage(f"Cleared {field_name.replace('_', ' ')} for {image.filename}")
+                            except Exception as e:
+                                self.statusBar().showMessage(f"Error clearing {field_name}: {e}")
+                            
+                            # Show the cleared value
+                            self.table_model.refresh_row(row)
+                            
+                            return True  # Event handled
         
         # Handle resize events for the scroll area to rescale the image
         if hasattr(self, 'scroll_area') and obj == self.scroll_area and event.type() == QEvent.Type.Resize:
@@ -1854,26 +1846,10 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage("Reloading images...")
         
         # Remember current selection
-        selected_filenames = []
-        selected_rows = self.table.selectionModel().selectedRows()
-        for row in selected_rows:
-            item = self.table.item(row.row(), 0)
-            if item:
-                image = item.data(Qt.ItemDataRole.UserRole)
-                if image:
-                    selected_filenames.append(image.filename)
-        
-        # Reload images
-        self.load_images()
+        selected_filenames = [image.filename for _, image in self._selected_images()]
         
-        # Restore selection
-        if selected_filenames:
-            for row in range(self.table.rowCount()):
-                item = self.table.item(row, 0)
-                if item:
-                    image = item.data(Qt.ItemDataRole.UserRole)
-                    if image and image.filename in selected_filenames:
-                        self.table.selectRow(row)
+        # Reload images, the selection is restored once they are loaded
+        self.load_images(selected_filenames)
     
     def _create_recycle_bin_icon(self) -> QIcon:
         """Create a recycle bin icon for context menu"""
@@ -1942,8 +1918,10 @@ class MainWindow(QMainWindow):
         menu.setToolTipsVisible(True)
         
         # Add clear action with icon
-        recycle_icon = self._create_recycle_bin_icon()
-        column_name = self.table.horizontalHeaderItem(logical_index).text()
+        if self._recycle_bin_icon is None:
+            self._recycle_bin_icon = self._create_recycle_bin_icon()
+        recycle_icon = self._recycle_bin_icon
+        column_name = self.table_model.headerData(logical_index, Qt.Orientation.Horizontal)
         clear_action = QAction(recycle_icon, f"Clear '{column_name}' for selected images", self)
         clear_action.setIconVisibleInMenu(True)  # Explicitly enable icon
         clear_action.triggered.connect(lambda: self._clear_column_with_confirmation(logical_index))
@@ -1958,7 +1936,7 @@ class MainWindow(QMainWindow):
         if not selected_rows:
             return
         
-        column_name = self.table.horizontalHeaderItem(column).text()
+        column_name = self.table_model.headerData(column, Qt.Orientation.Horizontal)
         result = QMessageBox.question(
             self,
             "Clear Column",
@@ -1975,74 +1953,38 @@ class MainWindow(QMainWindow):
         if metadata_info is None:
             return
         
-        selected_rows = self.table.selectionModel().selectedRows()
-        if not selected_rows:
+        selected_images = self._selected_images()
+        if not selected_images:
             return
         
         tags_to_clear = metadata_info['tags']
         field_name = metadata_info['field']
         
-        # Get selected images
-        selected_images = []
-        for row in selected_rows:
-            item = self.table.item(row.row(), 0)
-            if item:
-                image = item.data(Qt.ItemDataRole.UserRole)
-                if image:
-                    selected_images.append((row.row(), image))
-        
-        if not selected_images:
-            return
-        
         try:
-            # Delete tags from files
+            self.flush_pending_writes()
+            
+            # Delete all tags of the column from all files at once
             filepaths = [img.filepath for _, img in selected_images]
-            for tag in tags_to_clear:
-                try:
-                    self.exiftool_service.delete_tag(filepaths, tag)
-                except Exception as e:
-                    print(f"Warning: Could not delete tag {tag}: {e}")
+            try:
+                self.exiftool_service.delete_tags(filepaths, tags_to_clear)
+            except Exception as e:
+                print(f"Warning: Could not delete tags {', '.join(tags_to_clear)}: {e}")
             
-            # Update UI and model
-            self.table.blockSignals(True)
-            for row, image in selected_images:
-                # Clear the cell
-                item = self.table.item(row, column)
-                if item:
-                    item.setText("")
-                
-                # Clear the model field
-                if field_name == 'taken_date':
-                    image.taken_date = None
-                elif field_name == 'tz_offset':
-                    image.tz_offset = None
-                elif field_name == 'gps_coordinates':
-                    image.gps_latitude = None
-                    image.gps_longitude = None
-                elif field_name == 'city':
-                    image.city = None
-                elif field_name == 'sublocation':
-                    image.sublocation = None
-                elif field_name == 'headline':
-                    image.headline = None
-                elif field_name == 'camera_model':
-                    image.camera_model = None
-                elif field_name == 'gps_date':
-                    image.gps_date = None
-                elif field_name == 'country':
-                    image.country = None
-                elif field_name == 'keywords':
-                    image.keywords = []
-                elif field_name == 'created_date':
-                    image.created_date = None
+            # Update model and UI
+            clear_field = _FIELD_CLEARERS.get(field_name) or (lambda image: setattr(image, field_name, None))
+            for _, image in selected_images:
+                clear_field(image)
+                metadata = image.metadata
+                for tag in tags_to_clear:
+                    metadata.pop(tag, None)
             
-            self.table.blockSignals(False)
+            self.table_model.refresh_rows(row for row, _ in selected_images)
             
             # Update map if GPS coordinates were cleared
             if field_name == 'gps_coordinates':
                 self.update_all_images_on_map()
             
-            column_name = self.table.horizontalHeaderItem(column).text()
+            column_name = self.table_model.headerData(column, Qt.Orientation.Horizontal)
             self.statusBar().showMessage(
                 f"Cleared '{column_name}' for {len(selected_images)} image(s)"
             )
@@ -2071,45 +2013,17 @@ class MainWindow(QMainWindow):
         ai_settings = Config.get_ai_settings()
         threshold = ai_settings['similarity_threshold']
         
-        # Show progress dialog
-        progress = ProgressDialog("Finding Similar Photos", self)
-        progress.set_status("Initializing AI model...")
-        progress.set_indeterminate(True)
-        progress.show()
+        # Compute similarity in the background
+        image_paths = [img.filepath for img in self.images]
+        ai_service = self.ai_service
         
-        # Process events to show the dialog
-        from PySide6.QtCore import QCoreApplication
-        QCoreApplication.processEvents()
+        def find_similar(report_progress, is_cancelled):
+            return ai_service.compute_similarity(image_paths, threshold, report_progress)
         
-        try:
-            # Get all image paths
-            image_paths = [img.filepath for img in self.images]
-            
-            # Set determinate progress
-            progress.set_indeterminate(False)
-            
-            # Compute similarity
-            def progress_callback(current, total):
-                if progress.is_cancelled():
-                    return
-                progress.set_progress(current, total)
-                QCoreApplication.processEvents()
-            
-            similarity_groups = self.ai_service.compute_similarity(
-                image_paths,
-                threshold,
-                progress_callback
-            )
-            
-            # Close progress dialog
-            progress.close()
-            
-            if progress.is_cancelled():
-                self.statusBar().showMessage("Similarity search cancelled")
-                return
-            
+        def show_similar(similarity_groups):
             # Show results dialog
             if similarity_groups:
+                self.flush_pending_writes()
                 dialog = SimilarityDialog(similarity_groups, self)
                 dialog.images_deleted.connect(self._on_images_deleted)
                 dialog.exec()
@@ -2121,13 +2035,13 @@ class MainWindow(QMainWindow):
                     "Try lowering the similarity threshold in AI Tools > Settings."
                 )
         
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to find similar photos:\n{str(e)}"
-            )
+        self._start_ai_task(
+            "Finding Similar Photos",
+            find_similar,
+            show_similar,
+            "Failed to find similar photos",
+            "Similarity search cancelled"
+        )
     
     def _predict_locations(self):
         """Predict GPS locations for images without coordinates"""
@@ -2153,41 +2067,28 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Show progress dialog
-        progress = ProgressDialog("Predicting Locations", self)
-        progress.set_status("Initializing AI model...")
-        progress.set_indeterminate(True)
-        progress.show()
-        
-        # Process events to show the dialog
-        from PySide6.QtCore import QCoreApplication
-        QCoreApplication.processEvents()
+        # Predict locations in the background
+        filepaths = [image.filepath for image in images_without_gps]
+        ai_service = self.ai_service
         
-        try:
-            # Set determinate progress
-            progress.set_indeterminate(False)
-            
-            # Predict locations for each image
+        def predict_locations(report_progress, is_cancelled):
+            # One mini-batch at a time (images of a batch are decoded in
+            # parallel and run through the model together)
             predictions = {}
-            for i, image in enumerate(images_without_gps):
-                if progress.is_cancelled():
+            batch_size = ai_service.CLIP_BATCH_SIZE
+            for start in range(0, len(filepaths), batch_size):
+                if is_cancelled():
                     break
                 
-                progress.set_progress(i, len(images_without_gps))
-                progress.set_detail(f"Analyzing {image.filepath.name}...")
-                QCoreApplication.processEvents()
-                
-                location_list = self.ai_service.predict_location(image.filepath, top_k=5)
-                if location_list:
-                    predictions[image.filepath] = location_list
-            
-            # Close progress dialog
-            progress.close()
-            
-            if progress.is_cancelled():
-                self.statusBar().showMessage("Location prediction cancelled")
-                return
-            
+                report_progress(start, len(filepaths))
+                batch_paths = filepaths[start:start + batch_size]
+                location_lists = ai_service.predict_location_batch(batch_paths, top_k=5)
+                for filepath, location_list in zip(batch_paths, location_lists):
+                    if location_list:
+                        predictions[filepath] = location_list
+            return predictions
+        
+        def show_predictions(predictions):
             # Show results dialog
             if predictions:
                 dialog = GeolocationDialog(predictions, self)
@@ -2202,30 +2103,109 @@ class MainWindow(QMainWindow):
                     "recognizable geographic features."
                 )
         
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to predict locations:\n{str(e)}"
-            )
+        self._start_ai_task(
+            "Predicting Locations",
+            predict_locations,
+            show_predictions,
+            "Failed to predict locations",
+            "Location prediction cancelled"
+        )
+    
+    def _start_ai_task(self, title: str, work, on_finished, error_message: str, cancel_message: str):
+        """
+        Run an AI computation in the background behind a progress dialog
+        
+        Args:
+            title: Progress dialog title
+            work: Function run in the background, see AITaskRunner.start
+            on_finished: Called in the GUI thread with the result of work
+            error_message: Message shown if work fails
+            cancel_message: Status bar message shown if the user cancels
+        """
+        progress = ProgressDialog(title, self)
+        progress.set_status("Initializing AI model...")
+        progress.set_indeterminate(True)
+        progress.cancel_requested.connect(self._cancel_ai_task)
+        progress.show()
+        
+        self._ai_task = (progress, on_finished, error_message, cancel_message)
+        self.ai_runner.start(work)
+    
+    def _on_ai_progress(self, current: int, total: int):
+        """Show the progress of the running AI task"""
+        if self._ai_task:
+            progress = self._ai_task[0]
+            progress.set_indeterminate(False)
+            progress.set_progress(current, total)
+    
+    def _on_ai_finished(self, result):
+        """Close the progress dialog and hand the AI task result to its handler"""
+        if not self._ai_task:
+            return
+        progress, on_finished, _, _ = self._ai_task
+        self._ai_task = None
+        progress.close()
+        on_finished(result)
+    
+    def _on_ai_failed(self, message: str):
+        """Close the progress dialog and report the AI task error"""
+        if not self._ai_task:
+            return
+        progress, _, error_message, _ = self._ai_task
+        self._ai_task = None
+        progress.close()
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"{error_message}:\n{message}"
+        )
+    
+    def _cancel_ai_task(self):
+        """Stop the running AI task, its result is discarded"""
+        if not self._ai_task:
+            return
+        progress, _, _, cancel_message = self._ai_task
+        self._ai_task = None
+        self.ai_runner.cancel()
+        progress.close()
+        self.statusBar().showMessage(cancel_message)
+    
+    @property
+    def ai_service(self):
+        """AI service, created on first use
+        
+        Importing the AI module and opening its databases is deferred until an
+        AI tool is used, which keeps it out of the window startup.
+        """
+        if self._ai_service is None:
+            from ..services.ai_service import AIService
+            ai_settings = Config.get_ai_settings()
+            self._ai_service = AIService(ai_settings['model_cache_dir'])
+        return self._ai_service
+    
+    def _close_ai_service(self):
+        """Stop AI tasks and release the AI service, if it was created"""
+        self.ai_runner.shutdown()
+        if self._ai_service is not None:
+            self._ai_service.close()
+            self._ai_service = None
     
     def _show_ai_settings(self):
         """Show AI settings dialog"""
         dialog = SettingsDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Reload AI service with new settings
-            ai_settings = Config.get_ai_settings()
-            self.ai_service = AIService(ai_settings['model_cache_dir'])
+            # Recreate AI service with new settings on next use
+            self._close_ai_service()
             self.statusBar().showMessage("Settings updated")
     
     def _on_images_deleted(self, deleted_paths):
         """Handle images deleted from similarity dialog"""
         # Remove deleted images from the list
-        self.images = [img for img in self.images if img.filepath not in deleted_paths]
+        deleted_set = set(deleted_paths)
+        self.images = [img for img in self.images if img.filepath not in deleted_set]
         
         # Refresh the table
-        self.populate_table()
+        self.table_model.set_images(self.images)
         
         # Update map
         self.update_all_images_on_map()
@@ -2238,65 +2218,70 @@ class MainWindow(QMainWindow):
         Args:
             locations_dict: Dict of {image_path: {'lat': lat, 'lon': lon, 'country': country, 'city': city}}
         """
-        count = 0
+        self.flush_pending_writes()
+        
+        images_by_path = {image.filepath: image for image in self.images}
+        
+        # Collect the metadata of all images, written with a single batch
+        writes = []
+        located_images = []
         for image_path_str, location_data in locations_dict.items():
-            image_path = Path(image_path_str)
+            image = images_by_path.get(Path(image_path_str))
+            if image is None:
+                continue
+            
             lat = location_data['lat']
             lon = location_data['lon']
             country_name = location_data.get('country')
             city_name = location_data.get('city')
             
-            # Find the image in our list
-            for image in self.images:
-                if image.filepath == image_path:
-                    # Prepare GPS metadata with absolute values and explicit Ref tags
-                    metadata = {
-                        'GPSLatitude': str(abs(lat)),
-                        'GPSLatitudeRef': 'N' if lat >= 0 else 'S',
-                        'GPSLongitude': str(abs(lon)),
-                        'GPSLongitudeRef': 'E' if lon >= 0 else 'W',
-                    }
-                    
-                    # Add country info if available
-                    if country_name:
-                        # Use country code from reverse geocoding if available (more reliable)
-                        country_code = location_data.get('country_code')
-                        
-                        if not country_code:
-                            # Fallback: try to match by country name
-                            from .table_delegates import CountryDelegate
-                            normalized_country = self.reverse_geocoding_service.normalize_country_name(country_name)
-                            for code, name in CountryDelegate.COUNTRY_LIST:
-                                if name.lower() == normalized_country.lower():
-                                    country_code = code
-                                    break
-                        
-                        # If we found a matching country code, use centralized update logic
-                        if country_code:
-                            country_metadata = self.update_image_field(image, 'country_code', country_code)
-                            # Merge country metadata into main metadata dict
-                            metadata.update({k: v for k, v in country_metadata.items() if not k.startswith('_')})
-                        else:
-                            # Debug: country couldn't be matched
-                            print(f"Warning: Could not find country code for '{country_name}'")
-                    
-                    # Add city if available
-                    if city_name:
-                        metadata['IPTC:City'] = city_name
-                        metadata['XMP-photoshop:City'] = city_name
-                        image.city = city_name
-                    
-                    # Write GPS coordinates and location metadata
-                    self.exiftool_service.write_metadata([image.filepath], metadata)
-                    
-                    # Update image model GPS coordinates
-                    image.gps_latitude = lat
-                    image.gps_longitude = lon
-                    count += 1
-                    break
+            # Prepare GPS metadata with absolute values and explicit Ref tags
+            metadata = {
+                'GPSLatitude': str(abs(lat)),
+                'GPSLatitudeRef': 'N' if lat >= 0 else 'S',
+                'GPSLongitude': str(abs(lon)),
+                'GPSLongitudeRef': 'E' if lon >= 0 else 'W',
+            }
+            
+            # Add country info if available
+            if country_name:
+                # Use country code from reverse geocoding if available (more reliable)
+                country_code = location_data.get('country_code')
+                
+                if not country_code:
+                    # Fallback: try to match by country name
+                    normalized_country = self.reverse_geocoding_service.normalize_country_name(country_name)
+                    country_code = _COUNTRY_CODES_LOWER.get(normalized_country.lower())
+                
+                # If we found a matching country code, use centralized update logic
+                if country_code:
+                    country_metadata = self.update_image_field(image, 'country_code', country_code)
+                    # Merge country metadata into main metadata dict
+                    metadata.update({k: v for k, v in country_metadata.items() if not k.startswith('_')})
+                else:
+                    # Debug: country couldn't be matched
+                    print(f"Warning: Could not find country code for '{country_name}'")
+            
+            # Add city if available
+            if city_name:
+                metadata['IPTC:City'] = city_name
+                metadata['XMP-photoshop:City'] = city_name
+                image.city = city_name
+            
+            writes.append(([image.filepath], metadata))
+            located_images.append((image, lat, lon))
+        
+        # Write GPS coordinates and location metadata
+        self.exiftool_service.write_metadata_batch(writes)
+        
+        # Update image models GPS coordinates
+        for image, lat, lon in located_images:
+            image.gps_latitude = lat
+            image.gps_longitude = lon
+        count = len(located_images)
         
         # Refresh the table
-        self.populate_table()
+        self.table_model.set_images(self.images)
         
         # Update map
         self.update_all_images_on_map()
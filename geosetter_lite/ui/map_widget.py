@@ -1,17 +1,16 @@
 """
 Map Widget - Display images on an OpenStreetMap using Leaflet
 """
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, List, Set, Tuple, Optional
 import json
 import base64
+import os
 from pathlib import Path
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebEngineCore import QWebEngineScript, QWebEngineUrlRequestInterceptor, QWebEngineProfile
 from PySide6.QtWebChannel import QWebChannel
-from PySide6.QtCore import QUrl, QObject, Signal, Slot
-from PIL import Image
-import io
+from PySide6.QtCore import QUrl, QObject, QRunnable, QThreadPool, Signal, Slot
 from ..core.config import Config
 
 # Import Leaflet resources from Qt resource system
@@ -62,12 +61,37 @@ class MapClickHandler(QObject):
         self.clicked.emit(lat, _wrap_longitude(lng))
 
 
+class _ThumbnailTask(QRunnable):
+    """Generate the popup thumbnail of one marker image in a pool thread"""
+    
+    def __init__(self, widget: 'MapWidget', key: str, filepath: str):
+        """
+        Initialize the task
+        
+        Args:
+            widget: Map widget notified of the result
+            key: Thumbnail cache key of the file version
+            filepath: Path to the image file
+        """
+        super().__init__()
+        self.widget = widget
+        self.key = key
+        self.filepath = filepath
+    
+    def run(self):
+        """Generate the thumbnail and report it to the map widget"""
+        self.widget._thumbnail_ready.emit(self.key, MapWidget._generate_thumbnail(self.filepath) or "")
+
+
 class MapWidget(QWidget):
     """Widget for displaying a map with image markers"""
     
     # Signal emitted when map is clicked
     map_clicked = Signal(float, float)
     
+    # Internal signal emitted from pool threads: (thumbnail cache key, data URL or "")
+    _thumbnail_ready = Signal(str, str)
+    
     def __init__(self, parent=None):
         """Initialize the map widget"""
         super().__init__(parent)
@@ -91,6 +115,16 @@ class MapWidget(QWidget):
         self.preserve_viewport_completely: bool = False  # Set when map click, don't recenter
         self.skip_viewport_capture: bool = False  # Skip capture when fitting to selected markers
         
+        # Popup thumbnails are generated in the background and kept per file version:
+        # cache key -> data URL ("" when the thumbnail cannot be generated)
+        self._thumbnails: Dict[str, str] = {}
+        self._pending_thumbnails: Set[str] = set()
+        # Markers of the loaded page still waiting for their thumbnail: cache key -> marker IDs
+        self._missing_thumbnails: Dict[str, List[str]] = {}
+        self._page_loading: bool = False
+        self._thumbnail_pool = QThreadPool(self)
+        self._thumbnail_ready.connect(self._on_thumbnail_ready)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -110,6 +144,8 @@ class MapWidget(QWidget):
         self.channel.registerObject("clickHandler", self.click_handler)
         self.web_view.page().setWebChannel(self.channel)
         
+        self.web_view.loadFinished.connect(self._on_load_finished)
+        
         layout.addWidget(self.web_view)
         
         self.setLayout(layout)
@@ -140,6 +176,7 @@ class MapWidget(QWidget):
         """Actually load the map HTML"""
         self.pending_reload = False
         html = self._generate_map_html()
+        self._page_loading = True
         self.web_view.setHtml(html)
     
     def _generate_map_html(self) -> str:
@@ -183,10 +220,19 @@ class MapWidget(QWidget):
         """
         
         # Add regular image markers
+        self._missing_thumbnails = {}
+        thumbnails = {}
         if self.markers:
             for marker_id, (lat, lon, name, is_selected, filepath) in self.markers.items():
-                # Generate popup content with thumbnail
-                popup_html = self._generate_popup_html(name, filepath)
+                # Generate popup content with the thumbnail, if already generated
+                key = self._thumbnail_key(filepath)
+                thumbnail_data = self._thumbnails.get(key) if key else None
+                if thumbnail_data is not None:
+                    thumbnails[key] = thumbnail_data
+                elif key:
+                    self._request_thumbnail(key, filepath)
+                    self._missing_thumbnails.setdefault(key, []).append(marker_id)
+                popup_html = self._generate_popup_html(name, thumbnail_data)
                 escaped_popup = json.dumps(popup_html)
                 
                 # Use different icons for selected vs unselected
@@ -196,6 +242,9 @@ class MapWidget(QWidget):
                 window.imageMarkers[{escaped_id}] = L.marker([{lat}, {lon}], {{icon: {icon_var}}}).addTo(map).bindPopup({escaped_popup});
                 """
         
+        # Only keep the thumbnails of the current markers (files edited since get a new key)
+        self._thumbnails = thumbnails
+        
         # Add active marker if set
         if self.active_marker:
             lat, lon = self.active_marker
@@ -482,7 +531,95 @@ class MapWidget(QWidget):
             """
         return ""
     
-    def _generate_thumbnail(self, filepath: Optional[str], max_size: int = 150) -> Optional[str]:
+    @staticmethod
+    def _thumbnail_key(filepath: Optional[str]) -> Optional[str]:
+        """
+        Build the thumbnail cache key of a file version
+        
+        Includes the change time, as metadata writes keep the modification time.
+        
+        Args:
+            filepath: Path to the image file
+            
+        Returns:
+            Cache key or None if there is no file
+        """
+        if not filepath:
+            return None
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return f"{filepath}:{stat.st_mtime_ns}:{stat.st_ctime_ns}:{stat.st_size}"
+    
+    def _request_thumbnail(self, key: str, filepath: str):
+        """
+        Generate a popup thumbnail in the background, unless already requested
+        
+        Args:
+            key: Thumbnail cache key of the file version
+            filepath: Path to the image file
+        """
+        if key not in self._pending_thumbnails:
+            self._pending_thumbnails.add(key)
+            self._thumbnail_pool.start(_ThumbnailTask(self, key, filepath))
+    
+    def shutdown(self):
+        """Drop pending thumbnails and wait for the ones being generated"""
+        self._thumbnail_pool.clear()
+        self._thumbnail_pool.waitForDone()
+    
+    def _on_thumbnail_ready(self, key: str, thumbnail_data: str):
+        """Store a generated thumbnail and show it in the popups of the loaded page"""
+        self._pending_thumbnails.discard(key)
+        self._thumbnails[key] = thumbnail_data
+        
+        # Popups of a page still loading are updated once it has loaded
+        if thumbnail_data and not self._page_loading and key in self._missing_thumbnails:
+            self._update_popups({key: self._missing_thumbnails.pop(key)})
+    
+    def _on_load_finished(self, ok: bool):
+        """Show the thumbnails generated while the page was loading"""
+        self._page_loading = False
+        ready = {
+            key: marker_ids
+            for key, marker_ids in self._missing_thumbnails.items()
+            if self._thumbnails.get(key)
+        }
+        if ready:
+            for key in ready:
+                del self._missing_thumbnails[key]
+            self._update_popups(ready)
+    
+    def _update_popups(self, marker_ids_by_key: Dict[str, List[str]]):
+        """
+        Set the popup content of the markers showing some files
+        
+        Args:
+            marker_ids_by_key: IDs of the markers to update, by thumbnail cache key
+        """
+        popups = {}
+        for key, marker_ids in marker_ids_by_key.items():
+            thumbnail_data = self._thumbnails[key]
+            for marker_id in marker_ids:
+                marker = self.markers.get(marker_id)
+                if marker is not None:
+                    popups[marker_id] = self._generate_popup_html(marker[2], thumbnail_data)
+        
+        if popups:
+            js = f"""
+            (function() {{
+                var popups = {json.dumps(popups)};
+                var markers = window.imageMarkers || {{}};
+                for (var id in popups) {{
+                    if (markers[id]) markers[id].setPopupContent(popups[id]);
+                }}
+            }})();
+            """
+            self.web_view.page().runJavaScript(js)
+    
+    @staticmethod
+    def _generate_thumbnail(filepath: Optional[str], max_size: int = 150) -> Optional[str]:
         """
         Generate a base64-encoded thumbnail for an image
         
@@ -493,6 +630,9 @@ class MapWidget(QWidget):
         Returns:
             Base64-encoded image data URL or None if generation fails
         """
+        import io
+        from PIL import Image
+        
         if not filepath:
             return None
         
@@ -503,6 +643,9 @@ class MapWidget(QWidget):
             
             # Open and resize image
             with Image.open(path) as img:
+                # Let the JPEG decoder scale down while decoding (no-op for other formats)
+                img.draft('RGB', (max_size, max_size))
+                
                 # Convert to RGB if necessary (for PNG with transparency, etc.)
                 if img.mode in ('RGBA', 'LA', 'P'):
                     background = Image.new('RGB', img.size, (255, 255, 255))
@@ -529,19 +672,18 @@ class MapWidget(QWidget):
             print(f"Error generating thumbnail for {filepath}: {e}")
             return None
     
-    def _generate_popup_html(self, filename: str, filepath: Optional[str]) -> str:
+    @staticmethod
+    def _generate_popup_html(filename: str, thumbnail_data: Optional[str]) -> str:
         """
         Generate HTML content for marker popup with thumbnail
         
         Args:
             filename: Name of the image file
-            filepath: Path to the image file
+            thumbnail_data: Thumbnail data URL (see _generate_thumbnail), None or empty if unavailable
             
         Returns:
             HTML string for the popup
         """
-        thumbnail_data = self._generate_thumbnail(filepath)
-        
         if thumbnail_data:
             return f"""
                 <div style="text-align: center; min-width: 150px;">
@@ -593,9 +735,13 @@ class MapWidget(QWidget):
                 # No selection - show all markers
                 self.auto_fit_bounds = True
         
-        # If only selection state changed (same markers, different selection), update icons only
+        # If only selection state changed (same markers, different selection), update
+        # the icons of the markers whose selection state changed
         if not markers_changed and old_markers:
-            self._update_marker_icons()
+            self._update_marker_icons(
+                marker_id for marker_id, marker in new_markers.items()
+                if marker[3] != old_markers[marker_id][3]
+            )
             return
         
         # Reload map based on selection type
@@ -607,31 +753,28 @@ class MapWidget(QWidget):
             # Normal reload (including for selections without geolocation)
             self.load_map()
     
-    def _update_marker_icons(self):
+    def _update_marker_icons(self, marker_ids: Optional[Iterable[str]] = None):
         """
         Update marker icons based on selection state without reloading the map.
         This is much faster than reloading the entire map HTML.
         Also adjusts the viewport to show selected markers.
+        
+        Args:
+            marker_ids: IDs of the markers to update (default: all markers)
         """
-        # Build JavaScript to update all marker icons
-        js_updates = []
-        selected_coords = []
-        
-        for marker_id, (lat, lon, name, is_selected, filepath) in self.markers.items():
-            escaped_id = json.dumps(marker_id)
-            # Determine which icon to use
-            icon_class = 'blueIcon' if is_selected else 'greyIcon'
-            js_updates.append(f"""
-                if (window.imageMarkers && window.imageMarkers[{escaped_id}]) {{
-                    var marker = window.imageMarkers[{escaped_id}];
-                    // Create the appropriate icon
-                    var newIcon = {icon_class};
-                    marker.setIcon(newIcon);
-                }}
-            """)
-            
-            if is_selected:
-                selected_coords.append((lat, lon))
+        if marker_ids is None:
+            marker_ids = self.markers.keys()
+        
+        # Markers to switch to the selected / unselected icon
+        selected_ids = []
+        unselected_ids = []
+        for marker_id in marker_ids:
+            if self.markers[marker_id][3]:  # is_selected
+                selected_ids.append(marker_id)
+            else:
+                unselected_ids.append(marker_id)
+        
+        selected_coords = [(lat, lon) for lat, lon, _, is_selected, _ in self.markers.values() if is_selected]
         
         # Calculate viewport adjustment for selected markers
         viewport_js = ""
@@ -671,8 +814,8 @@ class MapWidget(QWidget):
                 }}
                 """
         
-        # Execute JavaScript to update all markers and viewport
-        if js_updates:
+        # Execute JavaScript to update the markers and viewport
+        if selected_ids or unselected_ids or viewport_js:
             js = f"""
             (function() {{
                 // Define icons if they don't exist
@@ -701,7 +844,15 @@ class MapWidget(QWidget):
                     }});
                 }}
                 
-                {''.join(js_updates)}
+                function setIcons(ids, icon) {{
+                    if (!window.imageMarkers) return;
+                    ids.forEach(function(id) {{
+                        var marker = window.imageMarkers[id];
+                        if (marker) marker.setIcon(icon);
+                    }});
+                }}
+                setIcons({json.dumps(selected_ids)}, window.blueIcon);
+                setIcons({json.dumps(unselected_ids)}, window.greyIcon);
                 
                 {viewport_js}
             }})();
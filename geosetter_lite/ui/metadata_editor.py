@@ -131,8 +131,8 @@ class MetadataEditor(QDialog):
             return
         
         try:
-            # Load metadata from the first image
-            self.metadata = self.exiftool_service.read_metadata(self.filepaths[0])
+            # Load all metadata (including maker notes) from the first image
+            self.metadata = self.exiftool_service.read_metadata(self.filepaths[0], fast=False)
             
             # Populate table
             self.populate_table()
@@ -426,8 +426,7 @@ class MetadataEditor(QDialog):
             
             # Delete removed tags
             if tags_to_delete:
-                for tag in tags_to_delete:
-                    self.exiftool_service.delete_tag(self.filepaths, tag)
+                self.exiftool_service.delete_tags(self.filepaths, tags_to_delete)
             
             QMessageBox.information(
                 self,
@@ -13,6 +13,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon
 from ..models.image_model import ImageModel
 from ..core.config import Config
+from ..services.exiftool_service import ExifToolService, ExifToolError
 
 
 class RenameDialog(QDialog):
@@ -31,6 +32,9 @@ class RenameDialog(QDialog):
         self.images = images
         self.pattern = ""
         
+        # Tags already fetched for all images (scanning only reads a subset of tags)
+        self._loaded_tags = set()
+        
         self.init_ui()
         
         # Load saved pattern from config
@@ -233,12 +237,36 @@ class RenameDialog(QDialog):
             return None
         
         # Try to get from metadata dict directly
+        self._load_tag(tag)
         if image.metadata:
             if tag in image.metadata:
                 return str(image.metadata[tag])
         
         return None
     
+    def _load_tag(self, tag: str):
+        """
+        Read a tag of all images with one ExifTool command, if not done yet
+        
+        Args:
+            tag: Metadata tag (e.g., "EXIF:Make")
+        """
+        if tag in self._loaded_tags:
+            return
+        self._loaded_tags.add(tag)
+        
+        try:
+            results = ExifToolService.read_metadata_batch([image.filepath for image in self.images], tags=[tag])
+        except ExifToolError as e:
+            print(f"Warning: Could not read {tag}: {e}")
+            return
+        
+        for image, metadata in zip(self.images, results):
+            if metadata and tag in metadata:
+                if not image.metadata:
+                    image.metadata = {}
+                image.metadata[tag] = metadata[tag]
+    
     def update_preview(self):
         """Update the preview table with new filenames"""
         self.preview_table.setRowCount(len(self.images))
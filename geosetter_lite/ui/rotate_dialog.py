@@ -15,7 +15,6 @@ from ..services.exiftool_service import ExifToolService
 from ..services.jpegtran_lossless import jpegtran_lossless_rotate
 from .error_dialog import show_exiftool_error
 from .progress_dialog import ProgressDialog
-from PIL import Image, ImageOps
 
 
 class RotateDialog(QDialog):
@@ -209,6 +208,8 @@ class RotateDialog(QDialog):
 
     def rotate_selected_photos(self, auto: bool):
         """Rotate selected photos. If auto=True, only rotate those with EXIF:Orientation != 1. If auto=False, rotate all selected by 90°."""
+        from PIL import Image, ImageOps
+
         selected_widgets = []
         for widget in self.image_widgets:
             checkbox = widget.property("checkbox")
@@ -370,6 +371,8 @@ class RotateDialog(QDialog):
 
     def create_thumbnail(self, filepath: Path, orientation: int, manually_rotated: bool = False) -> QPixmap:
         """Create a low-resolution thumbnail for an image, preserving color and avoiding corruption. Do NOT auto-rotate for display."""
+        from PIL import Image
+
         try:
             # Support overlays for EXIF auto-rotatable (green triangle) and manual rotation (blue arrow)
             def _draw_overlays(painter, w, h, orientation, manually_rotated):
@@ -8,9 +8,7 @@ from PySide6.QtWidgets import (
     QGridLayout
 )
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap
-from PIL import Image
-import io
+from PySide6.QtGui import QImage, QPixmap
 
 
 class SimilarityDialog(QDialog):
@@ -186,8 +184,11 @@ class SimilarityDialog(QDialog):
         Returns:
             QPixmap with the thumbnail
         """
-        # Open image with PIL
+        from PIL import Image
+        
+        # Open image with PIL, letting the JPEG decoder scale down while decoding
         image = Image.open(image_path)
+        image.draft('RGB', (width, height))
         
         # Convert to RGB if necessary
         if image.mode != 'RGB':
@@ -196,15 +197,16 @@ class SimilarityDialog(QDialog):
         # Resize maintaining aspect ratio
         image.thumbnail((width, height), Image.Resampling.LANCZOS)
         
-        # Convert to QPixmap
-        buffer = io.BytesIO()
-        image.save(buffer, format='PNG')
-        buffer.seek(0)
-        
-        pixmap = QPixmap()
-        pixmap.loadFromData(buffer.read())
+        # Convert to QPixmap from the raw RGB pixels (the QImage keeps the bytes alive)
+        qimage = QImage(
+            image.tobytes('raw', 'RGB'),
+            image.width,
+            image.height,
+            3 * image.width,
+            QImage.Format.Format_RGB888
+        )
         
-        return pixmap
+        return QPixmap.fromImage(qimage)
     
     def _on_checkbox_changed(self, state):
         """Handle checkbox state change"""
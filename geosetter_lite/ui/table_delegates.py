@@ -6,6 +6,7 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 from PySide6.QtWidgets import QStyledItemDelegate, QComboBox, QWidget, QDateTimeEdit
 from PySide6.QtCore import Qt, QModelIndex, QDateTime, QEvent
+from ..core.utils import format_date, format_exif_date, format_exif_time, format_exif_datetime, parse_tz_offset
 
 
 class TimezoneDelegate(QStyledItemDelegate):
@@ -217,46 +218,42 @@ class TimezoneDelegate(QStyledItemDelegate):
         
         # Get the image for this row and update its metadata in the file
         row = index.row()
-        filename_item = self.main_window.table.item(row, 0)
-        if filename_item:
-            image = filename_item.data(Qt.ItemDataRole.UserRole)
-            if image:
-                # Write timezone to file using ExifTool
-                # Use EXIF:UserComment which is a reliable field for custom text data
-                try:
-                    metadata = {
-                        'EXIF:UserComment': f"Timezone:{tz_id}"
-                    }
-                    
-                    # Calculate TZ offset based on image's taken date or current date
-                    reference_date = image.taken_date if image.taken_date else datetime.now()
-                    tz_offset = self._calculate_tz_offset(tz_id, reference_date)
-                    
-                    if tz_offset:
-                        metadata['EXIF:TimeZoneOffset'] = tz_offset
-                    
-                    self.main_window.exiftool_service.write_metadata([image.filepath], metadata)
-                    
-                    # Update the image model
-                    # Note: ImageModel doesn't have a 'timezone' field, only 'tz_offset'
-                    if tz_offset:
-                        image.tz_offset = tz_offset
-                    
-                    if not image.metadata:
-                        image.metadata = {}
-                    image.metadata['EXIF:UserComment'] = f"Timezone:{tz_id}"
-                    if tz_offset:
-                        image.metadata['EXIF:TimeZoneOffset'] = tz_offset
-                    
-                    # Update TZ Offset column in the table (column 2)
-                    if tz_offset:
-                        tz_offset_item = self.main_window.table.item(row, 2)
-                        if tz_offset_item:
-                            tz_offset_item.setText(tz_offset)
-                    
-                    self.main_window.statusBar().showMessage(f"Updated timezone for {image.filename}")
-                except Exception as e:
-                    self.main_window.statusBar().showMessage(f"Error updating timezone: {e}")
+        image = index.data(Qt.ItemDataRole.UserRole)
+        if image:
+            # Write timezone to file using ExifTool
+            # Use EXIF:UserComment which is a reliable field for custom text data
+            try:
+                metadata = {
+                    'EXIF:UserComment': f"Timezone:{tz_id}"
+                }
+                
+                # Calculate TZ offset based on image's taken date or current date
+                reference_date = image.taken_date if image.taken_date else datetime.now()
+                tz_offset = self._calculate_tz_offset(tz_id, reference_date)
+                
+                if tz_offset:
+                    metadata['EXIF:TimeZoneOffset'] = tz_offset
+                
+                self.main_window.flush_pending_writes()
+                self.main_window.exiftool_service.write_metadata([image.filepath], metadata)
+                
+                # Update the image model
+                # Note: ImageModel doesn't have a 'timezone' field, only 'tz_offset'
+                if tz_offset:
+                    image.tz_offset = tz_offset
+                
+                if not image.metadata:
+                    image.metadata = {}
+                image.metadata['EXIF:UserComment'] = f"Timezone:{tz_id}"
+                if tz_offset:
+                    image.metadata['EXIF:TimeZoneOffset'] = tz_offset
+                
+                # Update TZ Offset column in the table
+                self.main_window.table_model.refresh_row(row)
+                
+                self.main_window.statusBar().showMessage(f"Updated timezone for {image.filename}")
+            except Exception as e:
+                self.main_window.statusBar().showMessage(f"Error updating timezone: {e}")
     
     def _calculate_tz_offset(self, timezone_id: str, reference_date: datetime) -> Optional[str]:
         """
@@ -554,35 +551,34 @@ class CountryDelegate(QStyledItemDelegate):
         
         # Get the image for this row and update its metadata in the file
         row = index.row()
-        filename_item = self.main_window.table.item(row, 0)
-        if filename_item:
-            image = filename_item.data(Qt.ItemDataRole.UserRole)
-            if image:
-                # Write country and country code to file using ExifTool
-                # Use correct tag mappings as specified
-                try:
-                    metadata = {
-                        'XMP-photoshop:Country': name,
-                        'IPTC:Country-PrimaryLocationName': name,
-                        'XMP-iptcCore:CountryCode': code,
-                        'IPTC:Country-PrimaryLocationCode': code
-                    }
-                    self.main_window.exiftool_service.write_metadata([image.filepath], metadata)
-                    # Update the image model
-                    image.country = name
-                    if not image.metadata:
-                        image.metadata = {}
-                    image.metadata['XMP-photoshop:Country'] = name
-                    image.metadata['IPTC:Country-PrimaryLocationName'] = name
-                    image.metadata['XMP-iptcCore:CountryCode'] = code
-                    image.metadata['IPTC:Country-PrimaryLocationCode'] = code
-                    
-                    # Auto-add country and country code to keywords
-                    self.main_window.update_keywords_with_country(row, name, code)
-                    
-                    self.main_window.statusBar().showMessage(f"Updated country for {image.filename}")
-                except Exception as e:
-                    self.main_window.statusBar().showMessage(f"Error updating country: {e}")
+        image = index.data(Qt.ItemDataRole.UserRole)
+        if image:
+            # Write country and country code to file using ExifTool
+            # Use correct tag mappings as specified
+            try:
+                metadata = {
+                    'XMP-photoshop:Country': name,
+                    'IPTC:Country-PrimaryLocationName': name,
+                    'XMP-iptcCore:CountryCode': code,
+                    'IPTC:Country-PrimaryLocationCode': code
+                }
+                self.main_window.flush_pending_writes()
+                self.main_window.exiftool_service.write_metadata([image.filepath], metadata)
+                # Update the image model
+                image.country = name
+                if not image.metadata:
+                    image.metadata = {}
+                image.metadata['XMP-photoshop:Country'] = name
+                image.metadata['IPTC:Country-PrimaryLocationName'] = name
+                image.metadata['XMP-iptcCore:CountryCode'] = code
+                image.metadata['IPTC:Country-PrimaryLocationCode'] = code
+                
+                # Auto-add country and country code to keywords
+                self.main_window.update_keywords_with_country(row, name, code)
+                
+                self.main_window.statusBar().showMessage(f"Updated country for {image.filename}")
+            except Exception as e:
+                self.main_window.statusBar().showMessage(f"Error updating country: {e}")
 
 
 class DateTimeDelegate(QStyledItemDelegate):
@@ -646,10 +642,10 @@ class DateTimeDelegate(QStyledItemDelegate):
                      qdt.time().hour(), qdt.time().minute(), qdt.time().second())
         
         # Format for EXIF (YYYY:MM:DD HH:MM:SS)
-        exif_format = dt.strftime("%Y:%m:%d %H:%M:%S")
+        exif_format = format_exif_datetime(dt)
         
         # Format for display (YYYY-MM-DD HH:MM:SS)
-        display_format = dt.strftime("%Y-%m-%d %H:%M:%S")
+        display_format = format_date(dt)
         
         # Set the display value in the table
         model.setData(index, display_format, Qt.ItemDataRole.EditRole)
@@ -657,81 +653,66 @@ class DateTimeDelegate(QStyledItemDelegate):
         # Get the image for this row and update its metadata in the file
         row = index.row()
         col = index.column()
-        filename_item = self.main_window.table.item(row, 0)
-        if filename_item:
-            image = filename_item.data(Qt.ItemDataRole.UserRole)
-            if image:
-                # Get timezone offset for XMP tags
-                tz_offset = image.tz_offset or ""
-                
-                # Determine which date field and tags to write
-                metadata = {}
-                field_name = None
+        image = index.data(Qt.ItemDataRole.UserRole)
+        if image:
+            # Get timezone offset for XMP tags
+            tz_offset = image.tz_offset or ""
+            
+            # Determine which date field and tags to write
+            metadata = {}
+            field_name = None
+            
+            if col == 1:  # Taken Date
+                field_name = 'taken_date'
+                metadata['EXIF:DateTimeOriginal'] = exif_format
+                # Concatenate timezone offset to XMP tag
+                xmp_format = exif_format + tz_offset if tz_offset else exif_format
+                metadata['XMP-exif:DateTimeOriginal'] = xmp_format
                 
-                if col == 1:  # Taken Date
-                    field_name = 'taken_date'
-                    metadata['EXIF:DateTimeOriginal'] = exif_format
-                    # Concatenate timezone offset to XMP tag
-                    xmp_format = exif_format + tz_offset if tz_offset else exif_format
-                    metadata['XMP-exif:DateTimeOriginal'] = xmp_format
-                    
-                    # Auto-set Created Date from Taken Date if not already set
-                    if not image.created_date:
-                        metadata['EXIF:CreateDate'] = exif_format
-                        metadata['XMP-exif:DateTimeDigitized'] = xmp_format
-                        
-                elif col == 12:  # Created Date
-                    field_name = 'created_date'
+                # Auto-set Created Date from Taken Date if not already set
+                if not image.created_date:
                     metadata['EXIF:CreateDate'] = exif_format
-                    # Concatenate timezone offset to XMP tag
-                    xmp_format = exif_format + tz_offset if tz_offset else exif_format
                     metadata['XMP-exif:DateTimeDigitized'] = xmp_format
-                elif col == 9:  # GPS Date
-                    field_name = 'gps_date'
-                    # GPS Date is always in UTC - user enters UTC time directly
-                    # Split into date and time for GPS tags
-                    gps_date = dt.strftime("%Y:%m:%d")
-                    gps_time = dt.strftime("%H:%M:%S")
-                    metadata['EXIF:GPSDateStamp'] = gps_date
-                    metadata['EXIF:GPSTimeStamp'] = gps_time
-                
-                if metadata:
-                    try:
-                        self.main_window.exiftool_service.write_metadata([image.filepath], metadata)
-                        
-                        # For GPS Date, read Composite:GPSDateTime and write to XMP-exif:GPSDateTime
-                        if col == 9:
-                            try:
-                                file_metadata = self.main_window.exiftool_service.read_metadata(image.filepath)
-                                composite_gps = file_metadata.get('Composite:GPSDateTime')
-                                if composite_gps:
-                                    self.main_window.exiftool_service.write_metadata(
-                                        [image.filepath],
-                                        {'XMP-exif:GPSDateTime': composite_gps}
-                                    )
-                            except Exception:
-                                pass  # Silently ignore if composite read/write fails
-                        
-                        # Update the image model
-                        setattr(image, field_name, dt)
-                        
-                        # If we auto-set Created Date from Taken Date, update the model
-                        if col == 1 and not image.created_date:
-                            image.created_date = dt
-                            # Update the Created Date column in the table
-                            created_date_item = self.main_window.table.item(row, 12)
-                            if created_date_item:
-                                self.main_window.table.blockSignals(True)
-                                created_date_item.setText(display_format)
-                                self.main_window.table.blockSignals(False)
-                        
-                        if not image.metadata:
-                            image.metadata = {}
-                        for tag, value in metadata.items():
-                            image.metadata[tag] = value
-                        self.main_window.statusBar().showMessage(f"Updated {field_name.replace('_', ' ')} for {image.filename}")
-                    except Exception as e:
-                        self.main_window.statusBar().showMessage(f"Error updating {field_name}: {e}")
+            
+            elif col == 12:  # Created Date
+                field_name = 'created_date'
+                metadata['EXIF:CreateDate'] = exif_format
+                # Concatenate timezone offset to XMP tag
+                xmp_format = exif_format + tz_offset if tz_offset else exif_format
+                metadata['XMP-exif:DateTimeDigitized'] = xmp_format
+            elif col == 9:  # GPS Date
+                field_name = 'gps_date'
+                # GPS Date is always in UTC - user enters UTC time directly
+                # Split into date and time for GPS tags
+                gps_date = format_exif_date(dt)
+                gps_time = format_exif_time(dt)
+                metadata['EXIF:GPSDateStamp'] = gps_date
+                metadata['EXIF:GPSTimeStamp'] = gps_time
+                # XMP copy of the GPS stamps, formatted like ExifTool's Composite:GPSDateTime
+                metadata['XMP-exif:GPSDateTime'] = format_exif_datetime(dt) + 'Z'
+            
+            if metadata:
+                try:
+                    self.main_window.flush_pending_writes()
+                    self.main_window.exiftool_service.write_metadata([image.filepath], metadata)
+                    
+                    # Update the image model
+                    setattr(image, field_name, dt)
+                    
+                    # If we auto-set Created Date from Taken Date, update the model
+                    if col == 1 and not image.created_date:
+                        image.created_date = dt
+                    
+                    # Update the date columns in the table
+                    self.main_window.table_model.refresh_row(row)
+                    
+                    if not image.metadata:
+                        image.metadata = {}
+                    for tag, value in metadata.items():
+                        image.metadata[tag] = value
+                    self.main_window.statusBar().showMessage(f"Updated {field_name.replace('_', ' ')} for {image.filename}")
+                except Exception as e:
+                    self.main_window.statusBar().showMessage(f"Error updating {field_name}: {e}")
 
 
 class TZOffsetDelegate(QStyledItemDelegate):
@@ -789,11 +770,7 @@ class TZOffsetDelegate(QStyledItemDelegate):
         
         # Get the image for this row to use its taken_date for offset calculation
         row = index.row()
-        filename_item = self.main_window.table.item(row, 0)
-        if not filename_item:
-            return
-        
-        image = filename_item.data(Qt.ItemDataRole.UserRole)
+        image = index.data(Qt.ItemDataRole.UserRole)
         if not image:
             return
         
@@ -802,16 +779,9 @@ class TZOffsetDelegate(QStyledItemDelegate):
         offset_str = self._calculate_offset(timezone_id, reference_date)
         
         if offset_str:
-            # Convert "+HH:MM" to decimal hours for EXIF:TimeZoneOffset
-            try:
-                # Parse "+05:00" or "-04:30" format
-                sign = 1 if offset_str[0] == '+' else -1
-                hours = int(offset_str[1:3])
-                minutes = int(offset_str[4:6])
-                # TimeZoneOffset is in hours (can be fractional)
-                tz_offset_hours = sign * (hours + minutes / 60.0)
-            except (ValueError, IndexError):
-                tz_offset_hours = 0
+            # Convert "+HH:MM" to decimal hours for EXIF:TimeZoneOffset (can be fractional)
+            utc_offset = parse_tz_offset(offset_str)
+            tz_offset_hours = utc_offset.total_seconds() / 3600 if utc_offset is not None else 0
             
             # Write to multiple EXIF tags
             metadata = {
@@ -823,7 +793,7 @@ class TZOffsetDelegate(QStyledItemDelegate):
             
             # Update XMP date tags to include the new timezone offset
             if image.taken_date:
-                taken_date_str = image.taken_date.strftime('%Y:%m:%d %H:%M:%S')
+                taken_date_str = format_exif_datetime(image.taken_date)
                 metadata['XMP-exif:DateTimeOriginal'] = taken_date_str + offset_str
                 
                 # Recalculate GPS Date in UTC based on Taken Date and new offset
@@ -831,33 +801,23 @@ class TZOffsetDelegate(QStyledItemDelegate):
                     # Convert Taken Date (local time) to UTC
                     gps_utc = self._convert_to_utc(image.taken_date, offset_str)
                     if gps_utc:
-                        gps_date_str = gps_utc.strftime('%Y:%m:%d')
-                        gps_time_str = gps_utc.strftime('%H:%M:%S')
+                        gps_date_str = format_exif_date(gps_utc)
+                        gps_time_str = format_exif_time(gps_utc)
                         metadata['EXIF:GPSDateStamp'] = gps_date_str
                         metadata['EXIF:GPSTimeStamp'] = gps_time_str
+                        # XMP copy of the GPS stamps, formatted like ExifTool's Composite:GPSDateTime
+                        metadata['XMP-exif:GPSDateTime'] = format_exif_datetime(gps_utc) + 'Z'
                         # Update image model
                         image.gps_date = gps_utc
             
             if image.created_date:
-                created_date_str = image.created_date.strftime('%Y:%m:%d %H:%M:%S')
+                created_date_str = format_exif_datetime(image.created_date)
                 metadata['XMP-exif:DateTimeDigitized'] = created_date_str + offset_str
             
             try:
+                self.main_window.flush_pending_writes()
                 self.main_window.exiftool_service.write_metadata([image.filepath], metadata)
                 
-                # If GPS Date was recalculated, read Composite:GPSDateTime and write to XMP-exif:GPSDateTime
-                if image.gps_date and image.taken_date:
-                    try:
-                        file_metadata = self.main_window.exiftool_service.read_metadata(image.filepath)
-                        composite_gps = file_metadata.get('Composite:GPSDateTime')
-                        if composite_gps:
-                            self.main_window.exiftool_service.write_metadata(
-                                [image.filepath],
-                                {'XMP-exif:GPSDateTime': composite_gps}
-                            )
-                    except Exception:
-                        pass  # Silently ignore if composite read/write fails
-                
                 # Update the image model
                 image.tz_offset = offset_str
                 if not image.metadata:
@@ -869,23 +829,8 @@ class TZOffsetDelegate(QStyledItemDelegate):
                 if image.created_date:
                     image.metadata['XMP-exif:DateTimeDigitized'] = created_date_str + offset_str
                 
-                # Update the table cells
-                self.main_window.table.blockSignals(True)
-                
-                # Update TZ Offset column
-                col = index.column()
-                tz_offset_item = self.main_window.table.item(row, col)
-                if tz_offset_item:
-                    tz_offset_item.setText(offset_str)
-                
-                # Update GPS Date column if it was recalculated
-                if image.gps_date and image.taken_date:
-                    gps_date_item = self.main_window.table.item(row, 9)
-                    if gps_date_item:
-                        from ..core.utils import format_date
-                        gps_date_item.setText(format_date(image.gps_date) if image.gps_date else "")
-                
-                self.main_window.table.blockSignals(False)
+                # Update the table cells (TZ Offset and recalculated GPS Date)
+                self.main_window.table_model.refresh_row(row)
                 
                 self.main_window.statusBar().showMessage(f"Updated TZ Offset for {image.filename}")
             except Exception as e:
@@ -926,17 +871,13 @@ class TZOffsetDelegate(QStyledItemDelegate):
         Returns:
             UTC datetime, or None if conversion fails
         """
+        utc_offset = parse_tz_offset(offset_str)
+        if utc_offset is None:
+            return None
+        
+        # Convert to UTC by subtracting the offset
         try:
-            # Parse offset string
-            sign = 1 if offset_str[0] == '+' else -1
-            hours = int(offset_str[1:3])
-            minutes = int(offset_str[4:6])
-            offset_seconds = sign * (hours * 3600 + minutes * 60)
-            
-            # Convert to UTC by subtracting the offset
-            from datetime import timedelta
-            utc_dt = local_dt - timedelta(seconds=offset_seconds)
-            return utc_dt
-        except Exception:
+            return local_dt - utc_offset
+        except OverflowError:
             return None
 